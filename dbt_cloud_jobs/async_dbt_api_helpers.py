@@ -0,0 +1,319 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Tuple, Union
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "Sending requests from an asyncio event loop requires httpx, install it with `pip install dbt-cloud-jobs[async]`."
+    ) from e
+
+from dbt_cloud_jobs.dbt_api_helpers import (
+    ApiCall,
+    ApiRequest,
+    ApiSteps,
+    ListJobs,
+    T,
+    call_dbt_cloud_api_steps,
+    create_and_get_dbt_cloud_job_steps,
+    delete_dbt_cloud_job_steps,
+    get_dbt_cloud_api_base_url,
+    get_dbt_cloud_api_connection_error,
+    get_dbt_cloud_api_headers,
+    get_dbt_cloud_job_page_offsets,
+    get_dbt_cloud_job_page_params,
+    get_request_timeout,
+    handle_dbt_cloud_api_response,
+)
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.retry import get_token_bucket
+from dbt_cloud_jobs.settings import get_api_settings
+from dbt_cloud_jobs.sync_job import raise_for_failed_job_actions
+from dbt_cloud_jobs.validator import DbtCloudJobDefinition, DbtCloudJobDefinitionsFile
+
+
+class AsyncDbtCloudClient:
+    """
+    An asyncio client for the dbt Cloud API built on `httpx`, with at most `max_concurrency`
+    requests in flight. Operations are the steps of the blocking functions of `dbt_api_helpers`,
+    so requests are rate limited, retried and recorded in `metrics.get_api_metrics()` the same way.
+
+    The client must be created from within the event loop it is used in, close it with
+    `async with` or `aclose()`.
+
+    Args:
+        max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 4.
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        settings = get_api_settings()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.client = httpx.AsyncClient(
+            headers={
+                "Accept-Encoding": "gzip, deflate" if settings.gzip else "identity",
+                "Connection": "keep-alive" if settings.keep_alive else "close",
+            },
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=settings.pool_size if settings.keep_alive else 0,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncDbtCloudClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close every connection kept open by the client.
+        """
+
+        await self.client.aclose()
+
+    async def call(
+        self,
+        method: Literal["delete", "get", "post"],
+        endpoint: str,
+        params: Optional[Mapping[str, Union[float, int, str]]] = None,
+        payload: Optional[Mapping[str, Union[float, int, str]]] = None,
+        retry: bool = True,
+    ) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
+        """
+        Async version of `dbt_api_helpers.call_dbt_cloud_api`.
+        """
+
+        return await self.run(
+            call_dbt_cloud_api_steps(
+                method=method, endpoint=endpoint, params=params, payload=payload, retry=retry
+            )
+        )
+
+    async def create_and_get_dbt_cloud_job(
+        self, definition: DbtCloudJobDefinition
+    ) -> DbtCloudJobDefinition:
+        """
+        Async version of `dbt_api_helpers.create_and_get_dbt_cloud_job`.
+        """
+
+        return await self.run(create_and_get_dbt_cloud_job_steps(definition=definition))
+
+    async def create_dbt_cloud_job(self, definition: DbtCloudJobDefinition) -> int:
+        """
+        Async version of `dbt_api_helpers.create_dbt_cloud_job`.
+        """
+
+        return (await self.create_and_get_dbt_cloud_job(definition=definition))["id"]
+
+    async def delete(
+        self, endpoint: str, retry: bool = True
+    ) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
+        """
+        Send a DELETE request, see `call`.
+        """
+
+        return await self.call(method="delete", endpoint=endpoint, retry=retry)
+
+    async def delete_dbt_cloud_job(self, definition: DbtCloudJobDefinition) -> None:
+        """
+        Async version of `dbt_api_helpers.delete_dbt_cloud_job`.
+        """
+
+        await self.run(delete_dbt_cloud_job_steps(definition=definition))
+
+    async def get(
+        self, endpoint: str, params: Optional[Mapping[str, Union[float, int, str]]] = None
+    ) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
+        """
+        Send a GET request, see `call`.
+        """
+
+        return await self.call(method="get", endpoint=endpoint, params=params)
+
+    async def list_dbt_cloud_jobs(
+        self, account_id: int, project_id: int, limit: int = 100
+    ) -> DbtCloudJobDefinitionsFile:
+        """
+        Async version of `dbt_api_helpers.list_dbt_cloud_jobs`, the pages following the first page
+        are requested concurrently.
+
+        Returns:
+            DbtCloudJobDefinitionsFile: Jobs ordered by offset, i.e. in the order returned by dbt Cloud.
+        """
+
+        async def get_page(offset: int) -> Dict[Any, Any]:
+            return await self.get(  # type: ignore[return-value]
+                endpoint=f"accounts/{account_id}/jobs/",
+                params=get_dbt_cloud_job_page_params(
+                    project_id=project_id, limit=limit, offset=offset
+                ),
+            )
+
+        logger.info(f"Listing dbt Cloud jobs for account id {account_id}...")
+        first_page = await get_page(offset=0)
+        jobs: List[DbtCloudJobDefinition] = list(first_page["data"])
+
+        offsets = get_dbt_cloud_job_page_offsets(first_page, jobs)  # type: ignore[arg-type]
+        if offsets is not None:
+            pages = await asyncio.gather(*(get_page(offset=offset) for offset in offsets))
+            jobs += [job for page in pages for job in page["data"]]
+        else:
+            # No pagination metadata, fall back to requesting pages until an empty page is returned
+            page_data = jobs
+            while page_data:
+                page_data = (await get_page(offset=len(jobs)))["data"]
+                jobs += page_data
+
+        logger.info(f"Found {len(jobs)} jobs...")
+
+        return jobs  # type: ignore[return-value]
+
+    async def post(
+        self,
+        endpoint: str,
+        payload: Optional[Mapping[str, Union[float, int, str]]] = None,
+        retry: bool = True,
+    ) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
+        """
+        Send a POST request, see `call`. Only pass `retry=False` for requests that are not idempotent.
+        """
+
+        return await self.call(method="post", endpoint=endpoint, payload=payload, retry=retry)
+
+    async def run(self, steps: ApiSteps[T]) -> T:
+        """
+        Run the steps of an operation on the dbt Cloud API, see `dbt_api_helpers.run_api_steps`.
+
+        Returns:
+            T: The result of the operation.
+        """
+
+        result: Any = None
+        error: Optional[Exception] = None
+        while True:
+            try:
+                step = steps.send(result) if error is None else steps.throw(error)
+            except StopIteration as e:
+                return e.value
+
+            result, error = None, None
+            try:
+                if isinstance(step, ApiCall):
+                    result = await self.call(**step._asdict())
+                elif isinstance(step, ApiRequest):
+                    result = await self.send(**step._asdict())
+                elif isinstance(step, ListJobs):
+                    result = await self.list_dbt_cloud_jobs(**step._asdict())
+                else:
+                    await asyncio.sleep(step.seconds)
+            except Exception as e:
+                error = e
+
+    async def send(
+        self,
+        method: Literal["delete", "get", "post"],
+        endpoint: str,
+        params: Optional[Mapping[str, Union[float, int, str]]] = None,
+        payload: Optional[Mapping[str, Union[float, int, str]]] = None,
+    ) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
+        """
+        Async version of `dbt_api_helpers.send_dbt_cloud_api_request`, waiting for one of the
+        requests in flight to complete when `max_concurrency` requests are in flight.
+
+        Raises:
+            DbtCloudJobsRetryableApiError: For a 429, a 5xx or a connection error.
+            DbtCloudJobsApiError: For any other unsuccessful response.
+
+        Returns:
+            Union[DbtCloudJobDefinition, Dict[Any, object]]
+        """
+
+        requests_per_second = get_api_settings().requests_per_second
+        if requests_per_second is not None:
+            await asyncio.sleep(get_token_bucket(requests_per_second).reserve())
+
+        async with self.semaphore:
+            connect_timeout, read_timeout = get_request_timeout()
+            start = time.perf_counter()
+            try:
+                r = await self.client.request(
+                    method=method.upper(),
+                    url=f"{get_dbt_cloud_api_base_url()}/api/v2/{endpoint}",
+                    headers=get_dbt_cloud_api_headers(),
+                    params=params,
+                    json=payload,
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+                )
+            except httpx.TransportError as e:
+                raise get_dbt_cloud_api_connection_error(
+                    method=method, endpoint=endpoint, error=e, seconds=time.perf_counter() - start
+                ) from e
+
+        return handle_dbt_cloud_api_response(
+            method=method,
+            endpoint=endpoint,
+            status_code=r.status_code,
+            headers=r.headers,
+            content=r.content,
+            reason=r.reason_phrase,
+            url=str(r.url),
+            seconds=time.perf_counter() - start,
+            bytes_sent=len(r.request.content),
+        )
+
+
+async def run_job_steps_async(
+    steps: Iterable[Tuple[str, ApiSteps[None]]], client: AsyncDbtCloudClient, operation: str
+) -> None:
+    """
+    Run the steps of independent actions (e.g. `sync_job.sync_dbt_cloud_job_steps`) concurrently
+    on an event loop, see `sync_job.run_job_actions`.
+
+    Args:
+        steps (Iterable[Tuple[str, ApiSteps[None]]]): Pairs of job name and steps of the action to run.
+        client (AsyncDbtCloudClient): Client sending the requests, caps the number of requests in flight.
+        operation (str): Name of the operation, used in log messages.
+
+    Raises:
+        DbtCloudJobsSyncError: When at least one action raised an exception.
+    """
+
+    steps = list(steps)
+    results = await asyncio.gather(*(client.run(x) for _, x in steps), return_exceptions=True)
+
+    failures: List[Tuple[str, BaseException]] = []
+    for (name, _), result in zip(steps, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to {operation} job `{name}`: {result}")
+            failures.append((name, result))
+
+    raise_for_failed_job_actions(failures=failures, action_count=len(steps), operation=operation)
+
+
+def run_job_steps(
+    steps: Iterable[Tuple[str, ApiSteps[None]]], max_workers: int, operation: str
+) -> None:
+    """
+    Run the steps of independent actions from an asyncio event loop, with at most `max_workers`
+    requests in flight. Drop-in replacement of `sync_job.run_job_steps`.
+
+    Args:
+        steps (Iterable[Tuple[str, ApiSteps[None]]]): Pairs of job name and steps of the action to run.
+        max_workers (int): Maximum number of requests in flight.
+        operation (str): Name of the operation, used in log messages.
+
+    Raises:
+        DbtCloudJobsSyncError: When at least one action raised an exception.
+    """
+
+    steps = list(steps)
+    if not steps:
+        return
+
+    async def run() -> None:
+        async with AsyncDbtCloudClient(max_concurrency=max_workers) as client:
+            await run_job_steps_async(steps=steps, client=client, operation=operation)
+
+    asyncio.run(run())
@@ -0,0 +1,224 @@
+import datetime
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from dbt_cloud_jobs.dbt_api_helpers import (
+    call_dbt_cloud_api,
+    get_dbt_cloud_api_base_url,
+    get_total_count,
+    list_dbt_cloud_jobs,
+)
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.validator import DbtCloudJobDefinition, DbtCloudJobDefinitionsFile
+
+CACHE_FORMAT_VERSION = 1
+
+
+class JobListingCache:
+    """
+    An on-disk cache of the dbt Cloud jobs in a project, one file per (region, account, project).
+
+    A cached listing is used as is while younger than `ttl_seconds`. Older listings are revalidated
+    by requesting the most recently updated job: when nothing changed the cached listing is used,
+    otherwise only the jobs updated since the listing was cached are requested.
+
+    Args:
+        cache_dir (Path): Directory where cached listings are stored, created if it does not exist.
+        ttl_seconds (float, optional): Seconds a listing is used without revalidation. Defaults to 0.
+        max_age_seconds (float, optional): Cached listings older than this are evicted. Defaults to 7 days.
+        max_size_bytes (int, optional): The oldest listings are evicted once the cache exceeds this size. Defaults to 100MB.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_seconds: float = 0,
+        max_age_seconds: float = 7 * 24 * 60 * 60,
+        max_size_bytes: int = 100 * 1024 * 1024,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_size_bytes = max_size_bytes
+
+    def evict(self) -> None:
+        """
+        Remove cached listings older than `max_age_seconds`, then the oldest listings until the
+        cache is smaller than `max_size_bytes`.
+        """
+
+        if not self.cache_dir.exists():
+            return
+
+        now = time.time()
+        entries = []
+        for path in self.cache_dir.glob("jobs_*.json"):
+            stat = path.stat()
+            if now - stat.st_mtime > self.max_age_seconds:
+                logger.debug("Evicting expired cache entry %s", path)
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            logger.debug("Evicting cache entry %s to reduce cache size", path)
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def get_path(self, account_id: int, project_id: int) -> Path:
+        region = urlparse(get_dbt_cloud_api_base_url()).netloc.replace(":", "_")
+        return self.cache_dir / f"jobs_{region}_{account_id}_{project_id}.json"
+
+    def list_dbt_cloud_jobs(self, account_id: int, project_id: int) -> DbtCloudJobDefinitionsFile:
+        """
+        Get a list of all existing dbt Cloud jobs, from the cache when it is still fresh.
+
+        Returns:
+            DbtCloudJobDefinitionsFile
+        """
+
+        path = self.get_path(account_id=account_id, project_id=project_id)
+        entry = self.load(path)
+        if entry is None:
+            logger.info(f"No cached listing of project {project_id}, listing all jobs...")
+            jobs = list_dbt_cloud_jobs(account_id=account_id, project_id=project_id)
+        elif time.time() - entry["fetched_at"] < self.ttl_seconds:
+            logger.info(f"Using cached listing of project {project_id}, within TTL.")
+            return entry["jobs"]
+        else:
+            try:
+                jobs = revalidate_job_listing(
+                    account_id=account_id, project_id=project_id, cached_jobs=entry["jobs"]
+                )
+            except ValueError as e:
+                logger.warning(f"Failed to revalidate cached listing ({e}), listing all jobs...")
+                jobs = list_dbt_cloud_jobs(account_id=account_id, project_id=project_id)
+
+        self.store(path=path, jobs=jobs)
+        return jobs
+
+    def load(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with Path.open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("version") != CACHE_FORMAT_VERSION:
+            return None
+
+        return entry
+
+    def store(self, path: Path, jobs: DbtCloudJobDefinitionsFile) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so concurrent runs never read a partially written file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.cache_dir, delete=False, suffix=".tmp"
+        ) as f:
+            json.dump(
+                {"fetched_at": time.time(), "jobs": jobs, "version": CACHE_FORMAT_VERSION}, f
+            )
+        os.replace(f.name, path)
+
+        self.evict()
+
+
+def get_latest_updated_at(jobs: List[DbtCloudJobDefinition]) -> Optional[datetime.datetime]:
+    return max(
+        (parse_updated_at(x.get("updated_at")) for x in jobs if x.get("updated_at")),
+        default=None,
+    )
+
+
+def list_jobs_updated_since(
+    account_id: int, project_id: int, updated_since: Optional[datetime.datetime], limit: int = 100
+) -> Tuple[Optional[int], List[DbtCloudJobDefinition]]:
+    """
+    Request jobs from the most recently updated one, stopping at the first job not updated since `updated_since`.
+
+    Returns:
+        Tuple[Optional[int], List[DbtCloudJobDefinition]]: Total number of jobs in the project and the updated jobs.
+    """
+
+    total_count = None
+    updated_jobs: List[DbtCloudJobDefinition] = []
+    offset = 0
+    # Most listings are unchanged, so the first request only asks for the most recently updated job
+    page_limit = 1
+    while True:
+        page = call_dbt_cloud_api(
+            method="get",
+            endpoint=f"accounts/{account_id}/jobs/",
+            params={
+                "limit": page_limit,
+                "offset": offset,
+                "order_by": "-updated_at",
+                "project_id": project_id,
+            },
+        )
+        if total_count is None:
+            total_count = get_total_count(page)  # type: ignore[arg-type]
+
+        page_jobs: List[DbtCloudJobDefinition] = page["data"]  # type: ignore[assignment, index]
+        for job in page_jobs:
+            if (
+                updated_since is not None
+                and parse_updated_at(job.get("updated_at")) <= updated_since
+            ):
+                return total_count, updated_jobs
+            updated_jobs.append(job)
+
+        if len(page_jobs) < page_limit:
+            return total_count, updated_jobs
+        offset += page_limit
+        page_limit = limit
+
+
+def parse_updated_at(value: Optional[str]) -> datetime.datetime:
+    if not value:
+        return datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=datetime.timezone.utc)
+
+
+def revalidate_job_listing(
+    account_id: int, project_id: int, cached_jobs: DbtCloudJobDefinitionsFile
+) -> DbtCloudJobDefinitionsFile:
+    """
+    Bring a cached listing up to date, requesting only the jobs updated since it was cached.
+
+    Deleted jobs cannot be detected from updated jobs alone, so when the number of jobs in the
+    refreshed listing does not match the number reported by dbt Cloud all jobs are listed again.
+
+    Returns:
+        DbtCloudJobDefinitionsFile
+    """
+
+    total_count, updated_jobs = list_jobs_updated_since(
+        account_id=account_id,
+        project_id=project_id,
+        updated_since=get_latest_updated_at(cached_jobs),  # type: ignore[arg-type]
+    )
+
+    jobs_by_id = {x["id"]: x for x in cached_jobs}
+    for job in updated_jobs:
+        jobs_by_id[job["id"]] = job
+
+    if total_count is None or len(jobs_by_id) != total_count:
+        logger.info(f"Cached listing of project {project_id} is stale, listing all jobs...")
+        return list_dbt_cloud_jobs(account_id=account_id, project_id=project_id)
+
+    logger.info(
+        f"Using cached listing of project {project_id}, {len(updated_jobs)} job(s) updated since it was cached."
+    )
+    return sorted(jobs_by_id.values(), key=lambda x: x["id"])  # type: ignore[return-value]
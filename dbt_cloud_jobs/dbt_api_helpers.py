@@ -1,15 +1,95 @@
+import json
 import os
+import time
 from functools import lru_cache
-from typing import Any, Dict, Literal, Mapping, Optional, Union
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import requests
-from requests import HTTPError
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
-from requests.structures import CaseInsensitiveDict
 
+from dbt_cloud_jobs.exceptions import (
+    DbtCloudJobsApiError,
+    DbtCloudJobsDeadlineExceededError,
+    DbtCloudJobsRetryableApiError,
+)
 from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.metrics import get_api_metrics
+from dbt_cloud_jobs.retry import (
+    RETRYABLE_STATUS_CODES,
+    get_backoff_seconds,
+    get_token_bucket,
+    parse_retry_after,
+)
+from dbt_cloud_jobs.settings import get_api_settings
+from dbt_cloud_jobs.utils import map_concurrently
 from dbt_cloud_jobs.validator import DbtCloudJobDefinition, DbtCloudJobDefinitionsFile
 
+# Time at which the current run started, used to enforce `DbtCloudApiSettings.deadline_seconds`
+run_started_at: Optional[float] = None
+
+T = TypeVar("T")
+
+
+class ApiCall(NamedTuple):
+    """
+    A step sending a request to the dbt Cloud API, retried as described in `call_dbt_cloud_api`.
+    """
+
+    method: Literal["delete", "get", "post"]
+    endpoint: str
+    params: Optional[Mapping[str, Union[float, int, str]]] = None
+    payload: Optional[Mapping[str, Union[float, int, str]]] = None
+    retry: bool = True
+
+
+class ApiRequest(NamedTuple):
+    """
+    A step sending a single request to the dbt Cloud API, see `send_dbt_cloud_api_request`.
+    """
+
+    method: Literal["delete", "get", "post"]
+    endpoint: str
+    params: Optional[Mapping[str, Union[float, int, str]]] = None
+    payload: Optional[Mapping[str, Union[float, int, str]]] = None
+
+
+class ListJobs(NamedTuple):
+    """
+    A step listing the existing dbt Cloud jobs of a project, see `list_dbt_cloud_jobs`.
+    """
+
+    account_id: int
+    project_id: int
+
+
+class Sleep(NamedTuple):
+    """
+    A step waiting before the next step, e.g. before retrying a failed request.
+    """
+
+    seconds: float
+
+
+# Operations on the dbt Cloud API are written once as generators of steps, the result of every
+# step (or the exception it raised) is sent back into the generator. `run_api_steps` runs the
+# steps from the current thread, `AsyncDbtCloudClient.run` from an asyncio event loop.
+ApiStep = Union[ApiCall, ApiRequest, ListJobs, Sleep]
+ApiSteps = Generator[ApiStep, Any, T]
+
 
 class DbtCloudAuth(AuthBase):
     """
@@ -17,13 +97,8 @@ class DbtCloudAuth(AuthBase):
     """
 
     def __call__(self, r: requests.models.PreparedRequest):
-        r.headers = CaseInsensitiveDict(
-            {
-                "Accept": "application/json",
-                "Authorization": f'Token {os.getenv("DBT_API_TOKEN")}',
-                "Content-Type": "application/json",
-            }
-        )
+        # Update rather than replace the headers to keep those set by the session (e.g. compression)
+        r.headers.update(get_dbt_cloud_api_headers())
         return r
 
 
@@ -32,93 +107,232 @@ def call_dbt_cloud_api(
     endpoint: str,
     params: Optional[Mapping[str, Union[float, int, str]]] = None,
     payload: Optional[Mapping[str, Union[float, int, str]]] = None,
+    retry: bool = True,
 ) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
     """
     A helper function for calling the dbt Cloud API.
 
+    Requests that fail with a 429, a 5xx or a connection error are retried with exponential
+    backoff and jitter, honouring any `Retry-After` header sent by dbt Cloud.
+
     Args:
-        method (str): _description_
-        endpoint (str): _description_
-        params (Optional[Mapping[str, Union[int, str]]], optional): _description_. Defaults to None.
-        payload (Optional[Mapping[str, Union[int, str]]], optional): _description_. Defaults to None.
+        method (str): HTTP method to use.
+        endpoint (str): Endpoint to call, relative to `/api/v2/`.
+        params (Optional[Mapping[str, Union[int, str]]], optional): Query parameters. Defaults to None.
+        payload (Optional[Mapping[str, Union[int, str]]], optional): JSON body. Defaults to None.
+        retry (bool, optional): Retry requests that failed in a way that can be retried. Only pass
+            False for requests that are not idempotent. Defaults to True.
 
     Raises:
-        RuntimeError
+        DbtCloudJobsApiError: For an unsuccessful response that cannot be retried.
+        DbtCloudJobsRetryableApiError: When all retries are exhausted.
 
     Returns:
         Union[DbtCloudJobDefinition, Dict[Any, object]]
     """
 
-    base_url = f"{get_dbt_cloud_api_base_url()}/api/v2/"
-    if method == "get":
-        r = create_requests_session().get(
-            auth=DbtCloudAuth(),
-            params=params,
-            url=f"{base_url}{endpoint}",
-        )
-    elif method == "post":
-        r = create_requests_session().post(
-            auth=DbtCloudAuth(),
-            json=payload,
-            url=f"{base_url}{endpoint}",
-        )
-    elif method == "delete":
-        r = create_requests_session().delete(
-            auth=DbtCloudAuth(),
-            url=f"{base_url}{endpoint}",
+    return run_api_steps(
+        call_dbt_cloud_api_steps(
+            method=method, endpoint=endpoint, params=params, payload=payload, retry=retry
         )
+    )
 
-    try:
-        r.raise_for_status()
-    except HTTPError as e:
-        logger.error(f"{r.status_code=}")
-        logger.error(f"{r.content=}")
-        raise RuntimeError(e)
 
-    return r.json()
+def call_dbt_cloud_api_steps(
+    method: Literal["delete", "get", "post"],
+    endpoint: str,
+    params: Optional[Mapping[str, Union[float, int, str]]] = None,
+    payload: Optional[Mapping[str, Union[float, int, str]]] = None,
+    retry: bool = True,
+) -> ApiSteps[Union[DbtCloudJobDefinition, Dict[Any, object]]]:
+    """
+    Steps of `call_dbt_cloud_api`.
+    """
 
+    max_retries = get_api_settings().max_retries if retry else 0
+    attempt = 0
+    while True:
+        try:
+            return (
+                yield ApiRequest(method=method, endpoint=endpoint, params=params, payload=payload)
+            )
+        except DbtCloudJobsRetryableApiError as e:
+            if attempt >= max_retries:
+                raise
 
-def create_dbt_cloud_job(
+            attempt += 1
+            yield Sleep(
+                get_retry_wait_seconds(error=e, attempt=attempt, method=method, endpoint=endpoint)
+            )
+
+
+def check_backoff_within_deadline(backoff_seconds: float, error: Exception) -> None:
+    """
+    Fail fast instead of waiting to retry a request when the wait would exceed the deadline of the run.
+
+    Raises:
+        DbtCloudJobsDeadlineExceededError
+    """
+
+    remaining_seconds = get_remaining_seconds()
+    if remaining_seconds is not None and backoff_seconds >= remaining_seconds:
+        raise DbtCloudJobsDeadlineExceededError(
+            f"{error} Not retrying as the deadline of this run would be exceeded."
+        ) from error
+
+
+def create_and_get_dbt_cloud_job(
     definition: DbtCloudJobDefinition,
-) -> int:
+) -> DbtCloudJobDefinition:
+    """
+    Create a new dbt Cloud job.
+
+    Creating a job is not idempotent. A request rejected with a 429 was not applied and is sent
+    again, after any other failure the request is only sent again after checking that the job was
+    not created despite the error. The definition is not modified.
+
+    Returns:
+        DbtCloudJobDefinition: The new job as returned by dbt Cloud, i.e. with its id, timestamps
+            and every field set by dbt Cloud.
+    """
+
+    return run_api_steps(create_and_get_dbt_cloud_job_steps(definition=definition))
+
+
+def create_and_get_dbt_cloud_job_steps(
+    definition: DbtCloudJobDefinition,
+) -> ApiSteps[DbtCloudJobDefinition]:
+    """
+    Steps of `create_and_get_dbt_cloud_job`.
+    """
+
     # New jobs require an "id" key in the payload, even though the value of this key does not yet exist
-    definition["id"] = None
-
-    logger.debug(f"{definition=}")
-    r: DbtCloudJobDefinition = call_dbt_cloud_api(
-        method="post",
-        endpoint=f"accounts/{definition['account_id']}/jobs/",
-        payload=definition,
-    )[
-        "data"
-    ]  # type: ignore[assignment]
+    payload = {**definition, "id": None}
+
+    logger.debug("payload=%r", payload)
+    endpoint = f"accounts/{definition['account_id']}/jobs/"
+    attempt = 0
+    while True:
+        try:
+            r: DbtCloudJobDefinition = (
+                yield ApiCall(method="post", endpoint=endpoint, payload=payload, retry=False)
+            )["data"]
+            break
+        except DbtCloudJobsRetryableApiError as e:
+            if attempt >= get_api_settings().max_retries:
+                raise
+
+            attempt += 1
+            if e.status_code == 429:
+                yield Sleep(
+                    get_retry_wait_seconds(
+                        error=e, attempt=attempt, method="post", endpoint=endpoint
+                    )
+                )
+                continue
+
+            yield Sleep(
+                get_retry_wait_seconds(
+                    error=e,
+                    attempt=attempt,
+                    method="post",
+                    endpoint=endpoint,
+                    action=f"Checking if job `{definition['name']}` was created",
+                )
+            )
+            existing_jobs = [
+                x
+                for x in (
+                    yield ListJobs(
+                        account_id=definition["account_id"], project_id=definition["project_id"]
+                    )
+                )
+                if x["name"] == definition["name"]
+            ]
+            if existing_jobs:
+                r = existing_jobs[0]
+                logger.warning(
+                    f"Job `{definition['name']}` was created despite the error, will not be created again."
+                )
+                break
+
     logger.info(
         f"Created new dbt Cloud job, URL: https://cloud.getdbt.com/deploy/{definition['account_id']}/projects/{definition['project_id']}/jobs/{r['id']}"
     )
-    return r["id"]
+    return r
+
+
+def create_dbt_cloud_job(
+    definition: DbtCloudJobDefinition,
+) -> int:
+    """
+    Create a new dbt Cloud job, see `create_and_get_dbt_cloud_job`.
+
+    Returns:
+        int: The id of the new job.
+    """
+
+    return create_and_get_dbt_cloud_job(definition=definition)["id"]
 
 
-@lru_cache
 def create_requests_session() -> requests.Session:
     """
-    Create a requests session and cache it to avoid recreating the session.
+    Create a requests session configured by the current settings and cache it to avoid recreating the session.
 
     Returns:
         requests.Session
     """
 
-    logger.info("Creating re-usable requests session...")
-    return requests.Session()
+    settings = get_api_settings()
+    return get_requests_session(
+        gzip=settings.gzip, keep_alive=settings.keep_alive, pool_size=settings.pool_size
+    )
 
 
 def delete_dbt_cloud_job(
     definition: DbtCloudJobDefinition,
 ) -> None:
-    logger.debug(f"{definition=}")
-    call_dbt_cloud_api(
-        method="delete",
-        endpoint=f"accounts/{definition['account_id']}/jobs/{definition['id']}",
-    )
+    """
+    Delete a dbt Cloud job.
+
+    A failed request may have deleted the job despite the error, so a 404 in response to a retried
+    request means the job was deleted.
+    """
+
+    run_api_steps(delete_dbt_cloud_job_steps(definition=definition))
+
+
+def delete_dbt_cloud_job_steps(definition: DbtCloudJobDefinition) -> ApiSteps[None]:
+    """
+    Steps of `delete_dbt_cloud_job`.
+    """
+
+    logger.debug("definition=%r", definition)
+    endpoint = f"accounts/{definition['account_id']}/jobs/{definition['id']}"
+    attempt = 0
+    while True:
+        try:
+            yield ApiCall(method="delete", endpoint=endpoint, retry=False)
+            break
+        except DbtCloudJobsRetryableApiError as e:
+            if attempt >= get_api_settings().max_retries:
+                raise
+
+            attempt += 1
+            yield Sleep(
+                get_retry_wait_seconds(
+                    error=e, attempt=attempt, method="delete", endpoint=endpoint
+                )
+            )
+        except DbtCloudJobsApiError as e:
+            if attempt == 0 or e.status_code != 404:
+                raise
+
+            logger.warning(
+                f"Job `{definition['name']}` (id: {definition['id']}) was deleted despite the error."
+            )
+            break
+
     logger.warning(
         f"Deleted dbt Cloud job `{definition['name']}` (id: {definition['id']}), URL: https://cloud.getdbt.com/deploy/{definition['account_id']}/projects/{definition['project_id']}/jobs/{definition['id']}"
     )
@@ -128,6 +342,9 @@ def delete_dbt_cloud_job(
 def get_dbt_cloud_api_base_url() -> str:
     """Returns the base URL to use for all dbt Cloud API calls.
 
+    The URL of the region can be overridden via the `DBT_CLOUD_JOBS_API_BASE_URL` environment
+    variable, e.g. to send requests to a local fake of the dbt Cloud API.
+
     Raises:
         RuntimeError:
 
@@ -135,7 +352,9 @@ def get_dbt_cloud_api_base_url() -> str:
         str: Base url to use for all dbt Cloud API calls.
     """
 
-    if os.getenv("DBT_CLOUD_REGION") == "US":
+    if os.getenv("DBT_CLOUD_JOBS_API_BASE_URL"):
+        return os.environ["DBT_CLOUD_JOBS_API_BASE_URL"].rstrip("/")
+    elif os.getenv("DBT_CLOUD_REGION") == "US":
         return "https://cloud.getdbt.com"
     elif os.getenv("DBT_CLOUD_REGION") == "Europe":
         return "https://emea.dbt.com"
@@ -145,31 +364,468 @@ def get_dbt_cloud_api_base_url() -> str:
         raise RuntimeError("The env var `DBT_CLOUD_REGION` must be one of: US, Europe, AU")
 
 
-def list_dbt_cloud_jobs(account_id: int, project_id: int) -> DbtCloudJobDefinitionsFile:
+def get_dbt_cloud_api_connection_error(
+    method: Literal["delete", "get", "post"], endpoint: str, error: Exception, seconds: float
+) -> DbtCloudJobsRetryableApiError:
+    """
+    Record a request that failed to connect to dbt Cloud in `metrics.get_api_metrics()`.
+
+    Args:
+        method (str): HTTP method of the request.
+        endpoint (str): Endpoint of the request.
+        error (Exception): Error raised by the HTTP client.
+        seconds (float): Time spent on the request.
+
+    Returns:
+        DbtCloudJobsRetryableApiError: The error to raise.
+    """
+
+    get_api_metrics().record_request(
+        method=method, endpoint=endpoint, status_code=None, seconds=seconds
+    )
+    return DbtCloudJobsRetryableApiError(
+        f"Failed to connect to dbt Cloud ({method.upper()} {endpoint}): {error}."
+    )
+
+
+def get_dbt_cloud_api_headers() -> Dict[str, str]:
+    """
+    Returns the headers sent with every request to the dbt Cloud API, including authentication.
+    """
+
+    return {
+        "Accept": "application/json",
+        "Authorization": f'Token {os.getenv("DBT_API_TOKEN")}',
+        "Content-Type": "application/json",
+    }
+
+
+def get_dbt_cloud_job_page_offsets(
+    first_page: Mapping[str, Any], first_page_data: DbtCloudJobDefinitionsFile
+) -> Optional[range]:
+    """
+    Offsets of the pages following the first page of jobs, so the remaining pages can be requested
+    concurrently.
+
+    Returns:
+        Optional[range]: None if the first page does not contain pagination metadata.
+    """
+
+    total_count = get_total_count(first_page)
+    if total_count is None:
+        return None
+
+    # dbt Cloud may return fewer jobs than requested, use the size of the first page as the step
+    return (
+        range(len(first_page_data), total_count, len(first_page_data))
+        if first_page_data
+        else range(0)
+    )
+
+
+def get_dbt_cloud_job_page_params(project_id: int, limit: int, offset: int) -> Dict[str, Any]:
+    """
+    Returns the query parameters requesting a single page of the dbt Cloud jobs of a project.
+    """
+
+    # Pages are requested concurrently, an explicit order keeps the offsets consistent
+    return {"limit": limit, "offset": offset, "order_by": "id", "project_id": project_id}
+
+
+def get_remaining_seconds() -> Optional[float]:
+    """
+    Number of seconds left before the deadline of the run is exceeded, see `start_run_deadline`.
+
+    Raises:
+        DbtCloudJobsDeadlineExceededError: When the deadline has been exceeded.
+
+    Returns:
+        Optional[float]: None when no deadline is set.
+    """
+
+    global run_started_at
+    deadline_seconds = get_api_settings().deadline_seconds
+    if deadline_seconds is None:
+        return None
+
+    if run_started_at is None:
+        run_started_at = time.monotonic()
+
+    remaining_seconds = run_started_at + deadline_seconds - time.monotonic()
+    if remaining_seconds <= 0:
+        raise DbtCloudJobsDeadlineExceededError(
+            f"The deadline of {deadline_seconds} seconds for this run has been exceeded, dbt Cloud may be unresponsive."
+        )
+
+    return remaining_seconds
+
+
+@lru_cache
+def get_requests_session(gzip: bool, keep_alive: bool, pool_size: int) -> requests.Session:
+    """
+    Create a requests session, one session is shared by every caller using the same configuration.
+
+    Args:
+        gzip (bool): Ask dbt Cloud to compress responses.
+        keep_alive (bool): Re-use connections across requests.
+        pool_size (int): Maximum number of connections kept open for re-use.
+
+    Returns:
+        requests.Session
+    """
+
+    logger.info("Creating re-usable requests session...")
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+    session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+    return session
+
+
+def get_request_timeout() -> Tuple[float, float]:
+    """
+    Returns the (connect, read) timeout of the next request, shortened to fit within the deadline of the run.
+
+    Returns:
+        Tuple[float, float]
     """
-    Get a list of all existing dbt Cloud jobs
+
+    settings = get_api_settings()
+    remaining_seconds = get_remaining_seconds()
+    if remaining_seconds is None:
+        return settings.connect_timeout, settings.read_timeout
+
+    return min(settings.connect_timeout, remaining_seconds), min(
+        settings.read_timeout, remaining_seconds
+    )
+
+
+def get_retry_wait_seconds(
+    error: DbtCloudJobsRetryableApiError,
+    attempt: int,
+    method: Literal["delete", "get", "post"],
+    endpoint: str,
+    action: str = "Retrying",
+) -> float:
+    """
+    Number of seconds to wait before the next attempt of a failed request, using exponential
+    backoff with jitter and honouring any `Retry-After` header sent by dbt Cloud. The retry is
+    recorded in `metrics.get_api_metrics()`.
+
+    Args:
+        error (DbtCloudJobsRetryableApiError): Error of the failed attempt.
+        attempt (int): Number of the next attempt, starting at 1.
+        method (str): HTTP method of the request.
+        endpoint (str): Endpoint of the request.
+        action (str, optional): What happens after waiting, used in the log message. Defaults to "Retrying".
+
+    Raises:
+        DbtCloudJobsDeadlineExceededError: When the wait would exceed the deadline of the run.
+
+    Returns:
+        float
+    """
+
+    settings = get_api_settings()
+    backoff_seconds = get_backoff_seconds(
+        attempt=attempt - 1,
+        base_seconds=settings.retry_backoff_seconds,
+        max_seconds=settings.retry_backoff_max_seconds,
+        retry_after=error.retry_after,
+    )
+    check_backoff_within_deadline(backoff_seconds=backoff_seconds, error=error)
+    get_api_metrics().record_retry(method=method, endpoint=endpoint)
+    logger.warning(
+        f"{error} {action} in {backoff_seconds:.1f} seconds (attempt {attempt} of {settings.max_retries})..."
+    )
+    return backoff_seconds
+
+
+def get_total_count(response: Mapping[str, Any]) -> Optional[int]:
+    """
+    Read the total number of objects from the pagination metadata of a dbt Cloud API response.
+
+    Returns:
+        Optional[int]: None if the response does not contain pagination metadata.
+    """
+
+    try:
+        return int(response["extra"]["pagination"]["total_count"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def handle_dbt_cloud_api_response(
+    method: Literal["delete", "get", "post"],
+    endpoint: str,
+    status_code: int,
+    headers: Mapping[str, str],
+    content: bytes,
+    reason: Optional[str],
+    url: str,
+    seconds: float,
+    bytes_sent: int,
+) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
+    """
+    Record a response of the dbt Cloud API in `metrics.get_api_metrics()` and read its JSON body.
+    Shared by every HTTP client used to call dbt Cloud.
+
+    Args:
+        method (str): HTTP method of the request.
+        endpoint (str): Endpoint of the request.
+        status_code (int): Status code of the response.
+        headers (Mapping[str, str]): Headers of the response.
+        content (bytes): Body of the response.
+        reason (Optional[str]): Reason phrase of the response.
+        url (str): URL of the request.
+        seconds (float): Time spent on the request.
+        bytes_sent (int): Size of the body of the request.
+
+    Raises:
+        DbtCloudJobsRetryableApiError: For a 429 or a 5xx.
+        DbtCloudJobsApiError: For any other unsuccessful response.
+
+    Returns:
+        Union[DbtCloudJobDefinition, Dict[Any, object]]
+    """
+
+    get_api_metrics().record_request(
+        method=method,
+        endpoint=endpoint,
+        status_code=status_code,
+        seconds=seconds,
+        bytes_sent=bytes_sent,
+        bytes_received=len(content),
+    )
+
+    if status_code in RETRYABLE_STATUS_CODES:
+        raise DbtCloudJobsRetryableApiError(
+            f"dbt Cloud responded with status code {status_code} ({method.upper()} {endpoint}).",
+            retry_after=parse_retry_after(headers.get("Retry-After")),
+            status_code=status_code,
+        )
+
+    if status_code >= 400:
+        logger.error(f"{status_code=}")
+        logger.error(f"{content=}")
+        raise DbtCloudJobsApiError(
+            f"{status_code} {'Client' if status_code < 500 else 'Server'} Error: {reason} for url: {url}",
+            status_code=status_code,
+        )
+
+    return json.loads(content)
+
+
+def iter_dbt_cloud_job_pages(
+    account_id: int, project_id: int, limit: int = 100, max_workers: int = 8
+) -> Iterator[DbtCloudJobDefinitionsFile]:
+    """
+    Yield the existing dbt Cloud jobs of a project one page at a time, as pages arrive.
+
+    The first page is requested on its own to read the total number of jobs from the pagination
+    metadata of the response, the remaining pages are then requested concurrently. At most
+    `max_workers` pages are requested ahead of the page being consumed, so memory use does not
+    grow with the number of jobs.
 
     Args:
         account_id (int)
         project_id (int)
+        limit (int, optional): Number of jobs requested per page. Defaults to 100.
+        max_workers (int, optional): Maximum number of pages requested concurrently. Defaults to 8.
+
+    Yields:
+        DbtCloudJobDefinitionsFile: Pages of jobs ordered by id.
+    """
+
+    def get_page(offset: int) -> Dict[Any, Any]:
+        return call_dbt_cloud_api(  # type: ignore[return-value]
+            method="get",
+            endpoint=f"accounts/{account_id}/jobs/",
+            params=get_dbt_cloud_job_page_params(
+                project_id=project_id, limit=limit, offset=offset
+            ),
+        )
+
+    first_page = get_page(offset=0)
+    first_page_data: DbtCloudJobDefinitionsFile = list(first_page["data"])  # type: ignore[assignment]
+    yield first_page_data
+
+    offsets = get_dbt_cloud_job_page_offsets(first_page, first_page_data)
+    if offsets is not None:
+        # Pages are yielded in the order of the offsets, keeping the output stable
+        for page in map_concurrently(get_page, offsets, max_workers=max_workers):
+            yield page["data"]
+    else:
+        # No pagination metadata, fall back to requesting pages until an empty page is returned
+        offset = len(first_page_data)
+        page_data = first_page_data
+        while page_data:
+            page_data = get_page(offset=offset)["data"]
+            offset += len(page_data)
+            if page_data:
+                yield page_data
+
+
+def list_dbt_cloud_jobs(
+    account_id: int, project_id: int, limit: int = 100, max_workers: int = 8
+) -> DbtCloudJobDefinitionsFile:
+    """
+    Get a list of all existing dbt Cloud jobs, see `iter_dbt_cloud_job_pages`.
+
+    Args:
+        account_id (int)
+        project_id (int)
+        limit (int, optional): Number of jobs requested per page. Defaults to 100.
+        max_workers (int, optional): Maximum number of pages requested concurrently. Defaults to 8.
 
     Returns:
-        DbtCloudJobDefinitionsFile
+        DbtCloudJobDefinitionsFile: Jobs ordered by offset, i.e. in the order returned by dbt Cloud.
     """
 
     logger.info(f"Listing dbt Cloud jobs for account id {account_id}...")
+    jobs: DbtCloudJobDefinitionsFile = [
+        job
+        for page in iter_dbt_cloud_job_pages(
+            account_id=account_id, project_id=project_id, limit=limit, max_workers=max_workers
+        )
+        for job in page
+    ]  # type: ignore[assignment]
+    logger.info(f"Found {len(jobs)} jobs...")
+
+    return jobs
+
+
+def list_dbt_cloud_projects(account_id: int, limit: int = 100) -> List[Dict[str, Any]]:
+    """
+    Get a list of all projects in a dbt Cloud account.
+
+    Args:
+        account_id (int)
+        limit (int, optional): Number of projects requested per page. Defaults to 100.
 
-    jobs: DbtCloudJobDefinitionsFile = []  # type: ignore[assignment]
+    Returns:
+        List[Dict[str, Any]]: Projects ordered by offset, i.e. in the order returned by dbt Cloud.
+    """
+
+    logger.info(f"Listing dbt Cloud projects for account id {account_id}...")
+    projects: List[Dict[str, Any]] = []
     while True:
-        jobs_data = call_dbt_cloud_api(
+        page = call_dbt_cloud_api(
             method="get",
-            endpoint=f"accounts/{account_id}/jobs/",
-            params={"offset": len(jobs), "project_id": project_id},
+            endpoint=f"accounts/{account_id}/projects/",
+            params={"limit": limit, "offset": len(projects)},
         )
-        if jobs_data["data"] == []:
+        projects += page["data"]  # type: ignore[arg-type]
+
+        total_count = get_total_count(page)
+        if not page["data"] or (total_count is not None and len(projects) >= total_count):
             break
-        jobs += jobs_data["data"]
 
-    logger.info(f"Found {len(jobs)} jobs...")
+    logger.info(f"Found {len(projects)} projects...")
 
-    return jobs
+    return projects
+
+
+def run_api_steps(steps: ApiSteps[T]) -> T:
+    """
+    Run the steps of an operation on the dbt Cloud API, sending requests from the current thread.
+
+    Returns:
+        T: The result of the operation.
+    """
+
+    result: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            step = steps.send(result) if error is None else steps.throw(error)
+        except StopIteration as e:
+            return e.value
+
+        result, error = None, None
+        try:
+            if isinstance(step, ApiCall):
+                result = call_dbt_cloud_api(**step._asdict())
+            elif isinstance(step, ApiRequest):
+                result = send_dbt_cloud_api_request(**step._asdict())
+            elif isinstance(step, ListJobs):
+                result = list_dbt_cloud_jobs(**step._asdict())
+            else:
+                time.sleep(step.seconds)
+        except Exception as e:
+            error = e
+
+
+def send_dbt_cloud_api_request(
+    method: Literal["delete", "get", "post"],
+    endpoint: str,
+    params: Optional[Mapping[str, Union[float, int, str]]] = None,
+    payload: Optional[Mapping[str, Union[float, int, str]]] = None,
+) -> Union[DbtCloudJobDefinition, Dict[Any, object]]:
+    """
+    Send a single request to the dbt Cloud API, waiting for the client-side rate limit if one is set.
+    Every request is recorded in `metrics.get_api_metrics()`, excluding the wait for the rate limit.
+
+    Raises:
+        DbtCloudJobsRetryableApiError: For a 429, a 5xx or a connection error.
+        DbtCloudJobsApiError: For any other unsuccessful response, see `handle_dbt_cloud_api_response`.
+
+    Returns:
+        Union[DbtCloudJobDefinition, Dict[Any, object]]
+    """
+
+    requests_per_second = get_api_settings().requests_per_second
+    if requests_per_second is not None:
+        get_token_bucket(requests_per_second).acquire()
+
+    base_url = f"{get_dbt_cloud_api_base_url()}/api/v2/"
+    timeout = get_request_timeout()
+    start = time.perf_counter()
+    try:
+        if method == "get":
+            r = create_requests_session().get(
+                auth=DbtCloudAuth(),
+                timeout=timeout,
+                params=params,
+                url=f"{base_url}{endpoint}",
+            )
+        elif method == "post":
+            r = create_requests_session().post(
+                auth=DbtCloudAuth(),
+                timeout=timeout,
+                json=payload,
+                url=f"{base_url}{endpoint}",
+            )
+        elif method == "delete":
+            r = create_requests_session().delete(
+                auth=DbtCloudAuth(),
+                timeout=timeout,
+                url=f"{base_url}{endpoint}",
+            )
+    except (requests.ConnectionError, requests.Timeout) as e:
+        raise get_dbt_cloud_api_connection_error(
+            method=method, endpoint=endpoint, error=e, seconds=time.perf_counter() - start
+        ) from e
+
+    return handle_dbt_cloud_api_response(
+        method=method,
+        endpoint=endpoint,
+        status_code=r.status_code,
+        headers=r.headers,
+        content=r.content,
+        reason=r.reason,
+        url=r.url,
+        seconds=time.perf_counter() - start,
+        bytes_sent=len(r.request.body or b"") if r.request is not None else 0,
+    )
+
+
+def start_run_deadline() -> None:
+    """
+    Start the clock of the deadline of the run, if a deadline is set.
+    """
+
+    global run_started_at
+    run_started_at = time.monotonic()
@@ -0,0 +1,126 @@
+import typing
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from dbt_cloud_jobs.validator import DbtCloudJobDefinition
+
+
+class FieldDiff(BaseModel):
+    """
+    A single field that differs between two job definitions.
+    """
+
+    after: Any = None
+    before: Any = None
+    path: str
+
+
+def canonicalize_job_definition(definition: DbtCloudJobDefinition) -> Dict[str, Any]:
+    """
+    Returns the canonical form of a job definition: fields managed by dbt Cloud and volatile fields
+    are removed and fields declared as sets on `DbtCloudJobDefinition` (e.g. `schedule.date.days`)
+    are sorted. The definition itself is not modified.
+
+    Returns:
+        Dict[str, Any]
+    """
+
+    ignored_fields = get_ignored_fields()
+    return canonicalize_value(
+        {k: v for k, v in definition.items() if k not in ignored_fields}, path=()
+    )
+
+
+def canonicalize_value(value: Any, path: Tuple[str, ...]) -> Any:
+    if isinstance(value, dict):
+        return {k: canonicalize_value(v, path=(*path, k)) for k, v in value.items()}
+
+    if path in get_set_field_paths() and isinstance(value, (frozenset, list, set, tuple)):
+        return sorted(set(value))
+
+    return value
+
+
+def get_field_diffs(
+    before: DbtCloudJobDefinition, after: DbtCloudJobDefinition
+) -> List[FieldDiff]:
+    """
+    Compare the canonical forms of two job definitions.
+
+    Returns:
+        List[FieldDiff]: One entry per differing field, ordered by path. Empty when the definitions are equivalent.
+    """
+
+    field_diffs: List[FieldDiff] = []
+    collect_field_diffs(
+        before=canonicalize_job_definition(before),
+        after=canonicalize_job_definition(after),
+        path=(),
+        field_diffs=field_diffs,
+    )
+    return field_diffs
+
+
+def collect_field_diffs(
+    before: Any, after: Any, path: Tuple[str, ...], field_diffs: List[FieldDiff]
+) -> None:
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key in sorted(before.keys() | after.keys(), key=str):
+            collect_field_diffs(
+                before=before.get(key),
+                after=after.get(key),
+                path=(*path, key),
+                field_diffs=field_diffs,
+            )
+    elif before != after:
+        field_diffs.append(FieldDiff(after=after, before=before, path=".".join(path)))
+
+
+@lru_cache
+def get_ignored_fields() -> FrozenSet[str]:
+    """
+    Returns the fields of `DbtCloudJobDefinition` marked as `managed` or `volatile`.
+    """
+
+    return frozenset(
+        name
+        for name, field in DbtCloudJobDefinition.model_fields.items()
+        if isinstance(field.json_schema_extra, dict)
+        and (field.json_schema_extra.get("managed") or field.json_schema_extra.get("volatile"))
+    )
+
+
+@lru_cache
+def get_set_field_paths() -> FrozenSet[Tuple[str, ...]]:
+    """
+    Returns the paths of all fields declared as sets on `DbtCloudJobDefinition` and its nested models.
+    """
+
+    return frozenset(get_model_set_field_paths(DbtCloudJobDefinition, path=()))
+
+
+def get_model_set_field_paths(
+    model: Type[BaseModel], path: Tuple[str, ...]
+) -> List[Tuple[str, ...]]:
+    paths = []
+    for name, field in model.model_fields.items():
+        for annotation in get_annotation_types(field.annotation):
+            if typing.get_origin(annotation) in (frozenset, set):
+                paths.append((*path, name))
+            elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                paths.extend(get_model_set_field_paths(annotation, path=(*path, name)))
+
+    return paths
+
+
+def get_annotation_types(annotation: Optional[Any]) -> List[Any]:
+    """
+    Returns the members of a `Union` (including `Optional`), or the annotation itself.
+    """
+
+    if typing.get_origin(annotation) is typing.Union:
+        return [x for arg in typing.get_args(annotation) for x in get_annotation_types(arg)]
+
+    return [annotation]
@@ -1,3 +1,33 @@
+from typing import Optional
+
+
+class DbtCloudJobsApiError(RuntimeError):
+    """Exception raised when the dbt Cloud API responded with a status code that cannot be retried,
+    e.g. a 404.
+
+    Args:
+        message (str): Explainer of the error.
+        status_code (int): Status code of the response.
+    """
+
+    def __init__(self, message: str, status_code: int):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(self.message)
+
+
+class DbtCloudJobsDeadlineExceededError(Exception):
+    """Exception raised when a run takes longer than the deadline set via `--deadline`.
+
+    Args:
+        message (str): Explainer of the error.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
 class DbtCloudJobsDuplicateJobNameError(Exception):
     """Exception raised when more than one job defined in a YML file contains the same name.
 
@@ -20,3 +50,49 @@ class DbtCloudJobsInvalidArguments(Exception):
     def __init__(self, message: str):
         self.message = message
         super().__init__(self.message)
+
+
+class DbtCloudJobsSyncError(Exception):
+    """Exception raised when one or more jobs could not be synced to dbt Cloud.
+
+    Args:
+        message (str): Explainer of the error, summarising every failed job.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class DbtCloudJobsValidationError(Exception):
+    """Exception raised when one or more files of job definitions are invalid.
+
+    Args:
+        message (str): Explainer of the error, listing every invalid file and job.
+    """
+
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class DbtCloudJobsRetryableApiError(RuntimeError):
+    """Exception raised when a request to the dbt Cloud API failed in a way that can be retried,
+    i.e. a 429, a 5xx or a connection error.
+
+    Args:
+        message (str): Explainer of the error.
+        retry_after (Optional[float]): Number of seconds dbt Cloud asked to wait before retrying.
+        status_code (Optional[int]): Status code of the response, None for a connection error.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[float] = None,
+        status_code: Optional[int] = None,
+    ):
+        self.message = message
+        self.retry_after = retry_after
+        self.status_code = status_code
+        super().__init__(self.message)
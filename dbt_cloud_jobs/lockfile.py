@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import tempfile
+from itertools import takewhile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from dbt_cloud_jobs.diff import get_ignored_fields
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.sync_job import DbtCloudJobIndex
+from dbt_cloud_jobs.validator import DbtCloudJobDefinition, is_glob_pattern
+
+LOCKFILE_FORMAT_VERSION = 1
+
+
+class Lockfile:
+    """
+    A record of the jobs applied by the last successful `--sync`, stored next to the YML file.
+
+    For every job the lockfile holds a hash of its normalized definition and the id and
+    `updated_at` of the dbt Cloud job, allowing unchanged jobs to be skipped on the next sync
+    without calling the dbt Cloud API.
+
+    Args:
+        path (Path): Location of the lockfile.
+        jobs (Dict[str, Dict[str, Any]]): Locked jobs, keyed by job name.
+    """
+
+    def __init__(self, path: Path, jobs: Dict[str, Dict[str, Any]]):
+        self.path = path
+        self.jobs = jobs
+
+    @classmethod
+    def load(cls, path: Path) -> "Lockfile":
+        """
+        Read a lockfile, an empty lockfile is returned if it does not exist or cannot be read.
+
+        Returns:
+            Lockfile
+        """
+
+        try:
+            with Path.open(path, "r") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return cls(path=path, jobs={})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring lockfile `{path}` as it cannot be read: {e}")
+            return cls(path=path, jobs={})
+
+        if content.get("version") != LOCKFILE_FORMAT_VERSION:
+            logger.warning(f"Ignoring lockfile `{path}` as it was written by another version.")
+            return cls(path=path, jobs={})
+
+        return cls(path=path, jobs=content["jobs"])
+
+    def get_changed_definitions(
+        self, definitions: Iterable[DbtCloudJobDefinition], hashes: Dict[str, str]
+    ) -> List[DbtCloudJobDefinition]:
+        """
+        Returns the definitions that are new or changed since the lockfile was written.
+        """
+
+        return [
+            definition
+            for definition in definitions
+            if self.jobs.get(definition["name"], {}).get("hash") != hashes[definition["name"]]
+            or self.jobs[definition["name"]].get("id") is None
+        ]
+
+    def get_job_indexes(
+        self, projects: Iterable[Tuple[int, int]]
+    ) -> Dict[Tuple[int, int], DbtCloudJobIndex]:
+        """
+        Build an index of the locked jobs of each project, used in place of a listing of the
+        jobs in projects where no job changed.
+
+        Returns:
+            Dict[Tuple[int, int], DbtCloudJobIndex]
+        """
+
+        return {
+            (account_id, project_id): DbtCloudJobIndex(
+                account_id=account_id,
+                project_id=project_id,
+                jobs=[
+                    {
+                        "account_id": job["account_id"],
+                        "id": job["id"],
+                        "name": name,
+                        "project_id": job["project_id"],
+                        "updated_at": job.get("updated_at"),
+                    }  # type: ignore[misc]
+                    for name, job in self.jobs.items()
+                    if (job["account_id"], job["project_id"]) == (account_id, project_id)
+                ],
+            )
+            for account_id, project_id in projects
+        }
+
+    def update(
+        self,
+        definitions: Iterable[DbtCloudJobDefinition],
+        hashes: Dict[str, str],
+        job_indexes: Dict[Tuple[int, int], DbtCloudJobIndex],
+    ) -> None:
+        """
+        Replace the locked jobs with the jobs defined in the YML file, as they now exist in dbt Cloud.
+        """
+
+        jobs = {}
+        for definition in definitions:
+            job_index = job_indexes.get((definition["account_id"], definition["project_id"]))
+            job = job_index.get(definition["name"]) if job_index else None
+            if job is not None:
+                jobs[definition["name"]] = {
+                    "account_id": definition["account_id"],
+                    "hash": hashes[definition["name"]],
+                    "id": job["id"],
+                    "project_id": definition["project_id"],
+                    "updated_at": job.get("updated_at"),
+                }
+
+        self.jobs = jobs
+
+    def write(self) -> None:
+        logger.info(f"Writing lockfile `{self.path}`...")
+
+        # Write to a temporary file first so the lockfile is never left partially written
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, delete=False, suffix=".tmp"
+        ) as f:
+            json.dump(
+                {"jobs": self.jobs, "version": LOCKFILE_FORMAT_VERSION},
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+        os.replace(f.name, self.path)
+
+
+def get_lockfile_path(file: Path) -> Path:
+    """
+    Returns the location of the lockfile of a YML file, e.g. `dbt_cloud_jobs.yml.lock`. When
+    `--file` is a directory or a glob pattern, the lockfile is `dbt_cloud_jobs.lock` in that
+    directory or in the directory the pattern starts from.
+    """
+
+    if is_glob_pattern(str(file)):
+        directory = Path(*takewhile(lambda x: not is_glob_pattern(x), Path(file).parts[:-1]))
+        return directory / "dbt_cloud_jobs.lock"
+
+    if Path(file).is_dir():
+        return Path(file) / "dbt_cloud_jobs.lock"
+
+    return Path(file).with_name(f"{Path(file).name}.lock")
+
+
+def hash_job_definition(definition: DbtCloudJobDefinition) -> str:
+    """
+    Hash a job definition after normalizing it, i.e. filling in default values and ordering sets.
+    Fields managed by dbt Cloud (e.g. the id of the job) and volatile fields are excluded.
+    Accepts an already validated job, or a dict which is then validated.
+
+    Returns:
+        str: Hex digest of the hash.
+    """
+
+    if not isinstance(definition, DbtCloudJobDefinition):
+        definition = DbtCloudJobDefinition(**definition)
+
+    normalized_definition = definition.model_dump(exclude=set(get_ignored_fields()))
+    return hashlib.sha256(
+        json.dumps(
+            normalized_definition,
+            default=lambda x: sorted(x) if isinstance(x, (set, frozenset)) else str(x),
+            sort_keys=True,
+        ).encode("utf-8")
+    ).hexdigest()
@@ -1,5 +1,9 @@
+import json
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 
 class CustomFormatter(logging.Formatter):
@@ -18,10 +22,44 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: bold_red + log_format + reset,
     }
 
+    def __init__(self):
+        super().__init__(self.log_format)
+        # Formatters are built once per level rather than for every record
+        self.formatters = {
+            level: logging.Formatter(log_fmt) for level, log_fmt in self.FORMATS.items()
+        }
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self.formatters.get(record.levelno, self).format(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats records as JSON objects, one per line.
+    """
+
     def format(self, record: logging.LogRecord) -> str:
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
-        return formatter.format(record)
+        entry = {
+            "level": record.levelname,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+            "time": self.formatTime(record),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry)
+
+
+class JsonQueueHandler(QueueHandler):
+    """
+    Puts records on a queue without formatting them, `QueueHandler` merges their message and
+    traceback in the calling thread, leaving nothing to the `JsonFormatter` of the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 logger = logging.getLogger(__name__)
@@ -32,3 +70,40 @@ logger.setLevel(
 handler = logging.StreamHandler()
 handler.setFormatter(CustomFormatter())
 logger.addHandler(handler)
+
+queue_listener: Optional[QueueListener] = None
+
+
+def start_json_logging() -> None:
+    """
+    Log records as JSON lines. Records are put on a queue and written to stderr by a background
+    thread, so threads sending requests to dbt Cloud never wait on stderr.
+    """
+
+    global queue_listener
+    if queue_listener is not None:
+        return
+
+    json_handler = logging.StreamHandler()
+    json_handler.setFormatter(JsonFormatter())
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_listener = QueueListener(log_queue, json_handler)
+    queue_listener.start()
+    logger.removeHandler(handler)
+    logger.addHandler(JsonQueueHandler(log_queue))
+
+
+def stop_json_logging() -> None:
+    """
+    Write the records still on the queue and restore the default handler.
+    """
+
+    global queue_listener
+    if queue_listener is None:
+        return
+
+    for queue_handler in [x for x in logger.handlers if isinstance(x, JsonQueueHandler)]:
+        logger.removeHandler(queue_handler)
+    logger.addHandler(handler)
+    queue_listener.stop()
+    queue_listener = None
@@ -1,110 +1,637 @@
+import argparse
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-import yaml
-
-from dbt_cloud_jobs.dbt_api_helpers import delete_dbt_cloud_job, list_dbt_cloud_jobs
-from dbt_cloud_jobs.exceptions import (
-    DbtCloudJobsDuplicateJobNameError,
-    DbtCloudJobsInvalidArguments,
-)
-from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.exceptions import DbtCloudJobsInvalidArguments
+from dbt_cloud_jobs.logger import logger, start_json_logging, stop_json_logging
 from dbt_cloud_jobs.parser import parse_args
-from dbt_cloud_jobs.sync_job import sync_dbt_cloud_job
-from dbt_cloud_jobs.utils import job_prefix
-from dbt_cloud_jobs.validator import validate_job_definition_file
+from dbt_cloud_jobs.tracing import get_tracer, reset_tracer
 from dbt_cloud_jobs.version import version
 
+# Modules depending on `pydantic`, `requests` or `yaml` are imported by the operations that need
+# them, so `--help` and invalid arguments return without importing them
+if TYPE_CHECKING:
+    from dbt_cloud_jobs.cache import JobListingCache
+    from dbt_cloud_jobs.lockfile import Lockfile
+    from dbt_cloud_jobs.sharding import Shard
+    from dbt_cloud_jobs.sync_job import DbtCloudJobIndex
+    from dbt_cloud_jobs.validation_cache import ValidationCache
+    from dbt_cloud_jobs.validator import (
+        DbtCloudJobDefinition,
+        DbtCloudJobDefinitionsFile,
+    )
+
+
+def format_job_list(jobs: List["DbtCloudJobDefinition"]) -> str:
+    """
+    Returns one line per job, e.g. "  - `Daily run` (id: 123, project id: 456)".
+    """
+
+    return "\n".join(
+        f"  - `{x['name']}` (id: {x['id']}, project id: {x['project_id']})"
+        for x in sorted(jobs, key=lambda x: (x["project_id"], x["name"]))
+    )
+
+
+def get_job_listing_cache(args: argparse.Namespace) -> Optional["JobListingCache"]:
+    """
+    Returns the cache of job listings to use, None unless `--cache-dir` is passed.
+    """
+
+    from dbt_cloud_jobs.cache import JobListingCache
+
+    if args.cache_dir is None:
+        return None
+
+    return JobListingCache(cache_dir=Path(args.cache_dir), ttl_seconds=args.cache_ttl)
+
+
+def get_validation_cache(args: argparse.Namespace) -> Optional["ValidationCache"]:
+    """
+    Returns the cache of validated files and jobs to use, None unless `--cache-dir` is passed.
+    """
+
+    from dbt_cloud_jobs.validation_cache import ValidationCache
+
+    if args.cache_dir is None:
+        return None
+
+    return ValidationCache.load(cache_dir=Path(args.cache_dir))
 
-def main(args=None) -> None:
-    logger.info(f"Running dbt_cloud_jobs ({version()})...")
-    args, caller = parse_args(args)
 
-    # Verify supplied arguments are valid
-    if (args.account_id is None or args.project_id is None) and args.import_:
-        raise DbtCloudJobsInvalidArguments(
-            "`--account-id` and `--project-id` must be passed when `--import` is passed."
+def get_jobs_to_delete(
+    args: argparse.Namespace,
+    caller: str,
+    job_definitions: Dict[str, Any],
+    job_indexes: Dict[Tuple[int, int], "DbtCloudJobIndex"],
+) -> List[Tuple["DbtCloudJobDefinition", "DbtCloudJobIndex"]]:
+    """
+    Find the dbt Cloud jobs that are no longer present in the YML file, i.e. with no definition of
+    the same name in the same account and project.
+
+    Jobs are only returned when `--allow-deletes` is passed. Either way a single report listing
+    the jobs is logged. When `--shard` is passed, only the first shard looks for jobs to delete.
+
+    Returns:
+        List[Tuple[DbtCloudJobDefinition, DbtCloudJobIndex]]: Pairs of job and the index of its project.
+    """
+
+    from dbt_cloud_jobs.utils import job_prefix
+
+    shard = get_shard(args)
+    if shard is not None and not shard.deletes_jobs:
+        logger.info(
+            f"Jobs no longer present in `{args.file}` are only deleted by shard 1/{shard.total}."
         )
-    elif sum([args.import_, args.validate, args.sync]) == 0:
-        raise DbtCloudJobsInvalidArguments(
-            "One of `--import`, `--validate` and `--sync` must be specified."
+        return []
+
+    defined_jobs = {(x["account_id"], x["project_id"], x["name"]) for x in job_definitions["jobs"]}
+    jobs_to_delete, jobs_to_keep = [], []
+    for (account_id, project_id), job_index in job_indexes.items():
+        for job in job_index.jobs():
+            if (account_id, project_id, job["name"]) in defined_jobs:
+                continue
+
+            if args.allow_deletes and (
+                caller == "cli" or (caller == "pytest" and job["name"].startswith(job_prefix()))
+            ):
+                jobs_to_delete.append((job, job_index))
+            else:
+                jobs_to_keep.append(job)
+
+    if jobs_to_delete:
+        logger.warning(
+            f"{len(jobs_to_delete)} job(s) exist in dbt Cloud but not in `{args.file}` and are planned for deletion:\n"
+            + format_job_list([job for job, _ in jobs_to_delete])
         )
-    elif sum([args.import_, args.validate, args.sync]) > 1:
-        raise DbtCloudJobsInvalidArguments(
-            "Only one of `--import`, `--validate` and `--sync` can be specified."
+    if jobs_to_keep:
+        logger.warning(
+            f"{len(jobs_to_keep)} job(s) exist in dbt Cloud but not in `{args.file}`, pass `--allow-deletes` to delete them from dbt Cloud:\n"
+            + format_job_list(jobs_to_keep)
         )
 
-    dbt_cloud_region = os.getenv("DBT_CLOUD_REGION")
-    if dbt_cloud_region not in ["AU", "Europe", "US"]:
-        raise RuntimeError("The env var `DBT_CLOUD_REGION` must be one of: US, Europe, AU")
-    logger.debug(f"{dbt_cloud_region=}")
+    return jobs_to_delete
 
-    if args.import_:
-        logger.info("Operation: import")
 
-        # Ensure yml file doesn't already exists
-        if Path(args.file).exists():
-            raise FileExistsError(
-                f"{args.file} already exists, please choose a different file name."
+def get_project_file_path(file: str, project_id: int) -> Path:
+    """
+    Returns the file where the jobs of a project are saved when `--file-per-project` is passed,
+    e.g. `dbt_cloud_jobs_123.yml` for `--file dbt_cloud_jobs.yml`.
+    """
+
+    return Path(file).with_name(f"{Path(file).stem}_{project_id}{Path(file).suffix}")
+
+
+def get_project_ids(args: argparse.Namespace) -> List[int]:
+    """
+    Returns the projects to import, all projects in the account when `--project-id` is not passed.
+    """
+
+    from dbt_cloud_jobs.dbt_api_helpers import list_dbt_cloud_projects
+
+    if args.project_id is not None and args.project_id != []:
+        return args.project_id if isinstance(args.project_id, list) else [args.project_id]
+
+    logger.info("No `--project-id` passed, importing the jobs of all projects.")
+    return [x["id"] for x in list_dbt_cloud_projects(account_id=args.account_id)]
+
+
+def get_shard(args: argparse.Namespace) -> Optional["Shard"]:
+    """
+    Returns the shard of the jobs to sync, None unless `--shard` is passed.
+    """
+
+    from dbt_cloud_jobs.sharding import parse_shard
+
+    if args.shard is None:
+        return None
+
+    return parse_shard(args.shard)
+
+
+def import_jobs(args: argparse.Namespace) -> None:
+    """
+    Save the jobs of one or more projects to `--file`, or to one file per project when
+    `--file-per-project` is passed. Projects are listed concurrently.
+    """
+
+    from dbt_cloud_jobs.dbt_api_helpers import iter_dbt_cloud_job_pages
+    from dbt_cloud_jobs.utils import map_concurrently
+    from dbt_cloud_jobs.writers import write_job_definitions
+
+    # Ensure yml file(s) don't already exist
+    if not args.file_per_project and Path(args.file).exists():
+        raise FileExistsError(f"{args.file} already exists, please choose a different file name.")
+
+    project_ids = get_project_ids(args)
+    if args.file_per_project:
+        for project_id in project_ids:
+            if get_project_file_path(args.file, project_id).exists():
+                raise FileExistsError(
+                    f"{get_project_file_path(args.file, project_id)} already exists, please choose a different file name."
+                )
+
+    cache = get_job_listing_cache(args)
+
+    def list_project_job_pages(project_id: int) -> Iterator["DbtCloudJobDefinitionsFile"]:
+        if cache is not None:
+            return iter(
+                [cache.list_dbt_cloud_jobs(account_id=args.account_id, project_id=project_id)]
             )
 
-        job_definitions = list_dbt_cloud_jobs(args.account_id, args.project_id)
+        logger.info(
+            f"Listing dbt Cloud jobs for account id {args.account_id}, project id {project_id}..."
+        )
+        return iter_dbt_cloud_job_pages(account_id=args.account_id, project_id=project_id)
+
+    if args.file_per_project:
+
+        def import_project(project_id: int) -> None:
+            file = get_project_file_path(args.file, project_id)
+            job_count = write_job_definitions(pages=list_project_job_pages(project_id), file=file)
+            logger.info(f"Saved {job_count} job(s) of project {project_id} to `{file}`.")
+
+        # Every project is streamed to its own file
+        for _ in map_concurrently(import_project, project_ids, max_workers=args.max_workers):
+            pass
+    else:
+        if len(project_ids) == 1:
+            # Jobs are written to the file as pages arrive rather than once all jobs are listed
+            pages = list_project_job_pages(project_ids[0])
+        else:
+            # Projects are listed concurrently and written to the file in the order of their ids
+            pages = (
+                page
+                for project_pages in map_concurrently(
+                    lambda project_id: list(list_project_job_pages(project_id)),
+                    sorted(project_ids),
+                    max_workers=args.max_workers,
+                )
+                for page in project_pages
+            )
 
         logger.info(f"Saving job definitions to `{args.file}...")
-        with Path.open(Path(args.file), "w") as f:
-            yaml.safe_dump({"jobs": job_definitions}, stream=f, encoding="utf-8", sort_keys=True)
+        job_count = write_job_definitions(pages=pages, file=Path(args.file))
+        logger.info(f"Saved {job_count} job(s) to `{args.file}`.")
+
+
+def prepare_sync(
+    args: argparse.Namespace,
+    job_definitions: Dict[str, Any],
+    definitions_file: "DbtCloudJobDefinitionsFile",
+) -> Tuple[
+    "Lockfile",
+    Dict[str, str],
+    List["DbtCloudJobDefinition"],
+    Dict[Tuple[int, int], "DbtCloudJobIndex"],
+]:
+    """
+    Read the lockfile and select the definitions to compare with dbt Cloud, shared by `--sync` and `--plan`.
+
+    Returns:
+        Tuple[Lockfile, Dict[str, str], List[DbtCloudJobDefinition], Dict[Tuple[int, int], DbtCloudJobIndex]]:
+            The lockfile, the hash of every definition, the definitions to sync and the indexes
+            of the locked jobs in projects that do not need to be listed.
+    """
+
+    from dbt_cloud_jobs.lockfile import Lockfile, get_lockfile_path, hash_job_definition
+
+    lockfile = Lockfile.load(get_lockfile_path(args.file))
+    hashes = {x.name: hash_job_definition(x) for x in definitions_file.jobs}
+    projects = {(x["account_id"], x["project_id"]) for x in job_definitions["jobs"]}
+    if args.full_refresh:
+        definitions_to_sync = job_definitions["jobs"]
+        job_indexes: Dict[Tuple[int, int], DbtCloudJobIndex] = {}
+    else:
+        # Unchanged jobs are skipped, projects without any changed job are not listed and
+        # the locked jobs are used to find jobs no longer present in the YML file
+        definitions_to_sync = lockfile.get_changed_definitions(
+            job_definitions["jobs"], hashes=hashes
+        )
+        job_indexes = lockfile.get_job_indexes(projects=projects)
+        logger.info(
+            f"{len(job_definitions['jobs']) - len(definitions_to_sync)} job(s) unchanged since the last sync, {len(definitions_to_sync)} job(s) to sync. Pass `--full-refresh` to sync all jobs."
+        )
+
+    return lockfile, hashes, definitions_to_sync, job_indexes
+
+
+def merge_shard_reports(args: argparse.Namespace) -> None:
+    """
+    Merge the reports of every shard of a `--sync` into the lockfile of `--file`.
+    """
+
+    from dbt_cloud_jobs import sharding
+    from dbt_cloud_jobs.lockfile import get_lockfile_path
 
-    elif args.validate or args.sync:
+    reports = []
+    for file in args.merge_shard_reports:
+        with Path.open(Path(file), "r") as f:
+            reports.append(sharding.ShardReport.model_validate_json(f.read()))
+
+    sharding.merge_shard_reports(reports, lockfile_path=get_lockfile_path(args.file)).write()
+
+
+def report_api_stats(args: argparse.Namespace) -> None:
+    """
+    Print the summary of the requests sent to dbt Cloud when `--stats` is passed, and save it to
+    `--stats-file` when passed.
+    """
+
+    from dbt_cloud_jobs.metrics import get_api_metrics
+
+    stats = get_api_metrics().summarize()
+    if args.stats:
+        stats.log()
+    if args.stats_file is not None:
+        stats.write(Path(args.stats_file))
+
+
+def run_operation(args: argparse.Namespace, caller: str) -> None:
+    """
+    Run the operation selected by the arguments, i.e. `--import`, `--merge-shard-reports`,
+    `--validate`, `--plan` or `--sync`.
+    """
+
+    if args.import_:
+        logger.info("Operation: import")
+
+        with get_tracer().span("import"):
+            import_jobs(args)
+
+    elif args.merge_shard_reports:
+        logger.info("Operation: merge shard reports")
+
+        merge_shard_reports(args)
+
+    elif args.validate or args.plan or args.sync:
         logger.info("Operation: validate")
 
-        # Ensure yml file exists
-        if not Path(args.file).exists():
+        from dbt_cloud_jobs.validator import (
+            load_job_definition_files,
+            resolve_job_definition_files,
+        )
+
+        # Ensure yml file(s) exist
+        files = resolve_job_definition_files(args.file)
+        if not files:
             raise FileNotFoundError(f"{args.file} does not exists.")
 
-        logger.info(f"Using definitions files: {args.file}")
-        with Path.open(Path(args.file)) as f:
-            job_definitions = yaml.safe_load(f)
+        logger.info(f"Using definitions files: {', '.join(str(x) for x in files)}")
+
+        # Every file is parsed and validated once, in parallel when there are several files. The
+        # validated jobs are then used for hashing, diffing and as the payloads sent to dbt Cloud.
+        # `--validate` alone skips files and jobs that are unchanged since last validated
+        definitions_file = load_job_definition_files(
+            files=files,
+            cache=get_validation_cache(args),
+            validate_only=not (args.plan or args.sync),
+        )
+        if definitions_file is None:
+            logger.warning(
+                f"Pass `--sync` to sync the jobs defined in `{args.file}` to dbt Cloud."
+            )
+            return
+
+        job_definitions = {"jobs": [x.to_payload() for x in definitions_file.jobs]}
+
+        if args.plan:
+            logger.info("Operation: plan")
+
+            from dbt_cloud_jobs.plan import plan_job_actions
+            from dbt_cloud_jobs.sync_job import build_job_indexes
+
+            with get_tracer().span("diff"):
+                _, _, definitions_to_sync, job_indexes = prepare_sync(
+                    args=args, job_definitions=job_definitions, definitions_file=definitions_file
+                )
+                definitions, definitions_to_sync, definitions_to_list = select_shard(
+                    args=args,
+                    job_definitions=job_definitions,
+                    definitions_to_sync=definitions_to_sync,
+                )
+            with get_tracer().span("list_remote_jobs"):
+                listed_job_indexes = build_job_indexes(
+                    definitions_to_list, cache=get_job_listing_cache(args)
+                )
+            job_indexes.update(listed_job_indexes)
+            with get_tracer().span("diff"):
+                plan = plan_job_actions(
+                    definitions=definitions,
+                    definitions_to_sync=definitions_to_sync,
+                    job_indexes=job_indexes,
+                    listed_projects=listed_job_indexes.keys(),
+                    jobs_to_delete=get_jobs_to_delete(
+                        args=args,
+                        caller=caller,
+                        job_definitions=job_definitions,
+                        job_indexes=job_indexes,
+                    ),
+                )
+            plan.log()
+            if args.plan_file is not None:
+                plan.write(Path(args.plan_file))
+        elif args.sync:
+            logger.info("Operation: sync")
+
+            # Unchanged jobs are found by comparing hashes with the lockfile, changed jobs are
+            # diffed with dbt Cloud by `sync_dbt_cloud_job` as part of the `apply` phase
+            with get_tracer().span("diff"):
+                lockfile, hashes, definitions_to_sync, job_indexes = prepare_sync(
+                    args=args, job_definitions=job_definitions, definitions_file=definitions_file
+                )
+                definitions, definitions_to_sync, definitions_to_list = select_shard(
+                    args=args,
+                    job_definitions=job_definitions,
+                    definitions_to_sync=definitions_to_sync,
+                )
+
+            sync(
+                args=args,
+                caller=caller,
+                job_definitions=job_definitions,
+                definitions_to_sync=definitions_to_sync,
+                job_indexes=job_indexes,
+                definitions_to_list=definitions_to_list,
+            )
+
+            with get_tracer().span("write_lockfile"):
+                lockfile.update(definitions, hashes=hashes, job_indexes=job_indexes)
+                shard = get_shard(args)
+                if shard is None:
+                    lockfile.write()
+                else:
+                    # Shards run on separate runners, each writes the jobs it applied to its own
+                    # report rather than to the lockfile
+                    from dbt_cloud_jobs.sharding import (
+                        ShardReport,
+                        get_shard_report_path,
+                    )
+
+                    ShardReport(
+                        index=shard.index,
+                        jobs=lockfile.jobs,
+                        synced=len(definitions_to_sync),
+                        total=shard.total,
+                    ).write(
+                        Path(args.shard_report_file)
+                        if args.shard_report_file is not None
+                        else get_shard_report_path(lockfile.path, shard=shard)
+                    )
+
 
-        logger.debug(f"{job_definitions=}")
-        logger.info(f"Found definitions for {len(job_definitions['jobs'])} job(s).")
+def select_shard(
+    args: argparse.Namespace,
+    job_definitions: Dict[str, Any],
+    definitions_to_sync: List["DbtCloudJobDefinition"],
+) -> Tuple[
+    List["DbtCloudJobDefinition"], List["DbtCloudJobDefinition"], List["DbtCloudJobDefinition"]
+]:
+    """
+    Select the definitions of the shard passed to `--shard`, all definitions when not passed.
 
-        if len([x["name"] for x in job_definitions["jobs"]]) != len(
-            {x["name"] for x in job_definitions["jobs"]}
-        ):
-            raise DbtCloudJobsDuplicateJobNameError(f"Job names must be unique in `{args.file}`.")
+    Returns:
+        Tuple[List[DbtCloudJobDefinition], List[DbtCloudJobDefinition], List[DbtCloudJobDefinition]]:
+            The definitions of the shard, the definitions to sync and the definitions whose
+            projects are listed. The shard deleting jobs lists the projects of all the
+            definitions to sync, so jobs no longer present in the YML file are found.
+    """
 
-        validate_job_definition_file(file=args.file)
+    shard = get_shard(args)
+    if shard is None:
+        return job_definitions["jobs"], definitions_to_sync, definitions_to_sync
 
-    if args.sync:
-        logger.info("Operation: sync")
+    shard_definitions_to_sync = shard.select(definitions_to_sync)
+    logger.info(
+        f"Shard {shard.index}/{shard.total}: {len(shard_definitions_to_sync)} of {len(definitions_to_sync)} job(s) to sync."
+    )
+    return (
+        shard.select(job_definitions["jobs"]),
+        shard_definitions_to_sync,
+        definitions_to_sync if shard.deletes_jobs else shard_definitions_to_sync,
+    )
 
-        for definition in job_definitions["jobs"]:
-            # New jobs and jobs that need updating
-            sync_dbt_cloud_job(definition=definition)
+
+def sync(
+    args: argparse.Namespace,
+    caller: str,
+    job_definitions: Dict[str, Any],
+    definitions_to_sync: List["DbtCloudJobDefinition"],
+    job_indexes: Dict[Tuple[int, int], "DbtCloudJobIndex"],
+    definitions_to_list: List["DbtCloudJobDefinition"],
+) -> None:
+    """
+    Create and update the jobs in `definitions_to_sync`, then delete the jobs no longer present in
+    the YML file. The projects of `definitions_to_list` are listed first, `job_indexes` is updated
+    in place with the resulting state of dbt Cloud.
+    """
+
+    from dbt_cloud_jobs.sync_job import (
+        build_job_indexes,
+        delete_indexed_dbt_cloud_job_steps,
+        store_job_indexes,
+        sync_dbt_cloud_job_steps,
+    )
+
+    # Both drivers run the same steps, only how requests are sent differs
+    if args.async_:
+        from dbt_cloud_jobs.async_dbt_api_helpers import run_job_steps
+    else:
+        from dbt_cloud_jobs.sync_job import run_job_steps
+
+    # Take a single snapshot of the existing jobs in every project, this snapshot is kept
+    # up to date as jobs are created and updated so it can be re-used for deletions
+    cache = get_job_listing_cache(args)
+    with get_tracer().span("list_remote_jobs"):
+        listed_job_indexes = build_job_indexes(definitions_to_list, cache=cache)
+        job_indexes.update(listed_job_indexes)
+
+    try:
+        # New jobs and jobs that need updating
+        with get_tracer().span("apply"):
+            run_job_steps(
+                steps=[
+                    (
+                        definition["name"],
+                        sync_dbt_cloud_job_steps(
+                            definition=definition,
+                            job_index=job_indexes[
+                                (definition["account_id"], definition["project_id"])
+                            ],
+                        ),
+                    )
+                    for definition in definitions_to_sync
+                ],
+                max_workers=args.max_workers,
+                operation="sync",
+            )
 
         # Remove jobs no longer present in the YML file
-        for account_id, project_id in {
-            (x["account_id"], x["project_id"]) for x in job_definitions["jobs"]
-        }:
-            existing_jobs = list_dbt_cloud_jobs(account_id=account_id, project_id=project_id)
-            for job in existing_jobs:
-                if job["name"] not in [
-                    job["name"]
-                    for job in job_definitions["jobs"]
-                    if job["account_id"] == account_id
-                ]:
-                    if args.allow_deletes and (
-                        caller == "cli"
-                        or (caller == "pytest" and job["name"].startswith(job_prefix()))
-                    ):
-                        delete_dbt_cloud_job(definition=job)
-                    else:
-                        logger.warning(
-                            f"Job `{job['name']}` (id: {job['id']}) exists in dbt Cloud but not in `{args.file}`. Pass `--allow-deletes` to delete this job from dbt Cloud."
-                        )
-    elif not args.import_ and args.validate and not args.sync:
-        logger.warning(f"Pass `--sync` to sync the jobs defined in `{args.file}` to dbt Cloud.")
+        with get_tracer().span("delete"):
+            run_job_steps(
+                steps=[
+                    (job["name"], delete_indexed_dbt_cloud_job_steps(job=job, job_index=job_index))
+                    for job, job_index in get_jobs_to_delete(
+                        args=args,
+                        caller=caller,
+                        job_definitions=job_definitions,
+                        job_indexes=job_indexes,
+                    )
+                ],
+                max_workers=args.max_workers,
+                operation="delete",
+            )
+    finally:
+        # Only listed indexes are written back, indexes built from the lockfile may be incomplete
+        store_job_indexes(listed_job_indexes.values(), cache=cache)
+
+
+def cli() -> None:
+    """
+    Entry point of the `dbt_cloud_jobs` command, arguments are read from the command line.
+    """
+
+    main(caller="cli")
+
+
+def main(args: Optional[argparse.Namespace] = None, caller: str = "pytest") -> None:
+    """
+    Run `dbt_cloud_jobs`.
+
+    Args:
+        args (Optional[argparse.Namespace], optional): Arguments to use when not called from the
+            command line, missing arguments take their default value. Defaults to None.
+        caller (str, optional): "cli" when called via `cli()`, arguments are then read from the
+            command line. Defaults to "pytest".
+    """
+
+    logger.info(f"Running dbt_cloud_jobs ({version()})...")
+    reset_tracer()
+    with get_tracer().span("parse_arguments"):
+        args = parse_args(args, caller=caller)
+
+        # Verify supplied arguments are valid
+        if args.account_id is None and args.import_:
+            raise DbtCloudJobsInvalidArguments(
+                "`--account-id` must be passed when `--import` is passed."
+            )
+        operations = [
+            args.import_,
+            bool(args.merge_shard_reports),
+            args.validate,
+            args.plan,
+            args.sync,
+        ]
+        if sum(operations) == 0:
+            raise DbtCloudJobsInvalidArguments(
+                "One of `--import`, `--merge-shard-reports`, `--validate`, `--plan` and `--sync` must be specified."
+            )
+        elif sum(operations) > 1:
+            raise DbtCloudJobsInvalidArguments(
+                "Only one of `--import`, `--merge-shard-reports`, `--validate`, `--plan` and `--sync` can be specified."
+            )
+        elif args.shard is not None and not (args.plan or args.sync):
+            raise DbtCloudJobsInvalidArguments(
+                "`--shard` can only be passed with `--plan` or `--sync`."
+            )
+        elif args.shard is not None:
+            # Raises when the value is not INDEX/TOTAL
+            get_shard(args)
+
+    # JSON logs are written by a background thread, see `start_json_logging`
+    if (args.log_format or os.getenv("DBT_CLOUD_JOBS_LOG_FORMAT")) == "json":
+        start_json_logging()
+    try:
+        from dbt_cloud_jobs.settings import configure_api_settings
+
+        settings = configure_api_settings(
+            connect_timeout=args.connect_timeout,
+            deadline_seconds=args.deadline_seconds,
+            gzip=args.gzip,
+            keep_alive=args.keep_alive,
+            max_retries=args.max_retries,
+            pool_size=args.pool_size,
+            read_timeout=args.read_timeout,
+            requests_per_second=args.requests_per_second,
+        )
+        if args.pool_size is None and args.max_workers > settings.pool_size:
+            # Allow every worker to keep its connection open
+            configure_api_settings(pool_size=args.max_workers)
+        if args.import_ or args.plan or args.sync:
+            # Other operations never call dbt Cloud, avoiding the import of `requests`
+            from dbt_cloud_jobs.dbt_api_helpers import start_run_deadline
+
+            start_run_deadline()
+
+        dbt_cloud_region = os.getenv("DBT_CLOUD_REGION")
+        if dbt_cloud_region not in ["AU", "Europe", "US"]:
+            raise RuntimeError("The env var `DBT_CLOUD_REGION` must be one of: US, Europe, AU")
+        logger.debug("dbt_cloud_region=%r", dbt_cloud_region)
+
+        from dbt_cloud_jobs.metrics import reset_api_metrics
+
+        reset_api_metrics()
+        if args.profile is not None:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            run_operation(args=args, caller=caller)
+        finally:
+            if args.profile is not None:
+                profiler.disable()
+                logger.info(f"Saving profile to `{args.profile}`...")
+                profiler.dump_stats(args.profile)
+            get_tracer().log()
+            if args.trace_file is not None:
+                get_tracer().write(Path(args.trace_file))
+            if args.stats or args.stats_file is not None:
+                report_api_stats(args)
+    finally:
+        stop_json_logging()
 
 
 if __name__ == "__main__":
-    main()
+    cli()
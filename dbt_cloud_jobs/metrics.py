@@ -0,0 +1,179 @@
+import math
+import re
+import threading
+from pathlib import Path
+from typing import Counter, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from dbt_cloud_jobs.logger import logger
+
+# Ids in endpoints are replaced so all requests to e.g. `accounts/1/jobs/2` and
+# `accounts/1/jobs/3` are counted together
+ID_PATTERN = re.compile(r"(?<=/)\d+(?=/|$)|^\d+(?=/)")
+
+
+class LatencyStats(BaseModel):
+    """
+    Distribution of the latency of requests, in milliseconds.
+    """
+
+    max: float = 0
+    p50: float = 0
+    p95: float = 0
+
+
+class EndpointStats(BaseModel):
+    """
+    Requests sent to a single endpoint of the dbt Cloud API with a single method.
+    """
+
+    bytes_received: int = Field(
+        default=0, description="Size of the response bodies, after decompression."
+    )
+    bytes_sent: int = Field(default=0, description="Size of the request bodies.")
+    endpoint: str = Field(
+        description="Endpoint relative to `/api/v2/`, ids are replaced by `{id}`."
+    )
+    latency_ms: LatencyStats = LatencyStats()
+    method: str
+    requests: int = 0
+    retries: int = 0
+    status_codes: Dict[str, int] = Field(
+        default={},
+        description="Number of responses per status code, `error` for connection errors.",
+    )
+
+
+class ApiStats(BaseModel):
+    """
+    Summary of the requests sent to the dbt Cloud API during a run.
+    """
+
+    endpoints: List[EndpointStats]
+    total: EndpointStats
+
+    def log(self) -> None:
+        for stats in [*self.endpoints, self.total]:
+            logger.info(
+                f"{stats.method} {stats.endpoint}: {stats.requests} request(s), {stats.retries} retry(ies), status codes {', '.join(f'{k}: {v}' for k, v in sorted(stats.status_codes.items())) or '-'}, {stats.bytes_sent / 1024:.1f}KiB sent, {stats.bytes_received / 1024:.1f}KiB received, latency p50 {stats.latency_ms.p50:.0f}ms p95 {stats.latency_ms.p95:.0f}ms max {stats.latency_ms.max:.0f}ms"
+            )
+
+    def write(self, path: Path) -> None:
+        logger.info(f"Saving API stats to `{path}`...")
+        with Path.open(path, "w") as f:
+            f.write(self.model_dump_json(indent=2))
+            f.write("\n")
+
+
+class ApiMetrics:
+    """
+    Thread-safe counters of the requests sent to the dbt Cloud API, per endpoint and method.
+    Latencies are kept so percentiles are exact.
+    """
+
+    def __init__(self):
+        self.bytes_received: Counter[Tuple[str, str]] = Counter()
+        self.bytes_sent: Counter[Tuple[str, str]] = Counter()
+        self.latencies: Dict[Tuple[str, str], List[float]] = {}
+        self.lock = threading.Lock()
+        self.retries: Counter[Tuple[str, str]] = Counter()
+        self.status_codes: Dict[Tuple[str, str], Counter[str]] = {}
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        seconds: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """
+        Record a request, pass a `status_code` of None for requests that failed to connect.
+        """
+
+        key = (method.upper(), normalize_endpoint(endpoint))
+        with self.lock:
+            self.bytes_received[key] += bytes_received
+            self.bytes_sent[key] += bytes_sent
+            self.latencies.setdefault(key, []).append(seconds)
+            self.status_codes.setdefault(key, Counter())[
+                str(status_code) if status_code is not None else "error"
+            ] += 1
+
+    def record_retry(self, method: str, endpoint: str) -> None:
+        with self.lock:
+            self.retries[(method.upper(), normalize_endpoint(endpoint))] += 1
+
+    def summarize(self) -> ApiStats:
+        with self.lock:
+            keys = sorted(self.latencies.keys() | self.retries.keys(), key=lambda x: (x[1], x[0]))
+            endpoints = [
+                self.summarize_requests(
+                    method=method,
+                    endpoint=endpoint,
+                    keys=[(method, endpoint)],
+                )
+                for method, endpoint in keys
+            ]
+            total = self.summarize_requests(method="ALL", endpoint="(total)", keys=keys)
+
+        return ApiStats(endpoints=endpoints, total=total)
+
+    def summarize_requests(
+        self, method: str, endpoint: str, keys: List[Tuple[str, str]]
+    ) -> EndpointStats:
+        latencies = sorted(x for key in keys for x in self.latencies.get(key, []))
+        status_codes: Counter[str] = sum(
+            (self.status_codes.get(key, Counter()) for key in keys), Counter()
+        )
+        return EndpointStats(
+            bytes_received=sum(self.bytes_received[key] for key in keys),
+            bytes_sent=sum(self.bytes_sent[key] for key in keys),
+            endpoint=endpoint,
+            latency_ms=LatencyStats(
+                max=latencies[-1] * 1000 if latencies else 0,
+                p50=get_percentile(latencies, 50) * 1000,
+                p95=get_percentile(latencies, 95) * 1000,
+            ),
+            method=method,
+            requests=len(latencies),
+            retries=sum(self.retries[key] for key in keys),
+            status_codes=dict(status_codes),
+        )
+
+
+api_metrics = ApiMetrics()
+
+
+def get_api_metrics() -> ApiMetrics:
+    return api_metrics
+
+
+def get_percentile(sorted_values: List[float], percentile: float) -> float:
+    """
+    Nearest-rank percentile of already sorted values, 0 when there are no values.
+    """
+
+    if not sorted_values:
+        return 0
+
+    return sorted_values[max(0, math.ceil(percentile / 100 * len(sorted_values)) - 1)]
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """
+    Returns the endpoint with ids replaced by `{id}`, e.g. `accounts/{id}/jobs/{id}`.
+    """
+
+    return ID_PATTERN.sub("{id}", endpoint)
+
+
+def reset_api_metrics() -> None:
+    """
+    Discard all recorded requests, e.g. at the start of a run.
+    """
+
+    global api_metrics
+    api_metrics = ApiMetrics()
@@ -1,14 +1,26 @@
 import argparse
-import inspect
+from typing import Optional
 
 from dbt_cloud_jobs.logger import logger
 
 
-def parse_args(args: argparse.Namespace):
+def parse_args(args: Optional[argparse.Namespace], caller: str) -> argparse.Namespace:
+    """
+    Parse the arguments of `dbt_cloud_jobs`.
+
+    Args:
+        args (Optional[argparse.Namespace]): Arguments passed to `main()`, ignored when `caller` is "cli".
+        caller (str): "cli" to read arguments from the command line, otherwise missing arguments in
+            `args` are set to their default value.
+
+    Returns:
+        argparse.Namespace
+    """
+
     parser = argparse.ArgumentParser(description="Create dbt Cloud jobs from a YML file.")
     parser.add_argument(
         "--account-id",
-        help="The dbt Cloud account ID, only used when `--import` is passed.",
+        help="The dbt Cloud account ID, required when `--import` is passed.",
         type=int,
     )
     parser.add_argument(
@@ -17,15 +29,61 @@ def parse_args(args: argparse.Namespace):
         default=False,
         help="When passed as a flag, any dbt Cloud job that does not exist in the specified YML file will be deleted.",
     )
+    parser.add_argument(
+        "--async",
+        action="store_true",
+        default=False,
+        dest="async_",
+        help="When passed as a flag, `--sync` sends requests to dbt Cloud from an asyncio event loop, with at most `--max-workers` requests in flight. Requires the `async` extra, i.e. `pip install dbt-cloud-jobs[async]`.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="A directory where listings of dbt Cloud jobs and the results of `--validate` are cached across runs. Cached listings are revalidated with a single request and only jobs updated since are requested again, only files and jobs changed since last validated are validated again. Disabled by default.",
+        type=str,
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        default=0,
+        help="The number of seconds a cached listing of dbt Cloud jobs is used without being revalidated, only used when `--cache-dir` is passed. Defaults to 0.",
+        type=float,
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        help="The number of seconds to wait for a connection to dbt Cloud to be established. Can also be set via the `DBT_CLOUD_JOBS_CONNECT_TIMEOUT` environment variable. Defaults to 10.",
+        type=float,
+    )
+    parser.add_argument(
+        "--deadline",
+        dest="deadline_seconds",
+        help="The maximum number of seconds this run may take, requests to dbt Cloud fail with a clear error once it is exceeded. Can also be set via the `DBT_CLOUD_JOBS_DEADLINE_SECONDS` environment variable. No deadline by default.",
+        type=float,
+    )
     parser.add_argument(
         "--file",
         "-f",
         help="""
-            When used with `--import`, the name of the YML file where dbt Cloud job definitions will be saved. This file cannot exist beforehand.
-            When used with `--sync`, the name of the YML file containing the dbt Cloud job definitions.
+            When used with `--import`, the name of the YML file where dbt Cloud job definitions will be saved, jobs are written as they are listed. This file cannot exist beforehand. Use a `.jsonl` extension to save one job per line as JSON Lines.
+            When used with `--validate`, `--plan` or `--sync`, the name of the YML file containing the dbt Cloud job definitions, a directory containing YML files or a glob pattern matching YML files (e.g. "jobs/**/*.yml"). Files are validated in parallel and job names must be unique across all files.
         """,
         type=str,
     )
+    parser.add_argument(
+        "--file-per-project",
+        action="store_true",
+        default=False,
+        help="When passed as a flag, `--import` saves the jobs of every project to a separate file named after the project ID, e.g. `dbt_cloud_jobs_123.yml` for `--file dbt_cloud_jobs.yml`.",
+    )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        default=False,
+        help="When passed as a flag, `--sync` ignores the lockfile written by the previous sync and compares every job defined in the YML file with dbt Cloud.",
+    )
+    parser.add_argument(
+        "--gzip",
+        action=argparse.BooleanOptionalAction,
+        help="Ask dbt Cloud to compress responses with gzip. Can also be set via the `DBT_CLOUD_JOBS_GZIP` environment variable. Enabled by default.",
+    )
     parser.add_argument(
         "--import",
         action="store_true",
@@ -33,9 +91,62 @@ def parse_args(args: argparse.Namespace):
         dest="import_",
         help="When passed as a flag, any dbt Cloud job will be saved to a file specified by the `--file` parameter.",
     )
+    parser.add_argument(
+        "--keep-alive",
+        action=argparse.BooleanOptionalAction,
+        help="Re-use connections to dbt Cloud across requests. Can also be set via the `DBT_CLOUD_JOBS_KEEP_ALIVE` environment variable. Enabled by default.",
+    )
+    parser.add_argument(
+        "--log-format",
+        choices=["json", "text"],
+        help="The format of logs. With `json`, every record is written to stderr as a JSON object by a background thread so threads sending requests to dbt Cloud never wait on stderr. Can also be set via the `DBT_CLOUD_JOBS_LOG_FORMAT` environment variable. Defaults to `text`.",
+        type=str,
+    )
+    parser.add_argument(
+        "--max-retries",
+        help="The maximum number of times a request to dbt Cloud is retried after a 429, a 5xx or a connection error. Can also be set via the `DBT_CLOUD_JOBS_MAX_RETRIES` environment variable. Defaults to 5.",
+        type=int,
+    )
+    parser.add_argument(
+        "--max-workers",
+        default=4,
+        help="The maximum number of dbt Cloud jobs that are created, updated or deleted concurrently when `--sync` is passed, or projects listed concurrently when `--import` is passed. When `--async` is passed, the maximum number of requests in flight.",
+        type=int,
+    )
+    parser.add_argument(
+        "--merge-shard-reports",
+        help="The reports written by every shard of a `--sync` run with `--shard`, merged into the lockfile of the file passed to `--file` so the next sync can skip unchanged jobs.",
+        nargs="+",
+        type=str,
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        default=False,
+        help="When passed as a flag, the jobs defined in the file passed to `--file` are compared with dbt Cloud and the jobs `--sync` would create, update and delete are printed, along with the number of requests `--sync` would send to dbt Cloud. No job on dbt Cloud will be updated.",
+    )
+    parser.add_argument(
+        "--plan-file",
+        help="The name of a JSON file where the plan is saved, only used when `--plan` is passed.",
+        type=str,
+    )
+    parser.add_argument(
+        "--pool-size",
+        help="The maximum number of connections to dbt Cloud kept open for re-use. Can also be set via the `DBT_CLOUD_JOBS_POOL_SIZE` environment variable. Defaults to 10, or `--max-workers` if larger.",
+        type=int,
+    )
+    parser.add_argument(
+        "--profile",
+        const="dbt_cloud_jobs.pstats",
+        help="The name of a file where a cProfile profile of the run is saved, readable with `python -m pstats` or snakeviz. Defaults to `dbt_cloud_jobs.pstats` when passed without a value. Only the main thread is profiled.",
+        nargs="?",
+        type=str,
+    )
     parser.add_argument(
         "--project-id",
-        help="The dbt Cloud project ID, only used when `--import` is passed.",
+        action="extend",
+        help="One or more dbt Cloud project IDs, only used when `--import` is passed. When not passed, the jobs of all projects in the account are imported.",
+        nargs="+",
         type=int,
     )
     parser.add_argument(
@@ -44,27 +155,58 @@ def parse_args(args: argparse.Namespace):
         default=False,
         help="When passed as a flag, any dbt Cloud jobs defined in the file passed to `--file` will be validated. No job on dbt Cloud will be updated; to do this, pass `--sync` instead of `--validate`.",
     )
+    parser.add_argument(
+        "--read-timeout",
+        help="The number of seconds to wait for dbt Cloud to send data before giving up on a request. Can also be set via the `DBT_CLOUD_JOBS_READ_TIMEOUT` environment variable. Defaults to 60.",
+        type=float,
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        help="The maximum number of requests sent to dbt Cloud per second, use this to stay under the request quota of your dbt Cloud account. Can also be set via the `DBT_CLOUD_JOBS_REQUESTS_PER_SECOND` environment variable. Unlimited by default.",
+        type=float,
+    )
+    parser.add_argument(
+        "--shard",
+        help="Only create and update a share of the jobs, so `--sync` can run on several CI runners in parallel. Pass INDEX/TOTAL, e.g. `--shard 2/4` on the second of four runners; jobs are assigned to shards by a stable hash of their name. Only shard 1 deletes jobs. Instead of the lockfile, every shard writes a report to `--shard-report-file`, merge the reports with `--merge-shard-reports` once every shard has run. Only used when `--plan` or `--sync` is passed.",
+        type=str,
+    )
+    parser.add_argument(
+        "--shard-report-file",
+        help="The name of the JSON file where the report of a shard is saved. Defaults to the lockfile followed by the shard, e.g. `dbt_cloud_jobs.yml.lock.shard-2-of-4.json`.",
+        type=str,
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        default=False,
+        help="When passed as a flag, a summary of the requests sent to dbt Cloud is printed at the end of the run: the number of requests, retries, status codes, bytes and latency percentiles of every endpoint.",
+    )
+    parser.add_argument(
+        "--stats-file",
+        help="The name of a JSON file where the summary of the requests sent to dbt Cloud is saved at the end of the run.",
+        type=str,
+    )
     parser.add_argument(
         "--sync",
         action="store_true",
         default=False,
         help="When passed as a flag, any dbt Cloud jobs defined in the file passed to `--file` will be synced to dbt Cloud.",
     )
+    parser.add_argument(
+        "--trace-file",
+        help="The name of a JSON file where the wall and CPU time of every phase of the run (parsing arguments, loading YML files, validation, listing jobs in dbt Cloud, diffing, applying changes and deleting jobs) is saved, in the Chrome trace event format. Open it in Perfetto or `chrome://tracing`.",
+        type=str,
+    )
+
+    logger.debug("caller=%r", caller)
+    if caller == "cli":
+        return parser.parse_args()
 
-    # Determining how function is called
-    if (
-        inspect.stack()[2].code_context[0].strip() == "sys.exit(main())"  # type: ignore[index]
-    ):  # Not true when pytest calls main()
-        args = parser.parse_args()
-        caller = "cli"
-        logger.debug(f"{caller=}")
-    else:
-        caller = "pytest"
-        logger.debug(f"{caller=}")
-        # Set default values if necessary
-        passed_args = [x[0] for x in args._get_kwargs()]
-        for arg in parser._actions:
-            if arg.dest not in passed_args:
-                setattr(args, arg.dest, arg.default)
+    # Set default values if necessary
+    args = args if args is not None else argparse.Namespace()
+    passed_args = [x[0] for x in args._get_kwargs()]
+    for arg in parser._actions:
+        if arg.dest not in passed_args:
+            setattr(args, arg.dest, arg.default)
 
-    return args, caller
+    return args
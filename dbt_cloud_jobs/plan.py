@@ -0,0 +1,182 @@
+import difflib
+import math
+from pathlib import Path
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from dbt_cloud_jobs.diff import FieldDiff, canonicalize_job_definition, get_field_diffs
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.sync_job import DbtCloudJobIndex, merge_with_existing_job
+from dbt_cloud_jobs.validator import DbtCloudJobDefinition
+from dbt_cloud_jobs.yaml_helpers import yaml_safe_dump
+
+# Number of jobs returned per request when listing the jobs in a project
+LIST_PAGE_SIZE = 100
+
+
+class JobAction(BaseModel):
+    """
+    The action `--sync` would take for a single dbt Cloud job.
+    """
+
+    account_id: int
+    action: Literal["create", "delete", "unchanged", "update"]
+    changes: List[FieldDiff] = Field(
+        default=[],
+        description="The fields that differ between the job in dbt Cloud and the YML file.",
+    )
+    diff: Optional[str] = Field(
+        default=None,
+        description="Unified diff between the job in dbt Cloud and the job after the action, in YML.",
+    )
+    id: Optional[int] = Field(
+        default=None, description="The id of the dbt Cloud job, None for jobs to be created."
+    )
+    name: str
+    project_id: int
+
+
+class JobPlan(BaseModel):
+    """
+    The full set of actions `--sync` would take, along with the number of requests it would send to the dbt Cloud API.
+    """
+
+    actions: List[JobAction]
+    api_calls: int = Field(
+        description="Predicted number of requests sent to the dbt Cloud API when applying this plan, excluding retries."
+    )
+
+    def count(self, action: str) -> int:
+        return len([x for x in self.actions if x.action == action])
+
+    def log(self) -> None:
+        symbols = {"create": "+", "delete": "-", "update": "~"}
+        for job_action in self.actions:
+            if job_action.action == "unchanged":
+                continue
+
+            logger.info(
+                f"{symbols[job_action.action]} {job_action.action} job `{job_action.name}` (id: {job_action.id})"
+            )
+            if job_action.diff:
+                logger.info(f"\n{job_action.diff}")
+
+        logger.info(
+            f"Plan: {self.count('create')} to create, {self.count('update')} to update, {self.count('delete')} to delete, {self.count('unchanged')} unchanged. Applying this plan sends {self.api_calls} request(s) to the dbt Cloud API."
+        )
+
+    def write(self, path: Path) -> None:
+        logger.info(f"Saving plan to `{path}`...")
+        with Path.open(path, "w") as f:
+            f.write(self.model_dump_json(indent=2))
+            f.write("\n")
+
+
+def diff_job_definitions(
+    name: str,
+    before: Optional[DbtCloudJobDefinition],
+    after: Optional[DbtCloudJobDefinition],
+) -> str:
+    """
+    Returns a unified diff of the canonical forms of two job definitions, each dumped to YML with sorted keys.
+    """
+
+    return "".join(
+        difflib.unified_diff(
+            (
+                yaml_safe_dump(canonicalize_job_definition(before), sort_keys=True).splitlines(
+                    keepends=True
+                )
+                if before
+                else []
+            ),
+            (
+                yaml_safe_dump(canonicalize_job_definition(after), sort_keys=True).splitlines(
+                    keepends=True
+                )
+                if after
+                else []
+            ),
+            fromfile=f"dbt Cloud: {name}",
+            tofile=f"YML: {name}",
+        )
+    )
+
+
+def plan_job_actions(
+    definitions: Iterable[DbtCloudJobDefinition],
+    definitions_to_sync: Iterable[DbtCloudJobDefinition],
+    job_indexes: Dict[Tuple[int, int], DbtCloudJobIndex],
+    listed_projects: Iterable[Tuple[int, int]],
+    jobs_to_delete: Iterable[Tuple[DbtCloudJobDefinition, DbtCloudJobIndex]],
+) -> JobPlan:
+    """
+    Compute the actions `--sync` would take, using the same comparison as `sync_dbt_cloud_job`.
+    Updates list the fields that changed, ignoring fields managed by dbt Cloud and volatile fields.
+    No request is sent to the dbt Cloud API and neither the definitions nor the indexes are modified.
+
+    Args:
+        definitions (Iterable[DbtCloudJobDefinition]): All job definitions in the YML file.
+        definitions_to_sync (Iterable[DbtCloudJobDefinition]): The definitions `--sync` would compare with dbt Cloud, other definitions are unchanged.
+        job_indexes (Dict[Tuple[int, int], DbtCloudJobIndex]): Existing jobs of every project.
+        listed_projects (Iterable[Tuple[int, int]]): The (account_id, project_id) pairs `--sync` would list.
+        jobs_to_delete (Iterable[Tuple[DbtCloudJobDefinition, DbtCloudJobIndex]]): Jobs `--sync` would delete.
+
+    Returns:
+        JobPlan
+    """
+
+    # Listing the jobs in a project takes at least one request, then one per page
+    api_calls = sum(
+        max(1, math.ceil(len(job_indexes[project]) / LIST_PAGE_SIZE))
+        for project in set(listed_projects)
+    )
+
+    actions: List[JobAction] = []
+    names_to_sync = {x["name"] for x in definitions_to_sync}
+    for definition in definitions:
+        job_index = job_indexes.get((definition["account_id"], definition["project_id"]))
+        existing_definition = job_index.get(definition["name"]) if job_index else None
+        changes: List[FieldDiff] = []
+        if definition["name"] not in names_to_sync:
+            action, diff = "unchanged", None
+        elif existing_definition is None:
+            action, diff = "create", diff_job_definitions(definition["name"], None, definition)
+        else:
+            updated_definition = merge_with_existing_job(definition, existing_definition)
+            changes = get_field_diffs(existing_definition, updated_definition)
+            if not changes:
+                action, diff = "unchanged", None
+            else:
+                action = "update"
+                diff = diff_job_definitions(
+                    definition["name"], existing_definition, updated_definition
+                )
+
+        actions.append(
+            JobAction(
+                account_id=definition["account_id"],
+                action=action,  # type: ignore[arg-type]
+                changes=changes,
+                diff=diff,
+                id=existing_definition["id"] if existing_definition else None,
+                name=definition["name"],
+                project_id=definition["project_id"],
+            )
+        )
+
+    for job, _ in jobs_to_delete:
+        actions.append(
+            JobAction(
+                account_id=job["account_id"],
+                action="delete",
+                diff=diff_job_definitions(job["name"], job, None),
+                id=job["id"],
+                name=job["name"],
+                project_id=job["project_id"],
+            )
+        )
+
+    api_calls += len([x for x in actions if x.action != "unchanged"])
+    return JobPlan(actions=actions, api_calls=api_calls)
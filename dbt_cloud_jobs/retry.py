@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class TokenBucket:
+    """
+    A client-side rate limiter, allowing at most `rate` requests per second with bursts of up to
+    `capacity` requests. Safe to use from several threads.
+
+    Args:
+        rate (float): Number of tokens added to the bucket per second.
+        capacity (Optional[float], optional): Maximum number of tokens in the bucket. Defaults to `rate`.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, waiting until one is available.
+
+        Tokens are reserved before waiting so concurrent callers are served in the order they arrive.
+
+        Returns:
+            float: Number of seconds spent waiting.
+        """
+
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+        return wait_seconds
+
+    def reserve(self) -> float:
+        """
+        Take a token from the bucket without waiting, e.g. for callers that wait on an event loop.
+
+        Returns:
+            float: Number of seconds to wait before the token can be used.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+def get_backoff_seconds(
+    attempt: int,
+    base_seconds: float,
+    max_seconds: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Number of seconds to wait before retrying a request, using exponential backoff with full jitter.
+
+    A `Retry-After` value sent by dbt Cloud is always honoured, even when larger than `max_seconds`.
+
+    Args:
+        attempt (int): Number of attempts already made, starting at 0.
+        base_seconds (float): Backoff before jitter is applied to the first retry.
+        max_seconds (float): Upper bound of the backoff before jitter is applied.
+        retry_after (Optional[float], optional): Value of the `Retry-After` header in seconds.
+
+    Returns:
+        float
+    """
+
+    backoff_seconds = random.uniform(0, min(max_seconds, base_seconds * 2**attempt))
+    if retry_after is not None:
+        return max(retry_after, backoff_seconds)
+
+    return backoff_seconds
+
+
+@lru_cache
+def get_token_bucket(requests_per_second: float) -> TokenBucket:
+    """
+    Returns a token bucket shared by every request sent at the same rate limit.
+    """
+
+    return TokenBucket(rate=requests_per_second)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse the value of a `Retry-After` header, either a number of seconds or an HTTP date.
+
+    Returns:
+        Optional[float]: Number of seconds to wait, None if the value cannot be parsed.
+    """
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
@@ -0,0 +1,115 @@
+import os
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+ENV_VAR_PREFIX = "DBT_CLOUD_JOBS_"
+
+
+class DbtCloudApiSettings(BaseModel):
+    """
+    Settings used when calling the dbt Cloud API.
+
+    Every setting can be set via an environment variable named after the setting, prefixed
+    with `DBT_CLOUD_JOBS_`, e.g. `DBT_CLOUD_JOBS_MAX_RETRIES`. CLI flags take precedence.
+    """
+
+    connect_timeout: float = Field(
+        default=10,
+        description="Number of seconds to wait for a connection to dbt Cloud to be established.",
+        gt=0,
+    )
+    deadline_seconds: Optional[float] = Field(
+        default=None,
+        description="Maximum number of seconds a whole run may spend, requests fail once it is exceeded. No deadline when not set.",
+        gt=0,
+    )
+    gzip: bool = Field(
+        default=True,
+        description="Ask dbt Cloud to compress responses with gzip.",
+    )
+    keep_alive: bool = Field(
+        default=True,
+        description="Re-use connections to dbt Cloud across requests.",
+    )
+    max_retries: int = Field(
+        default=5,
+        description="Maximum number of times a request is retried after a 429, a 5xx or a connection error.",
+        ge=0,
+    )
+    pool_size: int = Field(
+        default=10,
+        description="Maximum number of connections to dbt Cloud kept open for re-use.",
+        gt=0,
+    )
+    read_timeout: float = Field(
+        default=60,
+        description="Number of seconds to wait for dbt Cloud to send data before giving up on a request.",
+        gt=0,
+    )
+    requests_per_second: Optional[float] = Field(
+        default=None,
+        description="Maximum number of requests sent to the dbt Cloud API per second, unlimited when not set.",
+        gt=0,
+    )
+    retry_backoff_seconds: float = Field(
+        default=1,
+        description="Base number of seconds to wait before retrying a request, doubled after every attempt.",
+        ge=0,
+    )
+    retry_backoff_max_seconds: float = Field(
+        default=60,
+        description="Maximum number of seconds to wait before retrying a request.",
+        ge=0,
+    )
+
+
+api_settings: Optional[DbtCloudApiSettings] = None
+
+
+def configure_api_settings(**overrides) -> DbtCloudApiSettings:
+    """
+    Override the settings used when calling the dbt Cloud API, overrides with a value of None are ignored.
+
+    Returns:
+        DbtCloudApiSettings: The updated settings.
+    """
+
+    global api_settings
+    api_settings = DbtCloudApiSettings(
+        **{
+            **get_api_settings().model_dump(),
+            **{k: v for k, v in overrides.items() if v is not None},
+        }
+    )
+    return api_settings
+
+
+def get_api_settings() -> DbtCloudApiSettings:
+    """
+    Returns the settings used when calling the dbt Cloud API, read from environment variables on first use.
+
+    Returns:
+        DbtCloudApiSettings
+    """
+
+    global api_settings
+    if api_settings is None:
+        # Values are read as strings and converted to the type of their field by pydantic
+        api_settings = DbtCloudApiSettings.model_validate(
+            {
+                name: os.environ[f"{ENV_VAR_PREFIX}{name.upper()}"]
+                for name in DbtCloudApiSettings.model_fields
+                if os.getenv(f"{ENV_VAR_PREFIX}{name.upper()}")
+            }
+        )
+    return api_settings
+
+
+def reset_api_settings() -> None:
+    """
+    Discard any configured settings, they will be read from environment variables on next use.
+    """
+
+    global api_settings
+    api_settings = None
@@ -0,0 +1,136 @@
+import hashlib
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from pydantic import BaseModel, Field
+
+from dbt_cloud_jobs.exceptions import DbtCloudJobsInvalidArguments
+from dbt_cloud_jobs.lockfile import LOCKFILE_FORMAT_VERSION, Lockfile
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.validator import DbtCloudJobDefinition
+
+SHARD_PATTERN = re.compile(r"^(?P<index>\d+)/(?P<total>\d+)$")
+
+
+class Shard(BaseModel):
+    """
+    One of `total` partitions of the jobs in the YML file, `index` starts at 1.
+    """
+
+    index: int
+    total: int
+
+    @property
+    def deletes_jobs(self) -> bool:
+        """
+        Only the first shard deletes jobs, as it is the only one to look for jobs no longer
+        present in the YML file.
+        """
+
+        return self.index == 1
+
+    def contains(self, name: str) -> bool:
+        return get_job_shard_index(name, total=self.total) == self.index
+
+    def select(self, definitions: Iterable[DbtCloudJobDefinition]) -> List[DbtCloudJobDefinition]:
+        return [x for x in definitions if self.contains(x["name"])]
+
+
+class ShardReport(BaseModel):
+    """
+    The jobs applied by a single shard of `--sync`. Once every shard has run, the reports are
+    merged into the lockfile with `--merge-shard-reports`.
+    """
+
+    index: int
+    jobs: Dict[str, Dict[str, Any]] = Field(
+        description="Locked jobs of the shard, keyed by job name, as written to the lockfile."
+    )
+    synced: int = Field(description="Number of jobs compared with dbt Cloud by the shard.")
+    total: int
+    version: int = LOCKFILE_FORMAT_VERSION
+
+    def write(self, path: Path) -> None:
+        logger.info(f"Saving report of shard {self.index}/{self.total} to `{path}`...")
+        with Path.open(path, "w") as f:
+            f.write(self.model_dump_json(indent=2))
+            f.write("\n")
+
+
+def get_job_shard_index(name: str, total: int) -> int:
+    """
+    Returns the shard of a job, from 1 to `total`. Unlike `hash()`, the hash of the name is the same
+    in every process, so every runner agrees on the partition.
+    """
+
+    return int.from_bytes(hashlib.sha256(name.encode("utf-8")).digest()[:8], "big") % total + 1
+
+
+def get_shard_report_path(lockfile_path: Path, shard: Shard) -> Path:
+    """
+    Returns the default location of the report of a shard, e.g.
+    `dbt_cloud_jobs.yml.lock.shard-1-of-4.json`.
+    """
+
+    return lockfile_path.with_name(
+        f"{lockfile_path.name}.shard-{shard.index}-of-{shard.total}.json"
+    )
+
+
+def merge_shard_reports(reports: List[ShardReport], lockfile_path: Path) -> Lockfile:
+    """
+    Merge the reports of every shard of a `--sync` into a lockfile.
+
+    Raises:
+        DbtCloudJobsInvalidArguments: When reports are missing, duplicated, from syncs with a
+            different number of shards or written by another version.
+
+    Returns:
+        Lockfile
+    """
+
+    totals = {x.total for x in reports}
+    if len(totals) != 1:
+        raise DbtCloudJobsInvalidArguments(
+            f"Shard reports must come from the same number of shards, found: {', '.join(str(x) for x in sorted(totals))}."
+        )
+    if any(x.version != LOCKFILE_FORMAT_VERSION for x in reports):
+        raise DbtCloudJobsInvalidArguments("Shard reports were written by another version.")
+
+    total = totals.pop()
+    indexes = sorted(x.index for x in reports)
+    if indexes != list(range(1, total + 1)):
+        raise DbtCloudJobsInvalidArguments(
+            f"Expected one report for each of the {total} shard(s), found reports of shard(s): {', '.join(str(x) for x in indexes)}."
+        )
+
+    jobs: Dict[str, Dict[str, Any]] = {}
+    for report in reports:
+        jobs.update(report.jobs)
+
+    logger.info(
+        f"Merged the reports of {total} shard(s): {sum(x.synced for x in reports)} job(s) synced, {len(jobs)} job(s) locked."
+    )
+    return Lockfile(path=lockfile_path, jobs=jobs)
+
+
+def parse_shard(value: str) -> Shard:
+    """
+    Parse the value of `--shard`, e.g. "2/4" for the second of four shards.
+
+    Raises:
+        DbtCloudJobsInvalidArguments: When the value is not in the INDEX/TOTAL format, with
+            1 <= INDEX <= TOTAL.
+
+    Returns:
+        Shard
+    """
+
+    match = SHARD_PATTERN.match(str(value).strip())
+    if match is None or not 1 <= int(match["index"]) <= int(match["total"]):
+        raise DbtCloudJobsInvalidArguments(
+            f"`--shard` must be INDEX/TOTAL with 1 <= INDEX <= TOTAL, e.g. 1/4, got: {value}."
+        )
+
+    return Shard(index=int(match["index"]), total=int(match["total"]))
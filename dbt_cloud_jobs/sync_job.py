@@ -1,44 +1,346 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from dbt_cloud_jobs.cache import JobListingCache
 from dbt_cloud_jobs.dbt_api_helpers import (
-    call_dbt_cloud_api,
-    create_dbt_cloud_job,
+    ApiCall,
+    ApiSteps,
+    ListJobs,
+    create_and_get_dbt_cloud_job_steps,
+    create_requests_session,
+    delete_dbt_cloud_job_steps,
     list_dbt_cloud_jobs,
+    run_api_steps,
 )
+from dbt_cloud_jobs.diff import get_field_diffs
+from dbt_cloud_jobs.exceptions import DbtCloudJobsSyncError
 from dbt_cloud_jobs.logger import logger
 from dbt_cloud_jobs.utils import merge_job_definitions
 from dbt_cloud_jobs.validator import DbtCloudJobDefinition
 
 
-def sync_dbt_cloud_job(definition: DbtCloudJobDefinition) -> None:
-    existing_jobs = list_dbt_cloud_jobs(
-        account_id=definition["account_id"], project_id=definition["project_id"]
-    )
+class DbtCloudJobIndex:
+    """
+    An in-memory snapshot of the dbt Cloud jobs in a single project, indexed by name and id.
+    Safe to update from several threads, `mutated` is set once a job is added or removed after
+    the index is built.
+    """
 
-    # Jobs that are new or need updating
-    if definition["name"] in [job["name"] for job in existing_jobs]:
-        logger.info(f"Job `{definition['name']}` already exists, updating...")
+    def __init__(self, account_id: int, project_id: int, jobs: Iterable[DbtCloudJobDefinition]):
+        self.account_id = account_id
+        self.project_id = project_id
+        self.lock = threading.Lock()
+        self.jobs_by_id: Dict[int, DbtCloudJobDefinition] = {}
+        self.jobs_by_name: Dict[str, DbtCloudJobDefinition] = {}
+        for job in jobs:
+            self.add(job)
+        self.mutated = False
 
-        existing_definition = [x for x in existing_jobs if x["name"] == definition["name"]][0]
-        logger.debug(f"{existing_definition=}")
+    def __contains__(self, name: str) -> bool:
+        return name in self.jobs_by_name
 
-        # definitions in YML may not contain id values, need to set manually to avoid comparison never returning True
-        if not definition.get("id"):
-            definition["id"] = existing_definition["id"]
+    def __len__(self) -> int:
+        return len(self.jobs_by_id)
 
-        updated_definition = merge_job_definitions(existing_definition, definition)
-        logger.debug(f"{updated_definition=}")
-        if updated_definition == existing_definition:
-            logger.info(
-                f"Definition of job `{existing_definition['name']}` (id: {existing_definition['id']}) has not changed, will not be updated."
+    def add(self, job: DbtCloudJobDefinition) -> None:
+        """
+        Add a job to the index, replacing any job with the same id. When several jobs share a
+        name, the name refers to the first job added.
+        """
+        with self.lock:
+            previous_job = self.jobs_by_id.get(job["id"])
+            if previous_job is not None and previous_job["name"] != job["name"]:
+                self.pop_name(previous_job)
+
+            self.jobs_by_id[job["id"]] = job
+            named_job = self.jobs_by_name.setdefault(job["name"], job)
+            if named_job["id"] == job["id"]:
+                self.jobs_by_name[job["name"]] = job
+            else:
+                logger.warning(
+                    "Jobs %s and %s of project %s are both named `%s`, only job %s is synced.",
+                    named_job["id"],
+                    job["id"],
+                    self.project_id,
+                    job["name"],
+                    named_job["id"],
+                )
+            self.mutated = True
+
+    def get(self, name: str) -> Optional[DbtCloudJobDefinition]:
+        return self.jobs_by_name.get(name)
+
+    def jobs(self) -> List[DbtCloudJobDefinition]:
+        with self.lock:
+            return list(self.jobs_by_id.values())
+
+    def pop_name(self, job: DbtCloudJobDefinition) -> None:
+        """
+        Remove the name of a job from the index, unless the name refers to another job.
+        """
+        named_job = self.jobs_by_name.get(job["name"])
+        if named_job is not None and named_job["id"] == job["id"]:
+            del self.jobs_by_name[job["name"]]
+
+    def remove(self, job: DbtCloudJobDefinition) -> None:
+        with self.lock:
+            removed_job = self.jobs_by_id.pop(job["id"], None)
+            if removed_job is not None:
+                self.pop_name(removed_job)
+                self.mutated = True
+
+
+def build_job_indexes(
+    definitions: Iterable[DbtCloudJobDefinition],
+    cache: Optional[JobListingCache] = None,
+) -> Dict[Tuple[int, int], DbtCloudJobIndex]:
+    """
+    List the existing dbt Cloud jobs once for every (account_id, project_id) pair referenced in the definitions.
+
+    Args:
+        definitions (Iterable[DbtCloudJobDefinition])
+        cache (Optional[JobListingCache], optional): Cache of previous listings. Defaults to None.
+
+    Returns:
+        Dict[Tuple[int, int], DbtCloudJobIndex]: One index per (account_id, project_id).
+    """
+    job_indexes: Dict[Tuple[int, int], DbtCloudJobIndex] = {}
+    for account_id, project_id in sorted(
+        {(x["account_id"], x["project_id"]) for x in definitions}
+    ):
+        job_indexes[(account_id, project_id)] = DbtCloudJobIndex(
+            account_id=account_id,
+            project_id=project_id,
+            jobs=(cache.list_dbt_cloud_jobs if cache else list_dbt_cloud_jobs)(
+                account_id=account_id, project_id=project_id
+            ),
+        )
+
+    return job_indexes
+
+
+def store_job_indexes(
+    job_indexes: Iterable[DbtCloudJobIndex], cache: Optional[JobListingCache]
+) -> None:
+    """
+    Write the jobs of every mutated index back to the cache, so a later run within the TTL of the
+    cache sees the jobs created, updated and deleted by this run.
+
+    Args:
+        job_indexes (Iterable[DbtCloudJobIndex])
+        cache (Optional[JobListingCache]): Cache of previous listings, nothing is written when None.
+    """
+    if cache is None:
+        return
+
+    for job_index in job_indexes:
+        if job_index.mutated:
+            cache.store(
+                path=cache.get_path(
+                    account_id=job_index.account_id, project_id=job_index.project_id
+                ),
+                jobs=sorted(job_index.jobs(), key=lambda x: x["id"]),
             )
-        else:
-            call_dbt_cloud_api(
+
+
+def delete_indexed_dbt_cloud_job(job: DbtCloudJobDefinition, job_index: DbtCloudJobIndex) -> None:
+    """
+    Delete a dbt Cloud job and remove it from the index of its project.
+    """
+    run_api_steps(delete_indexed_dbt_cloud_job_steps(job=job, job_index=job_index))
+
+
+def delete_indexed_dbt_cloud_job_steps(
+    job: DbtCloudJobDefinition, job_index: DbtCloudJobIndex
+) -> ApiSteps[None]:
+    """
+    Steps of `delete_indexed_dbt_cloud_job`.
+    """
+    yield from delete_dbt_cloud_job_steps(definition=job)
+    job_index.remove(job)
+
+
+def run_job_actions(
+    actions: Iterable[Tuple[str, Callable[[], None]]], max_workers: int, operation: str
+) -> None:
+    """
+    Run independent actions (i.e. creating, updating or deleting a single job) concurrently.
+
+    Every action is run, even when some fail. All failures are logged and summarised in a single
+    exception raised once every action has completed.
+
+    Args:
+        actions (Iterable[Tuple[str, Callable[[], None]]]): Pairs of job name and action to run.
+        max_workers (int): Maximum number of actions running at the same time.
+        operation (str): Name of the operation, used in log messages.
+
+    Raises:
+        DbtCloudJobsSyncError: When at least one action raised an exception.
+    """
+
+    actions = list(actions)
+    if not actions:
+        return
+
+    # Create the shared requests session before starting the workers so they all re-use one connection pool
+    create_requests_session()
+
+    failures: List[Tuple[str, BaseException]] = []
+    futures: Dict[Future[None], str] = {}
+
+    def collect(done: Iterable[Future[None]]) -> None:
+        for future in done:
+            name = futures.pop(future)
+            exception = future.exception()
+            if exception is not None:
+                logger.error(f"Failed to {operation} job `{name}`: {exception}")
+                failures.append((name, exception))
+
+    workers = max(1, min(max_workers, len(actions)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=operation) as executor:
+        # At most two actions per worker are queued at any time, so large operations (e.g.
+        # deleting thousands of jobs) do not hold a pending future for every job
+        for name, action in actions:
+            if len(futures) >= 2 * workers:
+                collect(wait(futures, return_when=FIRST_COMPLETED).done)
+            futures[executor.submit(action)] = name
+        collect(wait(futures).done)
+
+    raise_for_failed_job_actions(failures=failures, action_count=len(actions), operation=operation)
+
+
+def run_job_steps(
+    steps: Iterable[Tuple[str, ApiSteps[None]]], max_workers: int, operation: str
+) -> None:
+    """
+    Run the steps of independent actions (e.g. `sync_dbt_cloud_job_steps`) from a pool of
+    threads, see `run_job_actions`.
+
+    Args:
+        steps (Iterable[Tuple[str, ApiSteps[None]]]): Pairs of job name and steps of the action to run.
+        max_workers (int): Maximum number of actions running at the same time.
+        operation (str): Name of the operation, used in log messages.
+
+    Raises:
+        DbtCloudJobsSyncError: When at least one action raised an exception.
+    """
+
+    run_job_actions(
+        actions=((name, partial(run_api_steps, x)) for name, x in steps),
+        max_workers=max_workers,
+        operation=operation,
+    )
+
+
+def merge_with_existing_job(
+    definition: DbtCloudJobDefinition, existing_definition: DbtCloudJobDefinition
+) -> DbtCloudJobDefinition:
+    """
+    Merge a job definition from the YML file into the definition of the existing dbt Cloud job,
+    the result has no field diffs with the existing definition when the job has not changed.
+    Neither definition is modified.
+
+    Returns:
+        DbtCloudJobDefinition
+    """
+
+    # definitions in YML may not contain id values, need to set manually to avoid comparison never returning True
+    if not definition.get("id"):
+        definition = {**definition, "id": existing_definition["id"]}  # type: ignore[assignment]
+
+    return merge_job_definitions(existing_definition, definition)
+
+
+def raise_for_failed_job_actions(
+    failures: List[Tuple[str, BaseException]], action_count: int, operation: str
+) -> None:
+    """
+    Raise a single exception summarising every failed action, if any.
+
+    Raises:
+        DbtCloudJobsSyncError
+    """
+
+    if failures:
+        summary = "\n".join(
+            f"  - `{name}`: {exception}"
+            for name, exception in sorted(failures, key=lambda x: x[0])
+        )
+        raise DbtCloudJobsSyncError(
+            f"Failed to {operation} {len(failures)} of {action_count} job(s):\n{summary}"
+        )
+
+
+def get_updated_job_definition(
+    definition: DbtCloudJobDefinition, existing_definition: DbtCloudJobDefinition
+) -> Optional[DbtCloudJobDefinition]:
+    """
+    Merge a job definition from the YML file into the definition of the existing dbt Cloud job.
+
+    Returns:
+        Optional[DbtCloudJobDefinition]: The merged definition, None if the job has not changed.
+    """
+
+    logger.info(f"Job `{definition['name']}` already exists, updating...")
+    logger.debug("existing_definition=%r", existing_definition)
+
+    updated_definition = merge_with_existing_job(definition, existing_definition)
+    logger.debug("updated_definition=%r", updated_definition)
+    field_diffs = get_field_diffs(existing_definition, updated_definition)
+    if not field_diffs:
+        logger.info(
+            f"Definition of job `{existing_definition['name']}` (id: {existing_definition['id']}) has not changed, will not be updated."
+        )
+        return None
+
+    logger.info(
+        f"Definition of job `{existing_definition['name']}` (id: {existing_definition['id']}) has changed: "
+        + ", ".join(f"`{x.path}` ({x.before!r} -> {x.after!r})" for x in field_diffs)
+    )
+    return updated_definition
+
+
+def sync_dbt_cloud_job(
+    definition: DbtCloudJobDefinition, job_index: Optional[DbtCloudJobIndex] = None
+) -> None:
+    run_api_steps(sync_dbt_cloud_job_steps(definition=definition, job_index=job_index))
+
+
+def sync_dbt_cloud_job_steps(
+    definition: DbtCloudJobDefinition, job_index: Optional[DbtCloudJobIndex] = None
+) -> ApiSteps[None]:
+    """
+    Steps of `sync_dbt_cloud_job`, run by both `run_job_steps` and `async_dbt_api_helpers.run_job_steps`.
+    """
+    if job_index is None:
+        job_index = DbtCloudJobIndex(
+            account_id=definition["account_id"],
+            project_id=definition["project_id"],
+            jobs=(
+                yield ListJobs(
+                    account_id=definition["account_id"], project_id=definition["project_id"]
+                )
+            ),
+        )
+
+    # Jobs that are new or need updating
+    existing_definition = job_index.get(definition["name"])
+    if existing_definition is not None:
+        updated_definition = get_updated_job_definition(definition, existing_definition)
+        if updated_definition is not None:
+            r = yield ApiCall(
                 method="post",
                 endpoint=f"accounts/{updated_definition['account_id']}/jobs/{updated_definition['id']}",
                 payload=updated_definition,
             )
+            job_index.add(r.get("data") or updated_definition)
             logger.info(
                 f"Updated dbt Cloud job, URL: https://cloud.getdbt.com/deploy/{definition['account_id']}/projects/{updated_definition['project_id']}/jobs/{updated_definition['id']}"
             )
     else:
         logger.info(f"Job `{definition['name']}` does not exist, creating...")
-        create_dbt_cloud_job(definition=definition)
+        # dbt Cloud's copy of the job, with the fields it sets (e.g. `updated_at`), is indexed so
+        # the lockfile and the cache of listings hold the same job as a listing would
+        job_index.add((yield from create_and_get_dbt_cloud_job_steps(definition=definition)))
@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple
+
+from dbt_cloud_jobs.logger import logger
+
+
+class Span(NamedTuple):
+    """
+    A named phase of a run, e.g. `validate`, with its wall and CPU time.
+
+    The start is a Unix timestamp so spans recorded in other processes (e.g. when validating
+    several files in parallel) can be merged. CPU time is the CPU time of the whole process
+    during the span, including other threads.
+    """
+
+    name: str
+    start: float
+    wall_seconds: float
+    cpu_seconds: float
+    pid: int
+    tid: int
+
+
+@contextmanager
+def record_span(name: str, spans: List[Span]) -> Iterator[None]:
+    """
+    Time the body of the `with` statement and append it to `spans`, even when it raises.
+    """
+
+    start, start_wall, start_cpu = time.time(), time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        spans.append(
+            Span(
+                name=name,
+                start=start,
+                wall_seconds=time.perf_counter() - start_wall,
+                cpu_seconds=time.process_time() - start_cpu,
+                pid=os.getpid(),
+                tid=threading.get_ident(),
+            )
+        )
+
+
+class Tracer:
+    """
+    Collects the spans of a run, exported in the Chrome trace event format, see
+    https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.spans: List[Span] = []
+
+    def add(self, spans: Iterable[Span]) -> None:
+        with self.lock:
+            self.spans.extend(spans)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        spans: List[Span] = []
+        try:
+            with record_span(name, spans=spans):
+                yield
+        finally:
+            self.add(spans)
+
+    def log(self) -> None:
+        for span in sorted(self.spans, key=lambda x: x.start):
+            logger.debug(
+                "Phase `%s`: %.1fms wall, %.1fms CPU",
+                span.name,
+                span.wall_seconds * 1000,
+                span.cpu_seconds * 1000,
+            )
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        started_at = min((x.start for x in self.spans), default=0)
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "args": {"cpu_ms": round(x.cpu_seconds * 1000, 3)},
+                    "dur": round(x.wall_seconds * 1e6),
+                    "name": x.name,
+                    "ph": "X",
+                    "pid": x.pid,
+                    "tid": x.tid,
+                    "ts": round((x.start - started_at) * 1e6),
+                }
+                for x in sorted(self.spans, key=lambda x: x.start)
+            ],
+        }
+
+    def write(self, path: Path) -> None:
+        logger.info(f"Saving trace to `{path}`...")
+        with Path.open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f, indent=2)
+            f.write("\n")
+
+
+tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return tracer
+
+
+def reset_tracer() -> None:
+    """
+    Discard all recorded spans, e.g. at the start of a run.
+    """
+
+    global tracer
+    tracer = Tracer()
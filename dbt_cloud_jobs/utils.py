@@ -1,9 +1,16 @@
 import sys
-from collections.abc import MutableMapping
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
+from itertools import islice
+from typing import Callable, Deque, Iterable, Iterator, TypeVar
 
 from dbt_cloud_jobs.validator import DbtCloudJobDefinition
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 @lru_cache
 def job_prefix() -> str:
@@ -22,14 +29,48 @@ def merge_job_definitions(
     Takes 2 job definitions as inputs, the values in the second job are merged into the first,
     i.e. second job overwrites equivalent keys in the first job.
 
+    Neither input is modified, so this is safe to call concurrently on shared definitions. Nested
+    dicts are only copied when a value in them changes, the merged job shares all other sub-trees
+    with the inputs (and is the first job itself when nothing changes), so treat it as read-only.
+
     Returns:
         DbtCloudJobDefinition: A single job.
     """
-    for k, v in job_def_1.items():
-        if k in job_def_2:
-            if all(isinstance(e, MutableMapping) for e in (v, job_def_2[k])):
-                job_def_2[k] = merge_job_definitions(v, job_def_2[k])
-
-    merged_job = job_def_1.copy()
-    merged_job.update(job_def_2)
-    return merged_job
+    merged_job = None
+    for k, v in job_def_2.items():
+        if k in job_def_1:
+            existing_value = job_def_1[k]
+            if isinstance(existing_value, Mapping) and isinstance(v, Mapping):
+                v = merge_job_definitions(existing_value, v)  # type: ignore[arg-type]
+
+            # Comparing types first avoids treating e.g. 1 and True as the same value
+            if v is existing_value or (type(v) is type(existing_value) and v == existing_value):
+                continue
+
+        if merged_job is None:
+            merged_job = dict(job_def_1)
+        merged_job[k] = v
+
+    return job_def_1 if merged_job is None else merged_job  # type: ignore[return-value]
+
+
+def map_concurrently(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    """
+    Like `ThreadPoolExecutor.map`, results are yielded in the order of `items`. Unlike
+    `ThreadPoolExecutor.map`, at most `max_workers` items are started ahead of the result being
+    consumed, so memory use does not grow with the number of items.
+
+    Yields:
+        R: The result of `func` for every item.
+    """
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: Deque[Future[R]] = deque(
+            executor.submit(func, item) for item in islice(items, max_workers)
+        )
+        while futures:
+            result = futures.popleft().result()
+            for item in islice(items, 1):
+                futures.append(executor.submit(func, item))
+            yield result
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from dbt_cloud_jobs import validator
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.validator import DbtCloudJobDefinitionsFile, JobDefinitionFileResult
+from dbt_cloud_jobs.version import version
+
+VALIDATION_CACHE_FORMAT_VERSION = 1
+
+
+class ValidationCache:
+    """
+    An on-disk record of the files and jobs that passed `--validate`, stored as `validation.json`
+    in `--cache-dir`.
+
+    Files are keyed by the hash of their content and jobs by the hash of their definition, so an
+    unchanged file is not parsed again and only the edited jobs of a changed file are validated.
+    The cache is discarded when it was written by another version of `dbt_cloud_jobs`, for
+    another schema of the job definitions or by another source of `validator.py`.
+
+    Args:
+        path (Path): Location of the cache.
+        files (Dict[str, Dict[str, Any]]): Valid files, keyed by the hash of their content.
+        job_hashes (Dict[str, None]): Hashes of valid jobs, oldest first.
+        max_files (int, optional): The oldest files are evicted once the cache holds more. Defaults to 1,000.
+        max_jobs (int, optional): The oldest jobs are evicted once the cache holds more. Defaults to 100,000.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        files: Dict[str, Dict[str, Any]],
+        job_hashes: Dict[str, None],
+        max_files: int = 1_000,
+        max_jobs: int = 100_000,
+    ):
+        self.path = path
+        self.files = files
+        self.job_hashes = job_hashes
+        self.max_files = max_files
+        self.max_jobs = max_jobs
+
+    @classmethod
+    def load(cls, cache_dir: Path) -> "ValidationCache":
+        """
+        Read the validation cache in `cache_dir`, an empty cache is returned if it does not exist,
+        cannot be read or is stale.
+
+        Returns:
+            ValidationCache
+        """
+
+        path = Path(cache_dir) / "validation.json"
+        try:
+            with Path.open(path, "r") as f:
+                content = json.load(f)
+        except FileNotFoundError:
+            return cls(path=path, files={}, job_hashes={})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring validation cache `{path}` as it cannot be read: {e}")
+            return cls(path=path, files={}, job_hashes={})
+
+        if content.get("key") != get_validation_cache_key():
+            logger.debug(
+                f"Ignoring validation cache `{path}` as it was written by another version."
+            )
+            return cls(path=path, files={}, job_hashes={})
+
+        return cls(
+            path=path, files=content["files"], job_hashes=dict.fromkeys(content["job_hashes"])
+        )
+
+    def update(self, results: Iterable[JobDefinitionFileResult]) -> None:
+        """
+        Record the files and jobs of `results` as valid, evicting the oldest entries once the
+        cache is full.
+        """
+
+        for result in results:
+            if result.content_hash is None:
+                continue
+
+            # Re-insert entries so the most recently validated are evicted last
+            self.files.pop(result.content_hash, None)
+            self.files[result.content_hash] = {
+                "account_ids": result.account_ids,
+                "job_hashes": result.job_hashes,
+                "names": result.names,
+            }
+            for job_hash in result.job_hashes:
+                self.job_hashes.pop(job_hash, None)
+                self.job_hashes[job_hash] = None
+
+        for key in list(self.files)[: max(0, len(self.files) - self.max_files)]:
+            del self.files[key]
+        for key in list(self.job_hashes)[: max(0, len(self.job_hashes) - self.max_jobs)]:
+            del self.job_hashes[key]
+
+    def write(self) -> None:
+        logger.debug(f"Writing validation cache `{self.path}`...")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so the cache is never left partially written
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, delete=False, suffix=".tmp"
+        ) as f:
+            json.dump(
+                {
+                    "files": self.files,
+                    "job_hashes": list(self.job_hashes),
+                    "key": get_validation_cache_key(),
+                },
+                f,
+                default=str,
+            )
+        os.replace(f.name, self.path)
+
+
+@lru_cache
+def get_schema_hash() -> str:
+    """
+    Returns a hash of the JSON schema of `DbtCloudJobDefinitionsFile`, which changes whenever a
+    field is added, removed or altered.
+    """
+
+    return hashlib.sha256(
+        json.dumps(DbtCloudJobDefinitionsFile.model_json_schema(), sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def get_validation_cache_key() -> Dict[str, Any]:
+    return {
+        "format": VALIDATION_CACHE_FORMAT_VERSION,
+        "schema": get_schema_hash(),
+        "validator": get_validator_hash(),
+        "version": version(),
+    }
+
+
+@lru_cache
+def get_validator_hash() -> str:
+    """
+    Returns a hash of the source of `validator.py`. Validators can change without changing the
+    schema, and `version()` is not bumped between releases, e.g. when running from a checkout.
+    """
+
+    return hashlib.sha256(Path(validator.__file__).read_bytes()).hexdigest()
@@ -1,6 +1,22 @@
 import datetime
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Literal, Optional, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Union,
+)
 
 import yaml
 from pydantic import (  # type: ignore[import-not-found]
@@ -8,12 +24,22 @@ from pydantic import (  # type: ignore[import-not-found]
     ConfigDict,
     Field,
     StrictBool,
+    ValidationError,
     ValidationInfo,
     field_validator,
     model_validator,
 )
 
+from dbt_cloud_jobs.exceptions import (
+    DbtCloudJobsDuplicateJobNameError,
+    DbtCloudJobsValidationError,
+)
 from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.tracing import Span, get_tracer, record_span
+from dbt_cloud_jobs.yaml_helpers import yaml_safe_load
+
+if TYPE_CHECKING:
+    from dbt_cloud_jobs.validation_cache import ValidationCache
 
 
 class DbtCloudJobExecution(BaseModel):
@@ -118,9 +144,17 @@ class DbtCloudJobTriggers(BaseModel):
 
 
 class DbtCloudJobDefinition(BaseModel):
+    """
+    A single dbt Cloud job. Fields marked as `managed` are set by dbt Cloud (e.g. `id`) and fields
+    marked as `volatile` are derived by dbt Cloud and change without the job being edited (e.g.
+    `next_run`), neither are compared when deciding whether a job needs updating.
+    """
+
     account_id: int = Field(gt=0)
-    created_at: Optional[datetime.datetime] = None
-    cron_humanized: Optional[str] = None
+    created_at: Optional[datetime.datetime] = Field(
+        default=None, json_schema_extra={"managed": True}
+    )
+    cron_humanized: Optional[str] = Field(default=None, json_schema_extra={"volatile": True})
     dbt_version: Optional[str] = Field(
         default=None,
         description="Override the dbt version this job runs on. This will cause your job to be out of sync with the environment.",
@@ -147,7 +181,9 @@ class DbtCloudJobDefinition(BaseModel):
         default=False,
         description="Enables dbt source freshness as the first step of this job, without breaking subsequent steps. Same as `run_generate_sources`.",
     )
-    id: Optional[int] = Field(None, description="The id of the dbt Cloud job", gt=0)
+    id: Optional[int] = Field(
+        None, description="The id of the dbt Cloud job", gt=0, json_schema_extra={"managed": True}
+    )
     is_deferrable: StrictBool = False
     job_completion_trigger_condition: Optional[StrictBool] = None
     job_type: Optional[Literal["ci", "other", "scheduled"]] = None
@@ -156,11 +192,13 @@ class DbtCloudJobDefinition(BaseModel):
     name: str = Field(
         description="Consider choosing a name that's easily understood by your teammates."
     )
-    next_run: Optional[datetime.datetime] = None
-    next_run_humanized: Optional[str] = None
+    next_run: Optional[datetime.datetime] = Field(
+        default=None, json_schema_extra={"volatile": True}
+    )
+    next_run_humanized: Optional[str] = Field(default=None, json_schema_extra={"volatile": True})
     project_id: int = Field(gt=0)
-    raw_dbt_version: Optional[str] = None
-    run_failure_count: Optional[int] = Field(None, ge=0)
+    raw_dbt_version: Optional[str] = Field(default=None, json_schema_extra={"volatile": True})
+    run_failure_count: Optional[int] = Field(None, ge=0, json_schema_extra={"volatile": True})
     run_generate_sources: StrictBool = Field(
         default=False,
         description="Enables dbt source freshness as the first step of this job, without breaking subsequent steps. Same as `generate_sources`.",
@@ -173,7 +211,9 @@ class DbtCloudJobDefinition(BaseModel):
         default=False,
         description="Will run when a pull request is opened in draft mode, and subsequent commits.",
     )
-    updated_at: Optional[datetime.datetime] = None
+    updated_at: Optional[datetime.datetime] = Field(
+        default=None, json_schema_extra={"managed": True}
+    )
     model_config = ConfigDict(extra="allow")
 
     @model_validator(mode="after")
@@ -196,6 +236,14 @@ class DbtCloudJobDefinition(BaseModel):
 
         return cmd
 
+    def to_payload(self) -> Dict[str, Any]:
+        """
+        Returns the job as a JSON-compatible dict, as sent to dbt Cloud. Only fields present in
+        the YML file are included, with the types they were validated to.
+        """
+
+        return self.model_dump(mode="json", exclude_unset=True)
+
 
 class DbtCloudJobDefinitionsFile(BaseModel):
     jobs: List[DbtCloudJobDefinition]
@@ -210,10 +258,298 @@ class DbtCloudJobDefinitionsFile(BaseModel):
         return values
 
 
-def validate_job_definition_file(file: Path) -> None:
-    logger.info("Validating job definition...")
-    with Path.open(Path(file), "r") as f:
-        definitions = yaml.safe_load(f)
+def hash_content(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
 
-    DbtCloudJobDefinitionsFile(**definitions)
+def load_job_definition_file(file: Path) -> Dict[str, Any]:
+    """
+    Parse a YML file of job definitions, without validating it. Files with a `.jsonl`
+    extension, as written by `--import`, are parsed as JSON Lines.
+
+    Returns:
+        Dict[str, Any]
+    """
+
+    with Path.open(Path(file), "rb") as f:
+        return parse_job_definitions(content=f.read(), file=file)
+
+
+def parse_job_definitions(content: bytes, file: Path) -> Dict[str, Any]:
+    if Path(file).suffix == ".jsonl":
+        return {
+            "jobs": [
+                json.loads(line) for line in content.decode("utf-8").splitlines() if line.strip()
+            ]
+        }
+
+    return yaml_safe_load(content)
+
+
+def validate_job_definition_file(file: Path) -> DbtCloudJobDefinitionsFile:
+    return validate_job_definitions(definitions=load_job_definition_file(file), file=file)
+
+
+def validate_job_definitions(
+    definitions: Dict[str, Any], file: Path
+) -> DbtCloudJobDefinitionsFile:
+    """
+    Validate job definitions already parsed from `file`.
+
+    Returns:
+        DbtCloudJobDefinitionsFile: The validated definitions, use `DbtCloudJobDefinition.to_payload()` to
+            obtain the definition of a job to send to dbt Cloud.
+    """
+
+    logger.info("Validating job definition...")
+    definitions_file = DbtCloudJobDefinitionsFile(**definitions)
     logger.info(f"All jobs defined in {file} are valid.")
+    return definitions_file
+
+
+class JobDefinitionFileResult(BaseModel):
+    """
+    The outcome of loading and validating a single file of job definitions.
+    """
+
+    account_ids: List[Any] = []
+    content_hash: Optional[str] = None
+    definitions_file: Optional[DbtCloudJobDefinitionsFile] = None
+    errors: List[str] = []
+    file: Path
+    job_hashes: List[str] = []
+    names: List[Any] = []
+    spans: List[Span] = []
+
+
+def format_validation_errors(
+    error: ValidationError, definitions: Dict[str, Any], file: Path, index: Optional[int] = None
+) -> List[str]:
+    """
+    Returns one message per validation error, naming the job (and field) it applies to. Pass
+    `index` when the error was raised by validating the job at that index on its own.
+    """
+
+    messages = []
+    for x in error.errors():
+        loc = ("jobs", index, *x["loc"]) if index is not None else x["loc"]
+        if len(loc) >= 2 and loc[0] == "jobs" and isinstance(loc[1], int):
+            job = definitions["jobs"][loc[1]]
+            name = job.get("name") if isinstance(job, dict) else None
+            field = ".".join(str(x) for x in loc[2:]) or "(job)"
+            messages.append(f"`{file}`, job `{name}` (index {loc[1]}): `{field}`: {x['msg']}")
+        else:
+            messages.append(f"`{file}`: {x['msg']}")
+
+    return messages
+
+
+def hash_raw_job_definition(definition: Any) -> str:
+    return hash_content(json.dumps(definition, default=str, sort_keys=True).encode("utf-8"))
+
+
+def load_and_validate_job_definition_file(
+    file: Path,
+    cached_files: Optional[Dict[str, Dict[str, Any]]] = None,
+    cached_job_hashes: FrozenSet[str] = frozenset(),
+    validate_only: bool = False,
+) -> JobDefinitionFileResult:
+    """
+    Parse and validate a single file of job definitions, collecting errors rather than raising
+    them. Run in a separate process when several files are loaded.
+
+    When `validate_only` is True no models are returned, allowing previously validated content to
+    be skipped: a file whose content hash is in `cached_files` is not parsed, and jobs whose hash
+    is in `cached_job_hashes` are not validated again.
+
+    The time spent loading and validating the file is recorded as `load_yaml` and `validate` spans.
+
+    Returns:
+        JobDefinitionFileResult
+    """
+
+    spans: List[Span] = []
+    result = load_and_validate_file(
+        file=file,
+        cached_files=cached_files,
+        cached_job_hashes=cached_job_hashes,
+        validate_only=validate_only,
+        spans=spans,
+    )
+    result.spans = spans
+    return result
+
+
+def load_and_validate_file(
+    file: Path,
+    cached_files: Optional[Dict[str, Dict[str, Any]]],
+    cached_job_hashes: FrozenSet[str],
+    validate_only: bool,
+    spans: List[Span],
+) -> JobDefinitionFileResult:
+    with record_span("load_yaml", spans=spans):
+        try:
+            with Path.open(Path(file), "rb") as f:
+                content = f.read()
+        except OSError as e:
+            return JobDefinitionFileResult(errors=[f"`{file}`: cannot be read: {e}"], file=file)
+
+        content_hash = hash_content(content)
+        cached_file = (cached_files or {}).get(content_hash) if validate_only else None
+        if cached_file is not None:
+            logger.info(f"All jobs defined in {file} are valid, unchanged since last validated.")
+            return JobDefinitionFileResult(content_hash=content_hash, file=file, **cached_file)
+
+        try:
+            definitions = parse_job_definitions(content=content, file=file)
+        except (ValueError, yaml.YAMLError) as e:
+            return JobDefinitionFileResult(errors=[f"`{file}`: cannot be parsed: {e}"], file=file)
+
+        if (
+            not isinstance(definitions, dict)
+            or not isinstance(definitions.get("jobs"), list)
+            or not all(isinstance(x, dict) for x in definitions["jobs"])
+        ):
+            return JobDefinitionFileResult(
+                errors=[f"`{file}`: must contain a list of `jobs`."], file=file
+            )
+
+        result = JobDefinitionFileResult(
+            account_ids=[x.get("account_id") for x in definitions["jobs"]],
+            content_hash=content_hash,
+            file=file,
+            job_hashes=[hash_raw_job_definition(x) for x in definitions["jobs"]],
+            names=[x.get("name") for x in definitions["jobs"]],
+        )
+
+    with record_span("validate", spans=spans):
+        if validate_only:
+            logger.info("Validating job definition...")
+            validated_count = 0
+            for index, (job, job_hash) in enumerate(zip(definitions["jobs"], result.job_hashes)):
+                if job_hash in cached_job_hashes:
+                    continue
+
+                validated_count += 1
+                try:
+                    DbtCloudJobDefinition(**job)
+                except ValidationError as e:
+                    result.errors += format_validation_errors(
+                        e, definitions=definitions, file=file, index=index
+                    )
+
+            if len({str(x) for x in result.account_ids}) != 1:
+                result.errors.append(f"`{file}`: All jobs must have the same account_id.")
+            if not result.errors:
+                logger.info(
+                    f"All jobs defined in {file} are valid, {validated_count} job(s) validated and {len(result.job_hashes) - validated_count} unchanged since last validated."
+                )
+            return result
+
+        try:
+            result.definitions_file = validate_job_definitions(definitions=definitions, file=file)
+        except ValidationError as e:
+            result.errors = format_validation_errors(e, definitions=definitions, file=file)
+
+        return result
+
+
+def load_job_definition_files(
+    files: List[Path], cache: Optional["ValidationCache"] = None, validate_only: bool = False
+) -> Optional[DbtCloudJobDefinitionsFile]:
+    """
+    Load and validate several files of job definitions in parallel, one process per CPU, and
+    merge them. Every file is loaded even when some are invalid, so all errors are reported at once.
+
+    Args:
+        files (List[Path])
+        cache (Optional[ValidationCache], optional): Hashes of previously validated files and
+            jobs, updated once all files are valid. Defaults to None.
+        validate_only (bool, optional): Only check that the files are valid, skipping files and
+            jobs in `cache`. No models are returned. Defaults to False.
+
+    Raises:
+        DbtCloudJobsDuplicateJobNameError: When a job name is used more than once, in any of the files.
+        DbtCloudJobsValidationError: When any file or job is invalid, or the jobs are defined in more than one account.
+
+    Returns:
+        Optional[DbtCloudJobDefinitionsFile]: The jobs of all files, in the order of the files. None when `validate_only` is True.
+    """
+
+    load_file = partial(
+        load_and_validate_job_definition_file,
+        cached_files=cache.files if cache is not None else None,
+        cached_job_hashes=frozenset(cache.job_hashes) if cache is not None else frozenset(),
+        validate_only=validate_only,
+    )
+    if len(files) == 1:
+        results = [load_file(files[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(load_file, files))
+
+    get_tracer().add(span for result in results for span in result.spans)
+
+    # Duplicate names are checked first as they are found without validating
+    files_by_name: Dict[Any, List[str]] = {}
+    for result in results:
+        for name in [x for x in result.names if x is not None]:
+            files_by_name.setdefault(name, []).append(str(result.file))
+    duplicates = {name: x for name, x in files_by_name.items() if len(x) > 1}
+    if duplicates:
+        summary = "\n".join(
+            f"  - `{name}`: " + ", ".join(f"`{file}`" for file in x)
+            for name, x in duplicates.items()
+        )
+        raise DbtCloudJobsDuplicateJobNameError(
+            f"Job names must be unique {f'in `{files[0]}`' if len(files) == 1 else 'across all files'}:\n{summary}"
+        )
+
+    errors = [error for result in results for error in result.errors]
+    if errors:
+        summary = "\n".join(f"  - {x}" for x in errors)
+        raise DbtCloudJobsValidationError(
+            f"{len([x for x in results if x.errors])} of {len(results)} file(s) are invalid:\n{summary}"
+        )
+
+    if len({str(x) for result in results for x in result.account_ids}) > 1:
+        raise DbtCloudJobsValidationError("All jobs must have the same account_id.")
+
+    logger.info(f"Found definitions for {sum(len(x.names) for x in results)} job(s).")
+    if cache is not None:
+        cache.update(results)
+        cache.write()
+
+    if validate_only:
+        return None
+
+    return DbtCloudJobDefinitionsFile.model_construct(
+        jobs=[job for result in results for job in result.definitions_file.jobs]  # type: ignore[union-attr]
+    )
+
+
+def resolve_job_definition_files(file: str) -> List[Path]:
+    """
+    Returns the files of job definitions passed to `--file`: a single file, every YML (and `.jsonl`)
+    file in a directory and its sub-directories, or every file matching a glob pattern.
+
+    Returns:
+        List[Path]: Sorted, so the order of the jobs does not depend on the file system.
+    """
+
+    if is_glob_pattern(file):
+        return sorted(Path(x) for x in glob.glob(file, recursive=True) if Path(x).is_file())
+
+    if Path(file).is_dir():
+        return sorted(
+            x
+            for pattern in ("*.jsonl", "*.yaml", "*.yml")
+            for x in Path(file).rglob(pattern)
+            if x.is_file()
+        )
+
+    return [Path(file)] if Path(file).exists() else []
+
+
+def is_glob_pattern(file: str) -> bool:
+    return any(x in str(file) for x in "*?[")
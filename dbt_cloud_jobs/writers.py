@@ -0,0 +1,58 @@
+import json
+from pathlib import Path
+from typing import IO, Iterable
+
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.validator import DbtCloudJobDefinitionsFile
+from dbt_cloud_jobs.yaml_helpers import yaml_safe_dump
+
+
+def write_job_definitions(pages: Iterable[DbtCloudJobDefinitionsFile], file: Path) -> int:
+    """
+    Write jobs to a file as pages of jobs arrive, so only one page is held in memory at a time.
+
+    Files with a `.jsonl` extension are written as JSON Lines (one job per line), all other files
+    as YML identical to `yaml.safe_dump({"jobs": jobs}, sort_keys=True)`. A partially written file
+    is removed if an error occurs.
+
+    Returns:
+        int: Number of jobs written.
+    """
+
+    write_jobs = write_jsonl_jobs if Path(file).suffix == ".jsonl" else write_yml_jobs
+    try:
+        with Path.open(Path(file), "w", encoding="utf-8") as f:
+            return write_jobs(pages=pages, stream=f)
+    except BaseException:
+        logger.error(f"Failed to write job definitions, removing `{file}`...")
+        Path(file).unlink(missing_ok=True)
+        raise
+
+
+def write_jsonl_jobs(pages: Iterable[DbtCloudJobDefinitionsFile], stream: IO[str]) -> int:
+    count = 0
+    for page in pages:
+        for job in page:
+            stream.write(json.dumps(job, sort_keys=True))
+            stream.write("\n")
+            count += 1
+        stream.flush()
+
+    return count
+
+
+def write_yml_jobs(pages: Iterable[DbtCloudJobDefinitionsFile], stream: IO[str]) -> int:
+    count = 0
+    for page in pages:
+        for job in page:
+            if count == 0:
+                stream.write("jobs:\n")
+            # A single job dumped as a list has the same indentation as an item of the `jobs` list
+            yaml_safe_dump([job], stream=stream, sort_keys=True)
+            count += 1
+        stream.flush()
+
+    if count == 0:
+        stream.write("jobs: []\n")
+
+    return count
@@ -0,0 +1,52 @@
+from typing import IO, Any, Optional, Union
+
+import yaml
+
+# Use the libyaml bindings when PyYAML was built with them, they are several times faster than
+# the pure-Python implementation
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+
+def has_escaped_strings(data: Any) -> bool:
+    """
+    Returns True if any string in `data` contains a character that is escaped when dumped, i.e.
+    anything other than printable ASCII. libyaml folds long escaped strings differently from the
+    pure-Python emitter.
+    """
+
+    if isinstance(data, str):
+        return not (data.isascii() and data.isprintable())
+    if isinstance(data, dict):
+        return any(has_escaped_strings(k) or has_escaped_strings(v) for k, v in data.items())
+    if isinstance(data, (list, set, tuple)):
+        return any(has_escaped_strings(x) for x in data)
+
+    return False
+
+
+def yaml_safe_dump(data: Any, stream: Optional[IO[Any]] = None, **kwargs: Any) -> Any:
+    """
+    Equivalent of `yaml.safe_dump`, using libyaml when available. The output is byte-identical to
+    `yaml.safe_dump`: documents containing escaped strings are dumped by the pure-Python emitter.
+
+    Returns:
+        Any: The YML document when `stream` is None, otherwise None.
+    """
+
+    dumper = yaml.SafeDumper if has_escaped_strings(data) else SafeDumper
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
+
+
+def yaml_safe_load(stream: Union[bytes, IO[Any], str]) -> Any:
+    """
+    Equivalent of `yaml.safe_load`, using libyaml when available.
+
+    Returns:
+        Any
+    """
+
+    return yaml.load(stream, Loader=SafeLoader)  # nosec: the loader is a safe loader
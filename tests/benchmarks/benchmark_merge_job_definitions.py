@@ -0,0 +1,47 @@
+"""
+Microbenchmark of `merge_job_definitions` over realistic job payloads.
+
+Run with `make benchmark`.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from dbt_cloud_jobs.utils import merge_job_definitions
+from tests.benchmarks.generate_jobs import (
+    generate_existing_jobs,
+    generate_job_definitions,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", default=5000, type=int)
+    parser.add_argument("--repeat", default=5, type=int)
+    args = parser.parse_args()
+
+    # Pairs of (job in dbt Cloud, job in YML file), one in ten jobs differs from dbt Cloud
+    definitions = generate_job_definitions(args.jobs)
+    existing_jobs, _, _ = generate_existing_jobs(definitions, missing_ratio=0)
+    pairs = list(zip(existing_jobs, definitions))
+
+    def merge_all() -> None:
+        for remote_job, yml_job in pairs:
+            merge_job_definitions(remote_job, yml_job)
+
+    seconds = min(timeit.repeat(merge_all, number=1, repeat=args.repeat))
+
+    tracemalloc.start()
+    merge_all()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"merge_job_definitions: {args.jobs} jobs in {seconds * 1000:.1f}ms "
+        f"({seconds / args.jobs * 1e6:.2f}us per job), peak allocations {peak_bytes / 1024:.1f}KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""
+Benchmarks of YML load/dump, validation, `merge_job_definitions`, diffing and an end-to-end
+`--sync` against a local fake of the dbt Cloud API, for files of 10, 1k and 10k jobs.
+
+Every benchmark reports its wall time, peak memory and number of requests sent to the dbt Cloud
+API, compared with the baselines stored in `tests/benchmarks/baselines.json`. Wall times depend on
+the machine, so baselines store them relative to a reference workload timed in the same run.
+
+Run with `make benchmark`, pass `--check` to fail on regressions and `--update-baselines` to
+store new baselines.
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from dbt_cloud_jobs.dbt_api_helpers import get_dbt_cloud_api_base_url
+from dbt_cloud_jobs.diff import get_field_diffs
+from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.main import main as dbt_cloud_jobs_main
+from dbt_cloud_jobs.utils import merge_job_definitions
+from dbt_cloud_jobs.validator import DbtCloudJobDefinitionsFile
+from dbt_cloud_jobs.yaml_helpers import yaml_safe_dump, yaml_safe_load
+from tests.benchmarks.generate_jobs import (
+    generate_existing_jobs,
+    generate_job_definitions,
+)
+from tests.fake_dbt_cloud_api import FakeDbtCloudApi
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+# Metrics compared with the baselines, the wall time is compared relative to the reference workload
+BASELINE_METRICS = ("peak_memory_bytes", "relative_wall_time", "requests")
+SIZES = (10, 1_000, 10_000)
+
+# A benchmark prepares its inputs and returns the function to time, along with the fake dbt
+# Cloud API it sends requests to, if any
+Benchmark = Callable[[], ContextManager[Tuple[Callable[[], Any], Optional[FakeDbtCloudApi]]]]
+
+
+def get_benchmarks(size: int) -> Dict[str, Benchmark]:
+    definitions = generate_job_definitions(size)
+    existing_jobs, _, _ = generate_existing_jobs(definitions)
+    existing_jobs_by_name = {x["name"]: x for x in existing_jobs}
+    pairs = [
+        (existing_jobs_by_name[x["name"]], x)
+        for x in definitions
+        if x["name"] in existing_jobs_by_name
+    ]
+    content = yaml_safe_dump({"jobs": definitions}, sort_keys=True)
+
+    def prepared(func: Callable[[], Any]) -> Benchmark:
+        return lambda: contextlib.nullcontext((func, None))
+
+    @contextlib.contextmanager
+    def sync() -> Iterator[Tuple[Callable[[], Any], Optional[FakeDbtCloudApi]]]:
+        with tempfile.TemporaryDirectory() as tmp_dir, FakeDbtCloudApi(jobs=existing_jobs) as api:
+            file = Path(tmp_dir) / "dbt_cloud_jobs.yml"
+            file.write_text(content)
+            os.environ["DBT_CLOUD_JOBS_API_BASE_URL"] = api.base_url
+            get_dbt_cloud_api_base_url.cache_clear()
+            try:
+                yield lambda: dbt_cloud_jobs_main(Namespace(file=str(file), sync=True)), api
+            finally:
+                del os.environ["DBT_CLOUD_JOBS_API_BASE_URL"]
+                get_dbt_cloud_api_base_url.cache_clear()
+
+    return {
+        "yaml_dump": prepared(lambda: yaml_safe_dump({"jobs": definitions}, sort_keys=True)),
+        "yaml_load": prepared(lambda: yaml_safe_load(content)),
+        "validate": prepared(lambda: DbtCloudJobDefinitionsFile(jobs=definitions)),
+        "merge": prepared(lambda: [merge_job_definitions(x, y) for x, y in pairs]),
+        "diff": prepared(
+            lambda: [get_field_diffs(x, merge_job_definitions(x, y)) for x, y in pairs]
+        ),
+        "sync": sync,
+    }
+
+
+def run_reference_workload() -> None:
+    """
+    A fixed pure-Python workload that does not depend on `dbt_cloud_jobs`, so its wall time only
+    reflects the speed of the machine.
+    """
+
+    sorted(json.dumps({"id": i, "name": f"Job {i:05d}"}) for i in range(100_000))
+
+
+def time_reference_workload(repeat: int) -> float:
+    """
+    Returns:
+        float: The fastest of `repeat` runs of the reference workload, in seconds.
+    """
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_reference_workload()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int, reference_seconds: float) -> Dict[str, Any]:
+    """
+    Time a benchmark `repeat` times, keeping the fastest run, then run it once more while tracing
+    memory allocations.
+
+    Returns:
+        Dict[str, Any]: The peak memory in bytes, wall time relative to `reference_seconds`, number
+            of requests sent and wall time in seconds.
+    """
+
+    timings = []
+    request_count = 0
+    for _ in range(repeat):
+        with benchmark() as (func, api):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+            request_count = api.request_count if api is not None else 0
+
+    # Tracing allocations slows code down, so memory is measured in a separate run
+    with benchmark() as (func, _):
+        tracemalloc.start()
+        func()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "peak_memory_bytes": peak_bytes,
+        "relative_wall_time": min(timings) / reference_seconds,
+        "requests": request_count,
+        "wall_seconds": min(timings),
+    }
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]], baselines: Dict[str, Dict[str, Any]], tolerance: float
+) -> List[str]:
+    """
+    Compare results with their baselines. Relative wall time and peak memory may exceed their
+    baseline by `tolerance` (e.g. 0.25 for 25%), the number of requests may not exceed its baseline.
+
+    Returns:
+        List[str]: One message per regression.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+
+        for metric in ("peak_memory_bytes", "relative_wall_time"):
+            if result[metric] > baseline[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.4g} exceeds baseline {baseline[metric]:.4g} by more than {tolerance:.0%}"
+                )
+        if result["requests"] > baseline["requests"]:
+            regressions.append(
+                f"{name}: {result['requests']} requests, {baseline['requests']} in baseline"
+            )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--benchmark", action="append", dest="benchmarks", type=str)
+    parser.add_argument("--check", action="store_true", default=False)
+    parser.add_argument("--repeat", default=3, type=int)
+    parser.add_argument("--size", action="append", dest="sizes", type=int)
+    parser.add_argument("--tolerance", default=0.25, type=float)
+    parser.add_argument("--update-baselines", action="store_true", default=False)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DBT_API_TOKEN", "fake")
+    os.environ.setdefault("DBT_CLOUD_REGION", "US")
+    logger.setLevel(logging.WARNING)
+
+    baselines = json.loads(BASELINES_FILE.read_text()) if BASELINES_FILE.exists() else {}
+    reference_seconds = time_reference_workload(repeat=max(args.repeat, 5))
+    print(f"{'reference':<18} {reference_seconds * 1000:>10.1f}ms")
+    results = {}
+    for size in args.sizes or SIZES:
+        for name, benchmark in get_benchmarks(size).items():
+            if args.benchmarks and name not in args.benchmarks:
+                continue
+
+            key = f"{name}[{size}]"
+            results[key] = run_benchmark(
+                benchmark, repeat=args.repeat, reference_seconds=reference_seconds
+            )
+            baseline = baselines.get(key)
+            change = (
+                f" ({results[key]['relative_wall_time'] / baseline['relative_wall_time'] - 1:+.0%} vs baseline)"
+                if baseline
+                else ""
+            )
+            print(
+                f"{key:<18} {results[key]['wall_seconds'] * 1000:>10.1f}ms{change:<20} "
+                f"peak {results[key]['peak_memory_bytes'] / 1024 ** 2:>8.1f}MiB "
+                f"{results[key]['requests']:>6} request(s)"
+            )
+
+    if args.update_baselines:
+        BASELINES_FILE.write_text(
+            json.dumps(
+                {
+                    **baselines,
+                    **{
+                        key: {metric: result[metric] for metric in BASELINE_METRICS}
+                        for key, result in results.items()
+                    },
+                },
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n"
+        )
+        print(f"Saved baselines to `{BASELINES_FILE}`.")
+
+    regressions = find_regressions(results, baselines=baselines, tolerance=args.tolerance)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
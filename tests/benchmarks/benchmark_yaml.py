@@ -0,0 +1,55 @@
+"""
+Benchmark of loading and dumping a YML file of job definitions, with libyaml (when PyYAML was
+built with it) and with the pure-Python implementation.
+
+Run with `make benchmark`.
+"""
+
+import argparse
+import time
+
+import yaml
+
+from dbt_cloud_jobs.yaml_helpers import yaml_safe_dump, yaml_safe_load
+from tests.benchmarks.generate_jobs import generate_job_definitions
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", default=2000, type=int)
+    parser.add_argument("--repeat", default=3, type=int)
+    args = parser.parse_args()
+
+    definitions = {"jobs": generate_job_definitions(args.jobs)}
+    content = yaml_safe_dump(definitions, sort_keys=True)
+    print(f"Generated {args.jobs} jobs, {len(content.splitlines())} lines")
+
+    results = {
+        "dump (pure Python)": measure(
+            lambda: yaml.dump(definitions, Dumper=yaml.SafeDumper, sort_keys=True), args.repeat
+        ),
+        "dump (yaml_safe_dump)": measure(
+            lambda: yaml_safe_dump(definitions, sort_keys=True), args.repeat
+        ),
+        "load (pure Python)": measure(
+            lambda: yaml.load(content, Loader=yaml.SafeLoader), args.repeat
+        ),
+        "load (yaml_safe_load)": measure(lambda: yaml_safe_load(content), args.repeat),
+    }
+    print(f"libyaml available: {yaml.__with_libyaml__}")
+    for name, seconds in results.items():
+        print(f"{name}: {seconds * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
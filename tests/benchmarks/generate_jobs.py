@@ -0,0 +1,127 @@
+"""
+Generate synthetic files of job definitions, based on the job definitions in `tests/fixtures/valid`.
+
+Run with `python -m tests.benchmarks.generate_jobs --jobs 1000 --file dbt_cloud_jobs.yml`.
+"""
+
+import argparse
+import copy
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+from dbt_cloud_jobs.diff import get_ignored_fields
+from dbt_cloud_jobs.validator import DbtCloudJobDefinition, load_job_definition_file
+from dbt_cloud_jobs.writers import write_job_definitions
+
+ACCOUNT_ID = 123
+ENVIRONMENT_ID = 123
+
+
+def generate_job_definitions(
+    count: int, projects: int = 1, seed: int = 0
+) -> List[DbtCloudJobDefinition]:
+    """
+    Generate job definitions as they are written in a YML file, cycling through the job
+    definitions in `tests/fixtures/valid` with varied names, schedules, steps and settings.
+    Generation is deterministic for a given `seed`.
+
+    Args:
+        count (int): Number of jobs.
+        projects (int, optional): Number of projects the jobs are spread across, with ids starting at 1. Defaults to 1.
+        seed (int, optional): Defaults to 0.
+
+    Returns:
+        List[DbtCloudJobDefinition]
+    """
+
+    rng = random.Random(seed)
+    ignored_fields = get_ignored_fields()
+    templates = [
+        {k: v for k, v in job.items() if k not in ignored_fields}
+        for file in sorted(Path("./tests/fixtures/valid").glob("*.yml"))
+        for job in load_job_definition_file(file)["jobs"]
+    ]
+
+    definitions = []
+    for i in range(count):
+        definition = copy.deepcopy(templates[i % len(templates)])
+        definition.update(
+            {
+                "account_id": ACCOUNT_ID,
+                "deferring_environment_id": None,
+                "deferring_job_definition_id": None,
+                "environment_id": ENVIRONMENT_ID,
+                "execute_steps": [
+                    f"dbt {rng.choice(['build', 'run', 'test'])} --select tag:team_{i % 50}"
+                    for _ in range(rng.randint(1, 3))
+                ],
+                "name": f"Job {i:05d}",
+                "project_id": i % projects + 1,
+            }
+        )
+        definition["settings"] = {**definition["settings"], "threads": rng.randint(1, 16)}
+        if definition.get("schedule", {}).get("date", {}).get("type") == "custom_cron":
+            cron = f"{rng.randint(0, 59)} {rng.randint(0, 23)} * * *"
+            definition["schedule"] = {
+                **definition["schedule"],
+                "cron": cron,
+                "date": {**definition["schedule"]["date"], "cron": cron},
+            }
+        definitions.append(definition)
+
+    return definitions
+
+
+def generate_existing_jobs(
+    definitions: List[DbtCloudJobDefinition],
+    changed_ratio: float = 0.1,
+    missing_ratio: float = 0.05,
+    seed: int = 0,
+) -> Tuple[List[DbtCloudJobDefinition], int, int]:
+    """
+    Generate the jobs that exist in dbt Cloud before a sync of `definitions`, as returned by the
+    dbt Cloud API, i.e. with every field set. A share of jobs differs from its definition and
+    another share is missing, as is typical of a sync.
+
+    Returns:
+        Tuple[List[DbtCloudJobDefinition], int, int]: The existing jobs, the number of jobs to
+            update and the number of jobs to create.
+    """
+
+    rng = random.Random(seed)
+    jobs = []
+    changed_count, missing_count = 0, 0
+    for definition in definitions:
+        draw = rng.random()
+        if draw < missing_ratio:
+            missing_count += 1
+            continue
+
+        job = DbtCloudJobDefinition(**definition).model_dump(mode="json")
+        job["next_run"] = f"2024-01-{rng.randint(10, 28)}T02:00:00+00:00"
+        if draw < missing_ratio + changed_ratio:
+            changed_count += 1
+            job["settings"]["threads"] = definition["settings"]["threads"] % 16 + 1
+        jobs.append(job)
+
+    return jobs, changed_count, missing_count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--file", required=True, type=str)
+    parser.add_argument("--jobs", default=1000, type=int)
+    parser.add_argument("--projects", default=1, type=int)
+    parser.add_argument("--seed", default=0, type=int)
+    args = parser.parse_args()
+
+    job_count = write_job_definitions(
+        pages=[generate_job_definitions(args.jobs, projects=args.projects, seed=args.seed)],
+        file=Path(args.file),
+    )
+    print(f"Saved {job_count} job(s) to `{args.file}`.")
+
+
+if __name__ == "__main__":
+    main()
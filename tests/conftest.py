@@ -1,13 +1,38 @@
 import os
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 import yaml
+from pytest import MonkeyPatch
 
-from dbt_cloud_jobs.dbt_api_helpers import delete_dbt_cloud_job, list_dbt_cloud_jobs
+from dbt_cloud_jobs.dbt_api_helpers import (
+    delete_dbt_cloud_job,
+    get_dbt_cloud_api_base_url,
+    list_dbt_cloud_jobs,
+)
 from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.settings import configure_api_settings, reset_api_settings
 from dbt_cloud_jobs.utils import job_prefix
 from dbt_cloud_jobs.validator import DbtCloudJobDefinitionsFile
+from tests.fake_dbt_cloud_api import FakeDbtCloudApi
+
+
+@pytest.fixture
+def fake_dbt_cloud_api() -> Iterator[FakeDbtCloudApi]:
+    """
+    A fake dbt Cloud API all requests are sent to, failed requests are retried without waiting.
+    """
+
+    with FakeDbtCloudApi() as api, MonkeyPatch.context() as mp:
+        mp.setenv("DBT_CLOUD_JOBS_API_BASE_URL", api.base_url)
+        get_dbt_cloud_api_base_url.cache_clear()
+        configure_api_settings(max_retries=3, retry_backoff_seconds=0)
+        try:
+            yield api
+        finally:
+            reset_api_settings()
+            get_dbt_cloud_api_base_url.cache_clear()
 
 
 @pytest.fixture(scope="session")
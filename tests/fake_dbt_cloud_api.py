@@ -0,0 +1,324 @@
+"""
+An in-process stand-in for the endpoints of the dbt Cloud API used by `dbt_cloud_jobs`.
+
+Start it as a context manager and point `dbt_cloud_jobs` at it via the
+`DBT_CLOUD_JOBS_API_BASE_URL` environment variable, or use the `fake_dbt_cloud_api` fixture:
+
+    with FakeDbtCloudApi(latency_seconds=0.05, max_page_size=50) as api:
+        os.environ["DBT_CLOUD_JOBS_API_BASE_URL"] = api.base_url
+        api.inject_failures(status_code=429, count=2, route="list_jobs", retry_after=0)
+"""
+
+import datetime
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Counter, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+JOBS_PATH = re.compile(r"^/api/v2/accounts/(?P<account_id>\d+)/jobs/?$")
+JOB_PATH = re.compile(r"^/api/v2/accounts/(?P<account_id>\d+)/jobs/(?P<job_id>\d+)/?$")
+PROJECTS_PATH = re.compile(r"^/api/v2/accounts/(?P<account_id>\d+)/projects/?$")
+
+
+class FakeDbtCloudApi:
+    """
+    A fake dbt Cloud API serving jobs held in memory, on a random local port.
+
+    Requests are counted per route ("create_job", "delete_job", "list_jobs", "list_projects" and
+    "update_job") and per status code, along with the maximum number of requests in flight.
+    Failures are either injected for the next requests, see `inject_failures`, or at random with a
+    seeded generator so load tests are reproducible.
+
+    Args:
+        jobs (Optional[List[Dict[str, Any]]], optional): Jobs that already exist, they are given an id if they do not have one. Defaults to None.
+        projects (Optional[List[Dict[str, Any]]], optional): Projects of every account. Defaults to the projects of `jobs`.
+        latency_seconds (float, optional): Delay before every response. Defaults to 0.
+        max_page_size (int, optional): Maximum number of objects per page, whatever the `limit` requested. Defaults to 100.
+        error_rate (float, optional): Share of requests failing with `error_status_code`. Defaults to 0.
+        error_status_code (int, optional): Defaults to 503.
+        seed (int, optional): Seed of the generator of random failures. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        jobs: Optional[List[Dict[str, Any]]] = None,
+        projects: Optional[List[Dict[str, Any]]] = None,
+        latency_seconds: float = 0,
+        max_page_size: int = 100,
+        error_rate: float = 0,
+        error_status_code: int = 503,
+        seed: int = 0,
+    ):
+        self.error_rate = error_rate
+        self.error_status_code = error_status_code
+        self.failures: List[Dict[str, Any]] = []
+        self.in_flight = 0
+        self.jobs: Dict[int, Dict[str, Any]] = {}
+        self.latency_seconds = latency_seconds
+        self.lock = threading.Lock()
+        self.max_in_flight = 0
+        self.max_page_size = max_page_size
+        self.next_id = 1
+        self.requests: Counter[str] = Counter()
+        self.rng = random.Random(seed)
+        self.status_codes: Counter[int] = Counter()
+        for job in jobs or []:
+            self.add_job(job)
+        self.projects = (
+            projects
+            if projects is not None
+            else [{"id": x} for x in sorted({job["project_id"] for job in self.jobs.values()})]
+        )
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FakeDbtCloudApi":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        assert self.server is not None, "The fake dbt Cloud API is not started."
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    @property
+    def request_count(self) -> int:
+        return sum(self.requests.values())
+
+    def add_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            now = datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
+            job = {"created_at": now, **job, "updated_at": now}
+            if job.get("id") is None:
+                job["id"] = self.next_id
+            self.next_id = max(self.next_id, job["id"]) + 1
+            self.jobs[job["id"]] = job
+            return job
+
+    def get_failure(self, route: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            for index, failure in enumerate(self.failures):
+                if failure["route"] in (None, route):
+                    if failure["count"] == 1:
+                        del self.failures[index]
+                    else:
+                        failure["count"] -= 1
+                    return failure
+
+            if self.error_rate and self.rng.random() < self.error_rate:
+                return {
+                    "after_handling": False,
+                    "retry_after": None,
+                    "status_code": self.error_status_code,
+                }
+
+        return None
+
+    def handle(
+        self, method: str, path: str, query: Dict[str, List[str]], body: Optional[Dict[str, Any]]
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """
+        Handle a single request.
+
+        Returns:
+            Tuple[int, Dict[str, Any], Dict[str, str]]: Status code, JSON body and headers of the response.
+        """
+
+        route, params = get_route(method=method, path=path)
+        if route is None:
+            return self.respond(404, f"No route for {method} {path}.")
+
+        with self.lock:
+            self.requests[route] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency_seconds:
+                time.sleep(self.latency_seconds)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+        failure = self.get_failure(route)
+        if failure is None:
+            return self.apply(route=route, params=params, query=query, body=body)
+
+        if failure["after_handling"]:
+            self.apply(route=route, params=params, query=query, body=body)
+        return self.respond(
+            failure["status_code"],
+            "Injected failure.",
+            headers=(
+                {"Retry-After": str(failure["retry_after"])}
+                if failure["retry_after"] is not None
+                else {}
+            ),
+        )
+
+    def apply(
+        self,
+        route: str,
+        params: Dict[str, int],
+        query: Dict[str, List[str]],
+        body: Optional[Dict[str, Any]],
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        if route == "list_jobs":
+            return self.respond(200, self.list_jobs(account_id=params["account_id"], query=query))
+        elif route == "create_job":
+            return self.respond(
+                201, {"data": self.add_job({**(body or {}), "account_id": params["account_id"]})}
+            )
+        elif route == "list_projects":
+            return self.respond(200, self.paginate(self.projects, query=query))
+
+        with self.lock:
+            job = self.jobs.get(params["job_id"])
+        if job is None or job["account_id"] != params["account_id"]:
+            return self.respond(404, "Job not found.")
+        if route == "update_job":
+            return self.respond(
+                200, {"data": self.add_job({**job, **(body or {}), "id": params["job_id"]})}
+            )
+
+        with self.lock:
+            del self.jobs[params["job_id"]]
+        return self.respond(200, {"data": {**job, "state": 2}})
+
+    def inject_failures(
+        self,
+        status_code: int,
+        count: int = 1,
+        route: Optional[str] = None,
+        retry_after: Optional[float] = None,
+        after_handling: bool = False,
+    ) -> None:
+        """
+        Respond to the next `count` requests to `route` with `status_code`, failures are
+        served in the order they are injected.
+
+        Args:
+            status_code (int): e.g. 429 or 503.
+            count (int, optional): Defaults to 1.
+            route (Optional[str], optional): Only fail requests to this route, e.g. "list_jobs". Defaults to any route.
+            retry_after (Optional[float], optional): Value of the `Retry-After` header. Defaults to no header.
+            after_handling (bool, optional): Handle the requests before failing, as when a response
+                is lost after dbt Cloud applied the request. Defaults to False.
+        """
+
+        with self.lock:
+            self.failures.append(
+                {
+                    "after_handling": after_handling,
+                    "count": count,
+                    "retry_after": retry_after,
+                    "route": route,
+                    "status_code": status_code,
+                }
+            )
+
+    def list_jobs(self, account_id: int, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        with self.lock:
+            jobs = [x for x in self.jobs.values() if x["account_id"] == account_id]
+        if "project_id" in query:
+            jobs = [x for x in jobs if x["project_id"] == int(query["project_id"][0])]
+
+        order_by = query.get("order_by", ["id"])[0]
+        jobs.sort(key=lambda x: x[order_by.lstrip("-")], reverse=order_by.startswith("-"))
+        return self.paginate(jobs, query=query)
+
+    def paginate(
+        self, objects: List[Dict[str, Any]], query: Dict[str, List[str]]
+    ) -> Dict[str, Any]:
+        limit = min(int(query.get("limit", ["100"])[0]), self.max_page_size)
+        offset = int(query.get("offset", ["0"])[0])
+        page = objects[offset : offset + limit]
+        return {
+            "data": page,
+            "extra": {"pagination": {"count": len(page), "total_count": len(objects)}},
+            "status": {"code": 200},
+        }
+
+    def respond(
+        self,
+        status_code: int,
+        content: Union[Dict[str, Any], str],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        with self.lock:
+            self.status_codes[status_code] += 1
+
+        if isinstance(content, str):
+            content = {"status": {"code": status_code, "user_message": content}}
+        return status_code, content, headers or {}
+
+    def start(self) -> None:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open across requests, as dbt Cloud does, and send responses
+            # without waiting for the acknowledgement of the headers
+            disable_nagle_algorithm = True
+            protocol_version = "HTTP/1.1"
+
+            def do_DELETE(self) -> None:
+                self.respond("DELETE")
+
+            def do_GET(self) -> None:
+                self.respond("GET")
+
+            def do_POST(self) -> None:
+                self.respond("POST")
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def respond(self, method: str) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                status_code, response, headers = api.handle(
+                    method=method, path=url.path, query=parse_qs(url.query), body=body
+                )
+                content = json.dumps(response).encode("utf-8")
+                self.send_response(status_code)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+def get_route(method: str, path: str) -> Tuple[Optional[str], Dict[str, int]]:
+    """
+    Returns the name of the route of a request and the ids in its path, None for unknown routes.
+    """
+
+    if match := JOBS_PATH.match(path):
+        route = {"GET": "list_jobs", "POST": "create_job"}.get(method)
+    elif match := JOB_PATH.match(path):
+        route = {"DELETE": "delete_job", "POST": "update_job"}.get(method)
+    elif match := PROJECTS_PATH.match(path):
+        route = {"GET": "list_projects"}.get(method)
+    else:
+        return None, {}
+
+    return route, {k: int(v) for k, v in match.groupdict().items()}
@@ -133,7 +133,7 @@ def test_main_sync_remove_job_allow_deletes_false(caplog, file_job_minimal_defin
         )
     ]
     assert (
-        f"Job `{definition_2['name']}` (id: {definition_2_job_id}) exists in dbt Cloud but not in `{file.name}`. Pass `--allow-deletes` to delete this job from dbt Cloud."
+        f"1 job(s) exist in dbt Cloud but not in `{file.name}`, pass `--allow-deletes` to delete them from dbt Cloud:\n  - `{definition_2['name']}` (id: {definition_2_job_id}, project id: {definition_2['project_id']})"
         in caplog.text
     )
 
@@ -16,12 +16,12 @@ def test_sync_dbt_cloud_job_no_update(caplog, file_job_minimal_definition) -> No
     definitions = file_job_minimal_definition
 
     definition = hydrate_job_definition(definitions["jobs"][0])
-    create_dbt_cloud_job(definition=definition)
+    job_id = create_dbt_cloud_job(definition=definition)
     sync_dbt_cloud_job(definition=definition)
 
     assert f"Job `{definition['name']}` already exists, updating..." in caplog.text
     assert (
-        f"Definition of job `{definition['name']}` (id: {definition['id']}) has not changed, will not be updated."
+        f"Definition of job `{definition['name']}` (id: {job_id}) has not changed, will not be updated."
         in caplog.text
     )
 
@@ -30,15 +30,15 @@ def test_sync_dbt_cloud_job_update(caplog, file_job_minimal_definition) -> None:
     definitions = file_job_minimal_definition
 
     definition = hydrate_job_definition(definitions["jobs"][0])
-    create_dbt_cloud_job(definition=definition)
+    job_id = create_dbt_cloud_job(definition=definition)
 
     # Force update
-    definition["settings"]["threads"] = 4
+    definition["settings"] = {**definition["settings"], "threads": 4}
 
     sync_dbt_cloud_job(definition=definition)
 
     assert f"Job `{definition['name']}` already exists, updating..." in caplog.text
     assert (
-        f"Updated dbt Cloud job, URL: https://cloud.getdbt.com/deploy/{definition['account_id']}/projects/{definition['project_id']}/jobs/{definition['id']}"
+        f"Updated dbt Cloud job, URL: https://cloud.getdbt.com/deploy/{definition['account_id']}/projects/{definition['project_id']}/jobs/{job_id}"
         in caplog.text
     )
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from dbt_cloud_jobs.exceptions import DbtCloudJobsApiError, DbtCloudJobsSyncError
+from dbt_cloud_jobs.sync_job import DbtCloudJobIndex, sync_dbt_cloud_job_steps
+from tests.pytest_helpers import hydrate_job_definition
+
+pytest.importorskip("httpx")
+
+from dbt_cloud_jobs.async_dbt_api_helpers import (  # noqa: E402
+    AsyncDbtCloudClient,
+    run_job_steps,
+)
+
+
+def run_with_client(func, max_concurrency: int = 4):
+    """Run `func(client)` on a new event loop, with a client created within that loop."""
+
+    async def run():
+        async with AsyncDbtCloudClient(max_concurrency=max_concurrency) as client:
+            return await func(client)
+
+    return asyncio.run(run())
+
+
+def test_async_dbt_cloud_client_list_dbt_cloud_jobs(fake_dbt_cloud_api) -> None:
+    for i in range(50):
+        fake_dbt_cloud_api.add_job({"account_id": 1, "name": f"Job {i}", "project_id": 2})
+    fake_dbt_cloud_api.add_job({"account_id": 1, "name": "Other project", "project_id": 3})
+    # dbt Cloud may return fewer jobs than requested
+    fake_dbt_cloud_api.max_page_size = 7
+    fake_dbt_cloud_api.inject_failures(status_code=429, count=2, route="list_jobs", retry_after=0)
+
+    jobs = run_with_client(lambda client: client.list_dbt_cloud_jobs(account_id=1, project_id=2))
+
+    assert [x["name"] for x in jobs] == [f"Job {i}" for i in range(50)]
+    assert fake_dbt_cloud_api.status_codes == {200: 8, 429: 2}
+
+
+def test_async_dbt_cloud_client_limits_requests_in_flight(fake_dbt_cloud_api) -> None:
+    for i in range(100):
+        fake_dbt_cloud_api.add_job({"account_id": 1, "name": f"Job {i}", "project_id": 2})
+    fake_dbt_cloud_api.latency_seconds = 0.05
+    fake_dbt_cloud_api.max_page_size = 10
+
+    jobs = run_with_client(
+        lambda client: client.list_dbt_cloud_jobs(account_id=1, project_id=2), max_concurrency=3
+    )
+
+    assert len(jobs) == 100
+    assert 1 < fake_dbt_cloud_api.max_in_flight <= 3
+
+
+def test_async_dbt_cloud_client_create_and_delete(
+    fake_dbt_cloud_api, file_job_minimal_definition
+) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    # Creating and deleting a job share their retry logic with the blocking functions
+    fake_dbt_cloud_api.inject_failures(status_code=502, route="create_job")
+
+    job_id = run_with_client(lambda client: client.create_dbt_cloud_job(definition))
+
+    assert fake_dbt_cloud_api.requests == {"create_job": 2, "list_jobs": 1}
+    assert [x["id"] for x in fake_dbt_cloud_api.jobs.values()] == [job_id]
+
+    fake_dbt_cloud_api.inject_failures(status_code=503, route="delete_job", after_handling=True)
+    run_with_client(lambda client: client.delete_dbt_cloud_job(fake_dbt_cloud_api.jobs[job_id]))
+
+    assert fake_dbt_cloud_api.status_codes[404] == 1
+    assert not fake_dbt_cloud_api.jobs
+
+    with pytest.raises(DbtCloudJobsApiError) as e:
+        run_with_client(lambda client: client.get(endpoint=f"accounts/1/jobs/{job_id}"))
+
+    assert e.value.status_code == 404
+
+
+def test_run_job_steps_summarises_failures(
+    fake_dbt_cloud_api, file_job_minimal_definition
+) -> None:
+    definitions = [
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0]) for _ in range(3)
+    ]
+    job_index = DbtCloudJobIndex(
+        account_id=definitions[0]["account_id"], project_id=definitions[0]["project_id"], jobs=[]
+    )
+    fake_dbt_cloud_api.inject_failures(status_code=400, count=1, route="create_job")
+
+    with pytest.raises(DbtCloudJobsSyncError) as e:
+        run_job_steps(
+            steps=[
+                (x["name"], sync_dbt_cloud_job_steps(definition=x, job_index=job_index))
+                for x in definitions
+            ],
+            max_workers=2,
+            operation="sync",
+        )
+
+    # Every action is run, even when one fails
+    assert "Failed to sync 1 of 3 job(s)" in str(e.value)
+    assert len(fake_dbt_cloud_api.jobs) == len(job_index) == 2
@@ -0,0 +1,111 @@
+import os
+import time
+
+import pytest
+from pytest import MonkeyPatch
+
+from dbt_cloud_jobs import cache, dbt_api_helpers
+from dbt_cloud_jobs.cache import JobListingCache
+
+
+class FakeJobsEndpoint:
+    """A stand-in for `call_dbt_cloud_api` serving the jobs endpoint from an in-memory list of jobs."""
+
+    def __init__(self, job_count: int):
+        self.jobs = [
+            {"id": i, "name": f"Job {i}", "updated_at": f"2024-01-01T00:00:{i:02d}+00:00"}
+            for i in range(1, job_count + 1)
+        ]
+        self.requests = []
+
+    def __call__(self, method, endpoint, params=None, payload=None, retry=True):
+        self.requests.append(params)
+        jobs = self.jobs
+        if params.get("order_by") == "-updated_at":
+            jobs = sorted(jobs, key=lambda x: x["updated_at"], reverse=True)
+        data = jobs[params["offset"] : params["offset"] + params["limit"]]
+        return {
+            "data": data,
+            "extra": {"pagination": {"count": len(data), "total_count": len(self.jobs)}},
+        }
+
+
+@pytest.fixture
+def fake_jobs_endpoint():
+    endpoint = FakeJobsEndpoint(job_count=5)
+    with MonkeyPatch.context() as mp:
+        mp.setattr(cache, "call_dbt_cloud_api", endpoint)
+        mp.setattr(dbt_api_helpers, "call_dbt_cloud_api", endpoint)
+        yield endpoint
+
+
+def test_job_listing_cache_cold_and_warm(fake_jobs_endpoint, tmp_path) -> None:
+    job_listing_cache = JobListingCache(cache_dir=tmp_path)
+
+    jobs = job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2)
+    assert [x["id"] for x in jobs] == [1, 2, 3, 4, 5]
+    assert len(list(tmp_path.glob("jobs_*.json"))) == 1
+
+    # Unchanged listing is revalidated with a single request for the most recently updated job
+    fake_jobs_endpoint.requests.clear()
+    assert job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2) == jobs
+    assert len(fake_jobs_endpoint.requests) == 1
+    assert fake_jobs_endpoint.requests[0]["limit"] == 1
+
+
+def test_job_listing_cache_within_ttl(fake_jobs_endpoint, tmp_path) -> None:
+    job_listing_cache = JobListingCache(cache_dir=tmp_path, ttl_seconds=60)
+    job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2)
+
+    fake_jobs_endpoint.requests.clear()
+    job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2)
+    assert fake_jobs_endpoint.requests == []
+
+
+def test_job_listing_cache_updated_and_created_jobs(fake_jobs_endpoint, tmp_path) -> None:
+    job_listing_cache = JobListingCache(cache_dir=tmp_path)
+    job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2)
+
+    fake_jobs_endpoint.jobs[1] = {
+        **fake_jobs_endpoint.jobs[1],
+        "name": "Job 2 (renamed)",
+        "updated_at": "2024-01-02T00:00:00+00:00",
+    }
+    fake_jobs_endpoint.jobs.append(
+        {"id": 6, "name": "Job 6", "updated_at": "2024-01-03T00:00:00+00:00"}
+    )
+
+    fake_jobs_endpoint.requests.clear()
+    jobs = job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2)
+    assert [x["name"] for x in jobs] == [
+        "Job 1",
+        "Job 2 (renamed)",
+        "Job 3",
+        "Job 4",
+        "Job 5",
+        "Job 6",
+    ]
+    # No full listing, only the updated jobs are requested
+    assert all(x.get("order_by") == "-updated_at" for x in fake_jobs_endpoint.requests)
+
+
+def test_job_listing_cache_deleted_job(fake_jobs_endpoint, tmp_path) -> None:
+    job_listing_cache = JobListingCache(cache_dir=tmp_path)
+    job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2)
+
+    del fake_jobs_endpoint.jobs[2]
+
+    jobs = job_listing_cache.list_dbt_cloud_jobs(account_id=1, project_id=2)
+    assert [x["id"] for x in jobs] == [1, 2, 4, 5]
+
+
+def test_job_listing_cache_eviction(tmp_path) -> None:
+    job_listing_cache = JobListingCache(cache_dir=tmp_path, max_age_seconds=60, max_size_bytes=25)
+    for name, age in (("jobs_expired.json", 120), ("jobs_old.json", 30), ("jobs_new.json", 0)):
+        path = tmp_path / name
+        path.write_text("x" * 20)
+        os.utime(path, (time.time() - age, time.time() - age))
+
+    job_listing_cache.evict()
+
+    assert [x.name for x in tmp_path.glob("jobs_*.json")] == ["jobs_new.json"]
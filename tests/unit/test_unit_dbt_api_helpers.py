@@ -2,12 +2,27 @@ import os
 from typing import Dict
 
 import pytest
+import requests
 from pytest import MonkeyPatch
 
+from dbt_cloud_jobs import dbt_api_helpers
 from dbt_cloud_jobs.dbt_api_helpers import (
     call_dbt_cloud_api,
+    create_dbt_cloud_job,
+    create_requests_session,
     get_dbt_cloud_api_base_url,
+    get_request_timeout,
+    get_total_count,
+    iter_dbt_cloud_job_pages,
+    list_dbt_cloud_jobs,
+    list_dbt_cloud_projects,
+    start_run_deadline,
 )
+from dbt_cloud_jobs.exceptions import (
+    DbtCloudJobsDeadlineExceededError,
+    DbtCloudJobsRetryableApiError,
+)
+from dbt_cloud_jobs.settings import configure_api_settings, reset_api_settings
 
 
 def test_dbt_cloud_api_connection() -> None:
@@ -70,3 +85,288 @@ def test_required_env_vars_are_set(env_var_name) -> None:
         int(os.environ[env_var_name])
     except:
         raise RuntimeError(f"{env_var_name} must be set as a integer.")
+
+
+def fake_jobs_endpoint(total_count: int, include_pagination: bool = True):
+    """Returns a fake `call_dbt_cloud_api` serving `total_count` jobs and the offsets it was called with."""
+
+    requested_offsets = []
+
+    def fake_call_dbt_cloud_api(method, endpoint, params=None, payload=None):
+        # Jobs are served in the order of their ids, the order requested by every page
+        assert params["order_by"] == "id"
+        requested_offsets.append(params["offset"])
+        offset, limit = params["offset"], params["limit"]
+        response = {
+            "data": [
+                {"id": i + 1, "name": f"Job {i}"}
+                for i in range(offset, min(offset + limit, total_count))
+            ]
+        }
+        if include_pagination:
+            response["extra"] = {
+                "pagination": {"count": len(response["data"]), "total_count": total_count}
+            }
+        return response
+
+    return fake_call_dbt_cloud_api, requested_offsets
+
+
+@pytest.mark.parametrize("total_count", (0, 1, 10, 11, 95))
+def test_list_dbt_cloud_jobs_concurrent_pagination(total_count) -> None:
+    fake_call_dbt_cloud_api, requested_offsets = fake_jobs_endpoint(total_count=total_count)
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "call_dbt_cloud_api", fake_call_dbt_cloud_api)
+        jobs = list_dbt_cloud_jobs(account_id=1, project_id=2, limit=10, max_workers=3)
+
+    assert [x["id"] for x in jobs] == list(range(1, total_count + 1))
+    assert sorted(requested_offsets) == list(range(0, max(total_count, 1), 10))
+
+
+def test_iter_dbt_cloud_job_pages() -> None:
+    fake_call_dbt_cloud_api, requested_offsets = fake_jobs_endpoint(total_count=95)
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "call_dbt_cloud_api", fake_call_dbt_cloud_api)
+        pages = iter_dbt_cloud_job_pages(account_id=1, project_id=2, limit=10, max_workers=2)
+
+        assert [x["id"] for x in next(pages)] == list(range(1, 11))
+        assert [x["id"] for x in next(pages)] == list(range(11, 21))
+        # Only `max_workers` pages are requested ahead of the page being consumed
+        assert len(requested_offsets) <= 4
+        assert [len(x) for x in pages] == [10] * 7 + [5]
+
+
+def test_list_dbt_cloud_projects() -> None:
+    requested_offsets = []
+
+    def fake_call_dbt_cloud_api(method, endpoint, params=None, payload=None):
+        assert endpoint == "accounts/1/projects/"
+        requested_offsets.append(params["offset"])
+        data = [{"id": i} for i in range(params["offset"], min(params["offset"] + 2, 5))]
+        return {"data": data, "extra": {"pagination": {"count": len(data), "total_count": 5}}}
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "call_dbt_cloud_api", fake_call_dbt_cloud_api)
+        projects = list_dbt_cloud_projects(account_id=1, limit=2)
+
+    assert [x["id"] for x in projects] == [0, 1, 2, 3, 4]
+    assert requested_offsets == [0, 2, 4]
+
+
+def test_list_dbt_cloud_jobs_without_pagination_metadata() -> None:
+    fake_call_dbt_cloud_api, requested_offsets = fake_jobs_endpoint(
+        total_count=25, include_pagination=False
+    )
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "call_dbt_cloud_api", fake_call_dbt_cloud_api)
+        jobs = list_dbt_cloud_jobs(account_id=1, project_id=2, limit=10)
+
+    assert [x["id"] for x in jobs] == list(range(1, 26))
+    assert requested_offsets == [0, 10, 20, 25]
+
+
+@pytest.mark.parametrize(
+    "response, total_count",
+    (
+        [{"extra": {"pagination": {"count": 10, "total_count": 123}}}, 123],
+        [{"extra": {}}, None],
+        [{"data": []}, None],
+    ),
+)
+def test_get_total_count(response, total_count) -> None:
+    assert get_total_count(response) == total_count
+
+
+class FakeSession:
+    """A stand-in for `requests.Session` returning the given responses in order."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def delete(self, **kwargs):
+        return self.request(**kwargs)
+
+    def get(self, **kwargs):
+        return self.request(**kwargs)
+
+    def post(self, **kwargs):
+        return self.request(**kwargs)
+
+
+def fake_response(status_code: int, json: str = "{}", headers=None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.encode()
+    response.headers.update(headers or {})
+    response.url = "https://cloud.getdbt.com/api/v2/"
+    return response
+
+
+def test_call_dbt_cloud_api_retries() -> None:
+    session = FakeSession(
+        [
+            fake_response(429, headers={"Retry-After": "3"}),
+            requests.ConnectionError("Connection reset by peer"),
+            fake_response(503),
+            fake_response(200, json='{"data": []}'),
+        ]
+    )
+    sleeps = []
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "create_requests_session", lambda: session)
+        mp.setattr(dbt_api_helpers.time, "sleep", sleeps.append)
+        configure_api_settings(max_retries=3)
+        try:
+            assert call_dbt_cloud_api(method="get", endpoint="accounts/1/jobs/") == {"data": []}
+        finally:
+            reset_api_settings()
+
+    assert session.calls == 4
+    assert len(sleeps) == 3
+    assert sleeps[0] >= 3
+
+
+def test_call_dbt_cloud_api_retries_exhausted() -> None:
+    session = FakeSession([fake_response(500), fake_response(500)])
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "create_requests_session", lambda: session)
+        mp.setattr(dbt_api_helpers.time, "sleep", lambda x: None)
+        configure_api_settings(max_retries=1)
+        try:
+            with pytest.raises(DbtCloudJobsRetryableApiError):
+                call_dbt_cloud_api(method="get", endpoint="accounts/1/jobs/")
+        finally:
+            reset_api_settings()
+
+    assert session.calls == 2
+
+
+def test_call_dbt_cloud_api_does_not_retry_client_errors() -> None:
+    session = FakeSession([fake_response(404)])
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "create_requests_session", lambda: session)
+        configure_api_settings(max_retries=3)
+        try:
+            with pytest.raises(RuntimeError) as e:
+                call_dbt_cloud_api(method="get", endpoint="accounts/1/jobs/")
+        finally:
+            reset_api_settings()
+
+    assert not isinstance(e.value, DbtCloudJobsRetryableApiError)
+    assert session.calls == 1
+
+
+@pytest.mark.parametrize("created_despite_error", (True, False))
+def test_create_dbt_cloud_job_retry_checks_for_existing_job(created_despite_error) -> None:
+    definition = {"account_id": 1, "name": "Job A", "project_id": 2}
+    posts = []
+
+    def fake_call_dbt_cloud_api(method, endpoint, params=None, payload=None, retry=True):
+        assert retry is False
+        posts.append(payload)
+        if len(posts) == 1:
+            raise DbtCloudJobsRetryableApiError("dbt Cloud responded with status code 502.")
+        return {"data": {**payload, "id": 11}}
+
+    def fake_list_dbt_cloud_jobs(account_id, project_id):
+        return [{"id": 10, "name": "Job A"}] if created_despite_error else []
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "call_dbt_cloud_api", fake_call_dbt_cloud_api)
+        mp.setattr(dbt_api_helpers, "list_dbt_cloud_jobs", fake_list_dbt_cloud_jobs)
+        mp.setattr(dbt_api_helpers.time, "sleep", lambda x: None)
+        configure_api_settings(max_retries=3)
+        try:
+            job_id = create_dbt_cloud_job(definition=definition)  # type: ignore[arg-type]
+        finally:
+            reset_api_settings()
+
+    if created_despite_error:
+        assert job_id == 10
+        assert len(posts) == 1
+    else:
+        assert job_id == 11
+        assert len(posts) == 2
+
+
+def test_create_requests_session_settings() -> None:
+    configure_api_settings(gzip=False, keep_alive=False, pool_size=25)
+    try:
+        session = create_requests_session()
+        assert session is create_requests_session()
+        assert session.headers["Accept-Encoding"] == "identity"
+        assert session.headers["Connection"] == "close"
+        assert session.get_adapter("https://cloud.getdbt.com")._pool_maxsize == 25  # type: ignore[attr-defined]
+    finally:
+        reset_api_settings()
+
+    session = create_requests_session()
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_get_request_timeout() -> None:
+    configure_api_settings(connect_timeout=3, read_timeout=30)
+    try:
+        assert get_request_timeout() == (3, 30)
+    finally:
+        reset_api_settings()
+
+
+def test_get_request_timeout_is_bounded_by_deadline() -> None:
+    configure_api_settings(connect_timeout=3, read_timeout=30, deadline_seconds=5)
+    try:
+        start_run_deadline()
+        connect_timeout, read_timeout = get_request_timeout()
+        assert 0 < connect_timeout <= 3
+        assert 0 < read_timeout <= 5
+    finally:
+        reset_api_settings()
+
+
+def test_call_dbt_cloud_api_deadline_exceeded() -> None:
+    session = FakeSession([fake_response(200, json='{"data": []}')])
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "create_requests_session", lambda: session)
+        configure_api_settings(deadline_seconds=60)
+        try:
+            start_run_deadline()
+            mp.setattr(dbt_api_helpers, "run_started_at", dbt_api_helpers.time.monotonic() - 61)
+            with pytest.raises(DbtCloudJobsDeadlineExceededError):
+                call_dbt_cloud_api(method="get", endpoint="accounts/1/jobs/")
+        finally:
+            reset_api_settings()
+
+    assert session.calls == 0
+
+
+def test_call_dbt_cloud_api_does_not_retry_beyond_deadline() -> None:
+    session = FakeSession([fake_response(429, headers={"Retry-After": "120"})])
+    with MonkeyPatch.context() as mp:
+        mp.setattr(dbt_api_helpers, "create_requests_session", lambda: session)
+        configure_api_settings(deadline_seconds=60, max_retries=5)
+        try:
+            start_run_deadline()
+            with pytest.raises(DbtCloudJobsDeadlineExceededError):
+                call_dbt_cloud_api(method="get", endpoint="accounts/1/jobs/")
+        finally:
+            reset_api_settings()
+
+    assert session.calls == 1
+
+
+def test_get_dbt_cloud_api_base_url_override():
+    with MonkeyPatch.context() as mp:
+        mp.setenv("DBT_CLOUD_JOBS_API_BASE_URL", "http://127.0.0.1:8080/")
+        get_dbt_cloud_api_base_url.cache_clear()
+        assert get_dbt_cloud_api_base_url() == "http://127.0.0.1:8080"
+
+    get_dbt_cloud_api_base_url.cache_clear()
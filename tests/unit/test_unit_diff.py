@@ -0,0 +1,81 @@
+import copy
+
+from dbt_cloud_jobs.diff import (
+    canonicalize_job_definition,
+    get_field_diffs,
+    get_ignored_fields,
+    get_set_field_paths,
+)
+from dbt_cloud_jobs.utils import merge_job_definitions
+from tests.pytest_helpers import hydrate_job_definition
+
+
+def test_get_ignored_fields() -> None:
+    assert get_ignored_fields() == {
+        "created_at",
+        "cron_humanized",
+        "id",
+        "next_run",
+        "next_run_humanized",
+        "raw_dbt_version",
+        "run_failure_count",
+        "updated_at",
+    }
+
+
+def test_get_set_field_paths() -> None:
+    assert get_set_field_paths() == {("schedule", "date", "days"), ("schedule", "time", "hours")}
+
+
+def test_canonicalize_job_definition(file_job_minimal_definition) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    definition["next_run"] = "2024-01-11T02:00:00+00:00"
+    definition["schedule"] = copy.deepcopy(definition["schedule"])
+    definition["schedule"]["date"]["days"] = [3, 1, 2, 1]
+
+    canonical_definition = canonicalize_job_definition(definition)
+
+    assert "next_run" not in canonical_definition
+    assert canonical_definition["schedule"]["date"]["days"] == [1, 2, 3]
+    # The definition itself is not modified
+    assert definition["schedule"]["date"]["days"] == [3, 1, 2, 1]
+
+
+def test_get_field_diffs_ignores_volatile_fields(file_job_minimal_definition) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    existing_definition = {
+        **copy.deepcopy(definition),
+        "id": 1,
+        "next_run": "2024-01-12T02:00:00+00:00",
+        "next_run_humanized": "in 2 hours",
+        "run_failure_count": 3,
+        "updated_at": "2024-01-11T00:00:00+00:00",
+    }
+    existing_definition["schedule"]["date"]["days"] = list(
+        reversed(existing_definition["schedule"]["date"]["days"])
+    )
+    # The YML file was imported before the job last ran
+    yml_definition = {
+        **copy.deepcopy(definition),
+        "next_run": "2024-01-11T02:00:00+00:00",
+        "run_failure_count": 0,
+    }
+
+    assert get_field_diffs(existing_definition, yml_definition) == []
+
+
+def test_get_field_diffs(file_job_minimal_definition) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    existing_definition = {**copy.deepcopy(definition), "id": 1}
+    yml_definition = copy.deepcopy(definition)
+    yml_definition["settings"]["threads"] = 8
+    yml_definition["schedule"]["cron"] = "0 2 * * *"
+
+    field_diffs = get_field_diffs(
+        existing_definition, merge_job_definitions(existing_definition, yml_definition)
+    )
+
+    assert [(x.path, x.before, x.after) for x in field_diffs] == [
+        ("schedule.cron", definition["schedule"]["cron"], "0 2 * * *"),
+        ("settings.threads", definition["settings"]["threads"], 8),
+    ]
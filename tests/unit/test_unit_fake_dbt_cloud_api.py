@@ -0,0 +1,257 @@
+import copy
+import json
+import time
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dbt_cloud_jobs.dbt_api_helpers import (
+    create_dbt_cloud_job,
+    delete_dbt_cloud_job,
+    list_dbt_cloud_jobs,
+)
+from dbt_cloud_jobs.exceptions import (
+    DbtCloudJobsApiError,
+    DbtCloudJobsRetryableApiError,
+)
+from dbt_cloud_jobs.main import main
+from dbt_cloud_jobs.settings import configure_api_settings
+from tests.pytest_helpers import hydrate_job_definition
+
+
+def test_fake_dbt_cloud_api_pagination(fake_dbt_cloud_api) -> None:
+    for i in range(50):
+        fake_dbt_cloud_api.add_job({"account_id": 1, "name": f"Job {i}", "project_id": 2})
+    fake_dbt_cloud_api.add_job({"account_id": 1, "name": "Other project", "project_id": 3})
+    # dbt Cloud may return fewer jobs than requested
+    fake_dbt_cloud_api.max_page_size = 7
+
+    jobs = list_dbt_cloud_jobs(account_id=1, project_id=2)
+
+    assert [x["name"] for x in jobs] == [f"Job {i}" for i in range(50)]
+    assert fake_dbt_cloud_api.requests["list_jobs"] == 8
+
+
+def test_fake_dbt_cloud_api_retries(fake_dbt_cloud_api) -> None:
+    fake_dbt_cloud_api.add_job({"account_id": 1, "name": "Job", "project_id": 2})
+    fake_dbt_cloud_api.inject_failures(status_code=429, count=2, route="list_jobs", retry_after=0)
+
+    assert len(list_dbt_cloud_jobs(account_id=1, project_id=2)) == 1
+    assert fake_dbt_cloud_api.status_codes == {200: 1, 429: 2}
+
+    fake_dbt_cloud_api.inject_failures(status_code=503, count=4)
+    with pytest.raises(DbtCloudJobsRetryableApiError):
+        list_dbt_cloud_jobs(account_id=1, project_id=2)
+
+
+def test_fake_dbt_cloud_api_create_is_not_duplicated(
+    fake_dbt_cloud_api, file_job_minimal_definition
+) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    fake_dbt_cloud_api.inject_failures(status_code=502, route="create_job")
+
+    job_id = create_dbt_cloud_job(definition)
+
+    # The failed request is followed by a check that the job was not created, then a retry
+    assert fake_dbt_cloud_api.requests == {"create_job": 2, "list_jobs": 1}
+    assert [x["id"] for x in fake_dbt_cloud_api.jobs.values()] == [job_id]
+
+
+def test_fake_dbt_cloud_api_create_is_sent_again_after_429(
+    fake_dbt_cloud_api, file_job_minimal_definition
+) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    fake_dbt_cloud_api.inject_failures(status_code=429, route="create_job", retry_after=0)
+
+    job_id = create_dbt_cloud_job(definition)
+
+    # A 429 means the request was not applied, so there is nothing to check before sending it again
+    assert fake_dbt_cloud_api.requests == {"create_job": 2}
+    assert [x["id"] for x in fake_dbt_cloud_api.jobs.values()] == [job_id]
+
+
+def test_fake_dbt_cloud_api_delete_despite_error(
+    fake_dbt_cloud_api, file_job_minimal_definition
+) -> None:
+    job = fake_dbt_cloud_api.add_job(
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    )
+    fake_dbt_cloud_api.inject_failures(status_code=503, route="delete_job", after_handling=True)
+
+    delete_dbt_cloud_job(job)
+
+    # The job was deleted by the first request, the retried request gets a 404
+    assert fake_dbt_cloud_api.requests == {"delete_job": 2}
+    assert fake_dbt_cloud_api.status_codes[404] == 1
+    assert not fake_dbt_cloud_api.jobs
+
+    fake_dbt_cloud_api.add_job(job)
+    fake_dbt_cloud_api.inject_failures(status_code=503, route="delete_job")
+    delete_dbt_cloud_job(job)
+    # A 404 in response to the first request is not a success
+    with pytest.raises(DbtCloudJobsApiError) as e:
+        delete_dbt_cloud_job(job)
+
+    assert e.value.status_code == 404
+
+
+def test_fake_dbt_cloud_api_random_failures(fake_dbt_cloud_api) -> None:
+    for i in range(500):
+        fake_dbt_cloud_api.add_job({"account_id": 1, "name": f"Job {i}", "project_id": 2})
+    fake_dbt_cloud_api.max_page_size = 10
+    fake_dbt_cloud_api.error_rate = 0.2
+    # Enough retries for every page to eventually succeed, whatever the order of requests
+    configure_api_settings(max_retries=20)
+
+    jobs = list_dbt_cloud_jobs(account_id=1, project_id=2)
+
+    assert len(jobs) == 500
+    assert fake_dbt_cloud_api.status_codes[503] > 0
+
+
+def test_fake_dbt_cloud_api_concurrent_listing(fake_dbt_cloud_api) -> None:
+    for i in range(400):
+        fake_dbt_cloud_api.add_job({"account_id": 1, "name": f"Job {i}", "project_id": 2})
+    fake_dbt_cloud_api.latency_seconds = 0.05
+    fake_dbt_cloud_api.max_page_size = 10
+
+    start = time.monotonic()
+    jobs = list_dbt_cloud_jobs(account_id=1, project_id=2, max_workers=8)
+
+    assert len(jobs) == 400
+    assert fake_dbt_cloud_api.requests["list_jobs"] == 40
+    # Pages after the first are requested concurrently, 40 sequential requests take 2 seconds
+    assert time.monotonic() - start < 1.5
+
+
+def test_main_sync_offline(fake_dbt_cloud_api, file_job_minimal_definition, tmp_path) -> None:
+    definitions = [
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0]) for _ in range(3)
+    ]
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+
+    main(Namespace(file=str(file), sync=True))
+
+    assert fake_dbt_cloud_api.requests == {"create_job": 3, "list_jobs": 1}
+    assert sorted(x["name"] for x in fake_dbt_cloud_api.jobs.values()) == sorted(
+        x["name"] for x in definitions
+    )
+    # Created jobs are locked with their id and `updated_at` as returned by dbt Cloud
+    locked_jobs = json.loads(Path(f"{file}.lock").read_text())["jobs"]
+    assert {(x["id"], x["updated_at"]) for x in locked_jobs.values()} == {
+        (x["id"], x["updated_at"]) for x in fake_dbt_cloud_api.jobs.values()
+    }
+
+    # Update one job and remove another
+    updated_definition = copy.deepcopy(definitions[0])
+    updated_definition["settings"]["threads"] = 12
+    file.write_text(yaml.safe_dump({"jobs": [updated_definition, definitions[1]]}))
+    fake_dbt_cloud_api.requests.clear()
+
+    main(Namespace(allow_deletes=True, file=str(file), full_refresh=True, sync=True))
+
+    assert fake_dbt_cloud_api.requests == {"delete_job": 1, "list_jobs": 1, "update_job": 1}
+    jobs = {x["name"]: x for x in fake_dbt_cloud_api.jobs.values()}
+    assert sorted(jobs) == sorted([definitions[0]["name"], definitions[1]["name"]])
+    assert jobs[definitions[0]["name"]]["settings"]["threads"] == 12
+
+
+def test_main_sync_sends_requests_concurrently(
+    fake_dbt_cloud_api, file_job_minimal_definition, tmp_path
+) -> None:
+    definitions = [
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0]) for _ in range(8)
+    ]
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    fake_dbt_cloud_api.latency_seconds = 0.05
+
+    main(Namespace(file=str(file), max_workers=8, sync=True))
+
+    assert fake_dbt_cloud_api.requests == {"create_job": 8, "list_jobs": 1}
+    assert 1 < fake_dbt_cloud_api.max_in_flight <= 8
+
+
+def test_main_sync_async(fake_dbt_cloud_api, file_job_minimal_definition, tmp_path) -> None:
+    pytest.importorskip("httpx")
+    definitions = [
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0]) for _ in range(8)
+    ]
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    fake_dbt_cloud_api.latency_seconds = 0.05
+
+    main(Namespace(async_=True, file=str(file), max_workers=4, sync=True))
+
+    assert fake_dbt_cloud_api.requests == {"create_job": 8, "list_jobs": 1}
+    assert 1 < fake_dbt_cloud_api.max_in_flight <= 4
+    locked_jobs = json.loads(Path(f"{file}.lock").read_text())["jobs"]
+    assert {(x["id"], x["updated_at"]) for x in locked_jobs.values()} == {
+        (x["id"], x["updated_at"]) for x in fake_dbt_cloud_api.jobs.values()
+    }
+
+    # Update one job and remove the others
+    updated_definition = copy.deepcopy(definitions[0])
+    updated_definition["settings"]["threads"] = 12
+    file.write_text(yaml.safe_dump({"jobs": [updated_definition]}))
+    fake_dbt_cloud_api.requests.clear()
+
+    main(Namespace(allow_deletes=True, async_=True, file=str(file), full_refresh=True, sync=True))
+
+    assert fake_dbt_cloud_api.requests == {"delete_job": 7, "list_jobs": 1, "update_job": 1}
+    assert [x["settings"]["threads"] for x in fake_dbt_cloud_api.jobs.values()] == [12]
+
+
+def test_main_sync_twice_within_cache_ttl(
+    fake_dbt_cloud_api, file_job_minimal_definition, tmp_path
+) -> None:
+    definitions = [
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0]) for _ in range(3)
+    ]
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    args = dict(cache_dir=str(tmp_path / "cache"), cache_ttl=3600, file=str(file), sync=True)
+
+    main(Namespace(**args))
+    # Without a lockfile the second sync relies on the cached listing of the project
+    (tmp_path / "dbt_cloud_jobs.yml.lock").unlink()
+    main(Namespace(**args))
+
+    assert sorted(x["name"] for x in fake_dbt_cloud_api.jobs.values()) == sorted(
+        x["name"] for x in definitions
+    )
+    assert fake_dbt_cloud_api.requests["create_job"] == 3
+    assert fake_dbt_cloud_api.requests["list_jobs"] == 1
+
+
+def test_main_sync_then_import_within_cache_ttl(
+    fake_dbt_cloud_api, file_job_minimal_definition, tmp_path
+) -> None:
+    definitions = [
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0]) for _ in range(3)
+    ]
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    cache = dict(cache_dir=str(tmp_path / "cache"), cache_ttl=3600)
+
+    main(Namespace(file=str(file), sync=True, **cache))
+    fake_dbt_cloud_api.requests.clear()
+    main(
+        Namespace(
+            account_id=definitions[0]["account_id"],
+            file=str(tmp_path / "imported.jsonl"),
+            import_=True,
+            project_id=definitions[0]["project_id"],
+            **cache,
+        )
+    )
+
+    # The jobs created by the sync are imported from the cache as dbt Cloud returned them
+    assert fake_dbt_cloud_api.request_count == 0
+    imported_jobs = [json.loads(x) for x in (tmp_path / "imported.jsonl").read_text().splitlines()]
+    assert sorted(imported_jobs, key=lambda x: x["id"]) == sorted(
+        fake_dbt_cloud_api.jobs.values(), key=lambda x: x["id"]
+    )
@@ -0,0 +1,82 @@
+import copy
+
+from dbt_cloud_jobs.lockfile import Lockfile, get_lockfile_path, hash_job_definition
+from dbt_cloud_jobs.sync_job import DbtCloudJobIndex
+
+
+def test_get_lockfile_path(tmp_path) -> None:
+    assert str(get_lockfile_path("jobs/dbt_cloud_jobs.yml")) == "jobs/dbt_cloud_jobs.yml.lock"
+    assert str(get_lockfile_path("jobs/**/*.yml")) == "jobs/dbt_cloud_jobs.lock"
+    assert get_lockfile_path(tmp_path) == tmp_path / "dbt_cloud_jobs.lock"
+
+
+def test_hash_job_definition_is_normalized(file_job_minimal_definition) -> None:
+    definition = copy.deepcopy(file_job_minimal_definition["jobs"][0])
+
+    reordered_definition = copy.deepcopy(definition)
+    reordered_definition["schedule"]["date"]["days"] = list(
+        reversed(definition["schedule"]["date"]["days"])
+    )
+    reordered_definition["id"] = 123
+    # Explicitly setting a default value does not change the normalized definition
+    reordered_definition["generate_docs"] = False
+
+    assert hash_job_definition(definition) == hash_job_definition(reordered_definition)
+
+    changed_definition = copy.deepcopy(definition)
+    changed_definition["settings"]["threads"] = 4
+    assert hash_job_definition(definition) != hash_job_definition(changed_definition)
+
+
+def test_lockfile_round_trip(file_job_minimal_definition, tmp_path) -> None:
+    definition_1 = {**copy.deepcopy(file_job_minimal_definition["jobs"][0]), "name": "Job 1"}
+    definition_2 = {**copy.deepcopy(file_job_minimal_definition["jobs"][0]), "name": "Job 2"}
+    definitions = [definition_1, definition_2]
+    hashes = {x["name"]: hash_job_definition(x) for x in definitions}
+
+    path = tmp_path / "dbt_cloud_jobs.yml.lock"
+    lockfile = Lockfile.load(path)
+    assert lockfile.jobs == {}
+    assert lockfile.get_changed_definitions(definitions, hashes=hashes) == definitions
+
+    job_index = DbtCloudJobIndex(
+        account_id=123,
+        project_id=123,
+        jobs=[
+            {"id": 1, "name": "Job 1", "updated_at": "2024-01-01T00:00:00+00:00"},
+            {"id": 2, "name": "Job 2", "updated_at": None},
+        ],  # type: ignore[list-item]
+    )
+    lockfile.update(definitions, hashes=hashes, job_indexes={(123, 123): job_index})
+    lockfile.write()
+
+    lockfile = Lockfile.load(path)
+    assert lockfile.jobs["Job 1"]["id"] == 1
+    assert lockfile.jobs["Job 1"]["updated_at"] == "2024-01-01T00:00:00+00:00"
+    assert lockfile.get_changed_definitions(definitions, hashes=hashes) == []
+
+    definition_2["settings"] = {**definition_2["settings"], "threads": 8}
+    hashes["Job 2"] = hash_job_definition(definition_2)
+    assert lockfile.get_changed_definitions(definitions, hashes=hashes) == [definition_2]
+
+
+def test_lockfile_get_job_indexes(tmp_path) -> None:
+    lockfile = Lockfile(
+        path=tmp_path / "dbt_cloud_jobs.yml.lock",
+        jobs={
+            "Job 1": {"account_id": 1, "hash": "a", "id": 10, "project_id": 2},
+            "Job 2": {"account_id": 1, "hash": "b", "id": 11, "project_id": 3},
+        },
+    )
+
+    job_indexes = lockfile.get_job_indexes(projects=[(1, 2)])
+
+    assert list(job_indexes) == [(1, 2)]
+    assert [x["id"] for x in job_indexes[(1, 2)].jobs()] == [10]
+
+
+def test_lockfile_load_invalid(tmp_path) -> None:
+    path = tmp_path / "dbt_cloud_jobs.yml.lock"
+    path.write_text("not json")
+
+    assert Lockfile.load(path).jobs == {}
@@ -1,3 +1,4 @@
+import json
 import logging
 from argparse import Namespace
 from pathlib import Path
@@ -5,8 +6,9 @@ from tempfile import NamedTemporaryFile
 
 import yaml
 
-from dbt_cloud_jobs.logger import logger
+from dbt_cloud_jobs.logger import CustomFormatter, JsonQueueHandler, handler, logger
 from dbt_cloud_jobs.main import main
+from dbt_cloud_jobs.sync_job import get_updated_job_definition
 from dbt_cloud_jobs.validator import DbtCloudJobDefinitionsFile
 from tests.pytest_helpers import catch_logs, hydrate_job_definition, records_to_tuples
 
@@ -50,3 +52,44 @@ def test_logger_info(caplog, file_job_minimal_definition: DbtCloudJobDefinitions
     main(Namespace(file=file.name, validate=True))
 
     assert "Running dbt_cloud_jobs (0.0.0)..." in caplog.text
+
+
+def test_custom_formatter() -> None:
+    formatter = CustomFormatter()
+    record = logging.LogRecord("test", logging.WARNING, __file__, 1, "Hello %s", ("world",), None)
+
+    assert formatter.format(record).startswith(CustomFormatter.yellow)
+    assert formatter.format(record).endswith(f"WARNING: Hello world{CustomFormatter.reset}")
+    assert formatter.formatters.keys() == CustomFormatter.FORMATS.keys()
+
+
+def test_debug_payloads_not_formatted_at_info_level(file_job_minimal_definition) -> None:
+    class Definition(dict):
+        repr_count = 0
+
+        def __repr__(self) -> str:
+            Definition.repr_count += 1
+            return super().__repr__()
+
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    existing_definition = Definition({**definition, "id": 1})
+
+    get_updated_job_definition(Definition(definition), existing_definition)
+
+    assert Definition.repr_count == 0
+
+
+def test_main_json_logging(capfd, file_job_minimal_definition, tmp_path) -> None:
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(
+        yaml.safe_dump({"jobs": [hydrate_job_definition(file_job_minimal_definition["jobs"][0])]})
+    )
+
+    main(Namespace(file=str(file), log_format="json", validate=True))
+
+    entries = [json.loads(x) for x in capfd.readouterr().err.splitlines() if x.startswith("{")]
+    assert {"level": "INFO", "message": f"Using definitions files: {file}"} in [
+        {k: v for k, v in x.items() if k in ("level", "message")} for x in entries
+    ]
+    assert handler in logger.handlers
+    assert not any(isinstance(x, JsonQueueHandler) for x in logger.handlers)
@@ -1,4 +1,8 @@
+import json
+import logging
 import os
+import subprocess
+import sys
 from argparse import Namespace
 from pathlib import Path
 from tempfile import NamedTemporaryFile
@@ -7,13 +11,15 @@ import pytest
 import yaml
 from pytest import MonkeyPatch
 
+from dbt_cloud_jobs import dbt_api_helpers
 from dbt_cloud_jobs.dbt_api_helpers import get_dbt_cloud_api_base_url
 from dbt_cloud_jobs.exceptions import (
     DbtCloudJobsDuplicateJobNameError,
     DbtCloudJobsInvalidArguments,
 )
 from dbt_cloud_jobs.logger import logger
-from dbt_cloud_jobs.main import main
+from dbt_cloud_jobs.main import get_jobs_to_delete, main
+from dbt_cloud_jobs.sync_job import DbtCloudJobIndex
 from tests.pytest_helpers import hydrate_job_definition
 
 
@@ -31,7 +37,10 @@ def test_main_args_import_and_sync_both_true(file_job_minimal_definition):
     with pytest.raises(DbtCloudJobsInvalidArguments) as e:
         main(Namespace(account_id=123, file=file.name, import_=True, project_id=456, sync=True))
 
-    assert str(e.value) == "Only one of `--import`, `--validate` and `--sync` can be specified."
+    assert (
+        str(e.value)
+        == "Only one of `--import`, `--merge-shard-reports`, `--validate`, `--plan` and `--sync` can be specified."
+    )
 
 
 def test_main_args_import_to_existing_file():
@@ -57,30 +66,40 @@ def test_main_args_import_without_account_id(file_job_minimal_definition):
     with pytest.raises(DbtCloudJobsInvalidArguments) as e:
         main(Namespace(account_id=None, file=file.name, import_=True, project_id=456))
 
-    assert (
-        str(e.value)
-        == "`--account-id` and `--project-id` must be passed when `--import` is passed."
-    )
-
+    assert str(e.value) == "`--account-id` must be passed when `--import` is passed."
 
-def test_main_args_import_without_project_id(file_job_minimal_definition):
-    definitions = file_job_minimal_definition
 
-    definition = hydrate_job_definition(definitions["jobs"][0])
-    file = NamedTemporaryFile()
-    file.write(bytes(yaml.safe_dump({"jobs": [definition]}), encoding="utf-8"))
-    file.seek(0)
-    with Path.open(Path(file.name), "r") as f:
-        definitions = yaml.safe_load(f)
-
-    logger.info("Calling main() with project_id=None and import=True...")
-    with pytest.raises(DbtCloudJobsInvalidArguments) as e:
-        main(Namespace(account_id=123, file=file.name, import_=True, project_id=None))
-
-    assert (
-        str(e.value)
-        == "`--account-id` and `--project-id` must be passed when `--import` is passed."
-    )
+def test_main_args_import_without_project_id(tmp_path):
+    with MonkeyPatch.context() as mp:
+        mp.setattr(
+            dbt_api_helpers, "list_dbt_cloud_projects", lambda account_id: [{"id": 2}, {"id": 1}]
+        )
+        mp.setattr(
+            dbt_api_helpers,
+            "iter_dbt_cloud_job_pages",
+            lambda account_id, project_id: iter([[{"id": project_id, "project_id": project_id}]]),
+        )
+
+        logger.info("Calling main() with project_id=None and import=True...")
+        main(Namespace(account_id=123, file=str(tmp_path / "jobs.yml"), import_=True))
+
+        # All projects are imported, in the order of their ids
+        with Path.open(tmp_path / "jobs.yml", "r") as f:
+            assert [x["project_id"] for x in yaml.safe_load(f)["jobs"]] == [1, 2]
+
+        main(
+            Namespace(
+                account_id=123,
+                file=str(tmp_path / "jobs.yml"),
+                file_per_project=True,
+                import_=True,
+                project_id=[1, 2],
+            )
+        )
+
+        for project_id in (1, 2):
+            with Path.open(tmp_path / f"jobs_{project_id}.yml", "r") as f:
+                assert [x["project_id"] for x in yaml.safe_load(f)["jobs"]] == [project_id]
 
 
 def test_main_args_none(file_job_minimal_definition):
@@ -97,7 +116,10 @@ def test_main_args_none(file_job_minimal_definition):
     with pytest.raises(DbtCloudJobsInvalidArguments) as e:
         main(Namespace())
 
-    assert str(e.value) == "One of `--import`, `--validate` and `--sync` must be specified."
+    assert (
+        str(e.value)
+        == "One of `--import`, `--merge-shard-reports`, `--validate`, `--plan` and `--sync` must be specified."
+    )
 
 
 def test_main_args_sync_and_validate_both_true(file_job_minimal_definition):
@@ -114,7 +136,10 @@ def test_main_args_sync_and_validate_both_true(file_job_minimal_definition):
     with pytest.raises(DbtCloudJobsInvalidArguments) as e:
         main(Namespace(file=file.name, sync=True, validate=True))
 
-    assert str(e.value) == "Only one of `--import`, `--validate` and `--sync` can be specified."
+    assert (
+        str(e.value)
+        == "Only one of `--import`, `--merge-shard-reports`, `--validate`, `--plan` and `--sync` can be specified."
+    )
 
 
 @pytest.mark.parametrize("dbt_cloud_region", (None, "", 2, "EU", "us"))
@@ -151,3 +176,91 @@ def test_main_duplicate_job_names():
 def test_main_file_not_exists():
     with pytest.raises(FileNotFoundError):
         main(Namespace(file="file_that_does_not_exist.yml", sync=True))
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import dbt_cloud_jobs.main",
+        "from dbt_cloud_jobs.main import cli\n"
+        "sys.argv = ['dbt_cloud_jobs', '--help']\n"
+        "try:\n"
+        "    cli()\n"
+        "except SystemExit:\n"
+        "    pass",
+    ],
+    ids=["import", "help"],
+)
+def test_main_startup_is_lazy(code) -> None:
+    # A fresh interpreter, so modules imported by other tests are not in `sys.modules`
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{code}\nimport json\nprint(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+        text=True,
+    )
+    imported = set(json.loads(result.stdout.splitlines()[-1]))
+
+    assert "dbt_cloud_jobs.main" in imported
+    assert (
+        not {
+            "dbt_cloud_jobs.dbt_api_helpers",
+            "pydantic",
+            "requests",
+            "yaml",
+        }
+        & imported
+    )
+
+
+def test_get_jobs_to_delete_matches_account_project_and_name(caplog) -> None:
+    job_indexes = {
+        (1, project_id): DbtCloudJobIndex(
+            account_id=1,
+            project_id=project_id,
+            jobs=[
+                {"account_id": 1, "id": project_id * 10 + i, "name": f"Job {i}", "project_id": project_id}  # type: ignore[misc]
+                for i in range(3)
+            ],
+        )
+        for project_id in (1, 2)
+    }
+    job_definitions = {
+        "jobs": [
+            {"account_id": 1, "name": "Job 0", "project_id": 1},
+            {"account_id": 1, "name": "Job 1", "project_id": 2},
+        ]
+    }
+
+    jobs_to_delete = get_jobs_to_delete(
+        args=Namespace(allow_deletes=True, file="dbt_cloud_jobs.yml", shard=None),
+        caller="cli",
+        job_definitions=job_definitions,
+        job_indexes=job_indexes,
+    )
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        jobs_to_keep = get_jobs_to_delete(
+            args=Namespace(allow_deletes=False, file="dbt_cloud_jobs.yml", shard=None),
+            caller="cli",
+            job_definitions=job_definitions,
+            job_indexes=job_indexes,
+        )
+
+    assert jobs_to_keep == []
+    assert sorted(job["id"] for job, _ in jobs_to_delete) == [11, 12, 20, 22]
+    assert all(job_index.project_id == job["project_id"] for job, job_index in jobs_to_delete)
+    # A single report lists every job instead of one warning per job
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage() == (
+        "4 job(s) exist in dbt Cloud but not in `dbt_cloud_jobs.yml`, pass `--allow-deletes` to delete them from dbt Cloud:\n"
+        "  - `Job 1` (id: 11, project id: 1)\n"
+        "  - `Job 2` (id: 12, project id: 1)\n"
+        "  - `Job 0` (id: 20, project id: 2)\n"
+        "  - `Job 2` (id: 22, project id: 2)"
+    )
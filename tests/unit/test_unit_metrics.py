@@ -0,0 +1,71 @@
+import json
+from argparse import Namespace
+
+import yaml
+
+from dbt_cloud_jobs.main import main
+from dbt_cloud_jobs.metrics import ApiMetrics, get_percentile, normalize_endpoint
+from tests.pytest_helpers import hydrate_job_definition
+
+
+def test_normalize_endpoint() -> None:
+    assert normalize_endpoint("accounts/123/jobs/") == "accounts/{id}/jobs/"
+    assert normalize_endpoint("accounts/123/jobs/456") == "accounts/{id}/jobs/{id}"
+    assert normalize_endpoint("accounts/123/projects/") == "accounts/{id}/projects/"
+
+
+def test_get_percentile() -> None:
+    values = [float(x) for x in range(1, 101)]
+
+    assert get_percentile(values, 50) == 50
+    assert get_percentile(values, 95) == 95
+    assert get_percentile([3.0], 95) == 3
+    assert get_percentile([], 50) == 0
+
+
+def test_api_metrics_summarize() -> None:
+    metrics = ApiMetrics()
+    for i in range(1, 11):
+        metrics.record_request(
+            method="get",
+            endpoint="accounts/1/jobs/",
+            status_code=200,
+            seconds=i / 1000,
+            bytes_received=100,
+        )
+    metrics.record_request(method="post", endpoint="accounts/1/jobs/2", status_code=429, seconds=0)
+    metrics.record_request(
+        method="post", endpoint="accounts/1/jobs/3", status_code=None, seconds=0
+    )
+    metrics.record_retry(method="post", endpoint="accounts/1/jobs/2")
+
+    stats = metrics.summarize()
+
+    assert [(x.method, x.endpoint, x.requests, x.retries) for x in stats.endpoints] == [
+        ("GET", "accounts/{id}/jobs/", 10, 0),
+        ("POST", "accounts/{id}/jobs/{id}", 2, 1),
+    ]
+    assert stats.endpoints[0].bytes_received == 1000
+    assert (stats.endpoints[0].latency_ms.p50, stats.endpoints[0].latency_ms.max) == (5, 10)
+    assert stats.endpoints[1].status_codes == {"429": 1, "error": 1}
+    assert (stats.total.requests, stats.total.retries) == (12, 1)
+
+
+def test_main_stats_file(fake_dbt_cloud_api, file_job_minimal_definition, tmp_path) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": [definition]}))
+    fake_dbt_cloud_api.inject_failures(status_code=429, route="list_jobs", retry_after=0)
+
+    main(Namespace(file=str(file), stats=True, stats_file=str(tmp_path / "stats.json"), sync=True))
+
+    stats = json.loads((tmp_path / "stats.json").read_text())
+    assert [
+        (x["method"], x["endpoint"], x["requests"], x["retries"], x["status_codes"])
+        for x in stats["endpoints"]
+    ] == [
+        ("GET", "accounts/{id}/jobs/", 2, 1, {"200": 1, "429": 1}),
+        ("POST", "accounts/{id}/jobs/", 1, 0, {"201": 1}),
+    ]
+    assert stats["total"]["requests"] == 3
+    assert stats["total"]["bytes_sent"] > 0
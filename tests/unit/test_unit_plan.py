@@ -0,0 +1,105 @@
+import copy
+import json
+from argparse import Namespace
+from pathlib import Path
+
+import yaml
+from pytest import MonkeyPatch
+
+from dbt_cloud_jobs import sync_job
+from dbt_cloud_jobs.main import main
+from dbt_cloud_jobs.plan import plan_job_actions
+from dbt_cloud_jobs.sync_job import DbtCloudJobIndex
+from tests.pytest_helpers import hydrate_job_definition
+
+
+def test_plan_job_actions(file_job_minimal_definition) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    unchanged = {**copy.deepcopy(definition), "name": "Unchanged job"}
+    updated = {**copy.deepcopy(definition), "name": "Updated job"}
+    created = {**copy.deepcopy(definition), "name": "Created job"}
+    deleted = {**copy.deepcopy(definition), "id": 3, "name": "Deleted job"}
+
+    job_index = DbtCloudJobIndex(
+        account_id=definition["account_id"],
+        project_id=definition["project_id"],
+        jobs=[
+            {**copy.deepcopy(unchanged), "id": 1},
+            {**copy.deepcopy(updated), "id": 2, "settings": {"threads": 1, "target_name": "x"}},
+            deleted,
+        ],
+    )
+    definitions = [unchanged, updated, created]
+    snapshot = copy.deepcopy(definitions)
+
+    plan = plan_job_actions(
+        definitions=definitions,
+        definitions_to_sync=definitions,
+        job_indexes={(definition["account_id"], definition["project_id"]): job_index},
+        listed_projects=[(definition["account_id"], definition["project_id"])],
+        jobs_to_delete=[(deleted, job_index)],
+    )
+
+    assert [(x.name, x.action, x.id) for x in plan.actions] == [
+        ("Unchanged job", "unchanged", 1),
+        ("Updated job", "update", 2),
+        ("Created job", "create", None),
+        ("Deleted job", "delete", 3),
+    ]
+    assert "-  target_name: x" in plan.actions[1].diff  # type: ignore[operator]
+    # One request to list the project, then one per create, update and delete
+    assert plan.api_calls == 4
+    # Planning does not modify the definitions or the index
+    assert definitions == snapshot
+    assert len(job_index) == 3
+
+
+def test_plan_job_actions_skips_locked_jobs(file_job_minimal_definition) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+
+    plan = plan_job_actions(
+        definitions=[definition],
+        definitions_to_sync=[],
+        job_indexes={},
+        listed_projects=[],
+        jobs_to_delete=[],
+    )
+
+    assert [x.action for x in plan.actions] == ["unchanged"]
+    assert plan.api_calls == 0
+
+
+def test_plan_job_actions_listing_pages(file_job_minimal_definition) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    job_index = DbtCloudJobIndex(
+        account_id=definition["account_id"],
+        project_id=definition["project_id"],
+        jobs=[{"id": i, "name": f"Job {i}"} for i in range(250)],  # type: ignore[misc]
+    )
+
+    plan = plan_job_actions(
+        definitions=[],
+        definitions_to_sync=[],
+        job_indexes={(definition["account_id"], definition["project_id"]): job_index},
+        listed_projects=[(definition["account_id"], definition["project_id"])],
+        jobs_to_delete=[],
+    )
+
+    assert plan.api_calls == 3
+
+
+def test_main_plan(file_job_minimal_definition, tmp_path) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": [definition]}))
+    plan_file = tmp_path / "plan.json"
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(sync_job, "list_dbt_cloud_jobs", lambda account_id, project_id: [])
+        main(Namespace(file=str(file), plan=True, plan_file=str(plan_file)))
+
+    plan = json.loads(Path(plan_file).read_text())
+    assert [(x["name"], x["action"]) for x in plan["actions"]] == [(definition["name"], "create")]
+    assert plan["api_calls"] == 2
+    # A plan never writes the lockfile
+    assert not (tmp_path / "dbt_cloud_jobs.yml.lock").exists()
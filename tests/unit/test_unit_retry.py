@@ -0,0 +1,64 @@
+import time
+from email.utils import formatdate
+
+import pytest
+from pytest import MonkeyPatch
+
+from dbt_cloud_jobs import retry
+from dbt_cloud_jobs.retry import TokenBucket, get_backoff_seconds, parse_retry_after
+
+
+@pytest.mark.parametrize("attempt", range(8))
+def test_get_backoff_seconds_is_bounded(attempt) -> None:
+    for _ in range(100):
+        backoff_seconds = get_backoff_seconds(attempt=attempt, base_seconds=1, max_seconds=10)
+        assert 0 <= backoff_seconds <= min(10, 2**attempt)
+
+
+def test_get_backoff_seconds_honours_retry_after() -> None:
+    assert get_backoff_seconds(attempt=0, base_seconds=1, max_seconds=10, retry_after=120) == 120
+
+
+@pytest.mark.parametrize(
+    "value, seconds",
+    (
+        ["5", 5.0],
+        ["0.5", 0.5],
+        ["-1", 0.0],
+        ["", None],
+        [None, None],
+        ["not a date", None],
+    ),
+)
+def test_parse_retry_after(value, seconds) -> None:
+    assert parse_retry_after(value) == seconds
+
+
+def test_parse_retry_after_http_date() -> None:
+    assert 25 <= parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30  # type: ignore[operator]
+
+
+def test_token_bucket_limits_rate() -> None:
+    now = [0.0]
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(retry.time, "monotonic", lambda: now[0])
+        mp.setattr(retry.time, "sleep", fake_sleep)
+
+        bucket = TokenBucket(rate=2, capacity=2)
+        # A burst of up to `capacity` requests does not wait
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        # Later requests are spaced out at `rate` per second
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(1.0)
+
+        # Tokens are refilled over time
+        now[0] = 10.0
+        assert bucket.acquire() == 0
+
+    assert sleeps == [pytest.approx(0.5), pytest.approx(1.0)]
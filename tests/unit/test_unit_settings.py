@@ -0,0 +1,42 @@
+import pytest
+from pydantic import ValidationError
+from pytest import MonkeyPatch
+
+from dbt_cloud_jobs.settings import (
+    configure_api_settings,
+    get_api_settings,
+    reset_api_settings,
+)
+
+
+def test_api_settings_from_env_vars() -> None:
+    with MonkeyPatch.context() as mp:
+        mp.setenv("DBT_CLOUD_JOBS_MAX_RETRIES", "2")
+        mp.setenv("DBT_CLOUD_JOBS_REQUESTS_PER_SECOND", "7.5")
+        reset_api_settings()
+        try:
+            assert get_api_settings().max_retries == 2
+            assert get_api_settings().requests_per_second == 7.5
+        finally:
+            reset_api_settings()
+
+
+def test_configure_api_settings_ignores_none() -> None:
+    with MonkeyPatch.context() as mp:
+        mp.setenv("DBT_CLOUD_JOBS_MAX_RETRIES", "2")
+        reset_api_settings()
+        try:
+            settings = configure_api_settings(max_retries=None, requests_per_second=3)
+            assert settings.max_retries == 2
+            assert settings.requests_per_second == 3
+            assert get_api_settings() == settings
+        finally:
+            reset_api_settings()
+
+
+def test_configure_api_settings_invalid() -> None:
+    try:
+        with pytest.raises(ValidationError):
+            configure_api_settings(max_retries=-1)
+    finally:
+        reset_api_settings()
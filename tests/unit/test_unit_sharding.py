@@ -0,0 +1,113 @@
+import json
+from argparse import Namespace
+from collections import Counter
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dbt_cloud_jobs.exceptions import DbtCloudJobsInvalidArguments
+from dbt_cloud_jobs.main import main
+from dbt_cloud_jobs.sharding import (
+    Shard,
+    ShardReport,
+    get_job_shard_index,
+    merge_shard_reports,
+    parse_shard,
+)
+from tests.pytest_helpers import hydrate_job_definition
+
+
+def test_parse_shard() -> None:
+    assert parse_shard("2/4") == Shard(index=2, total=4)
+    assert parse_shard("1/1").deletes_jobs
+
+    for value in ("0/4", "5/4", "2", "a/b", "2/4/6"):
+        with pytest.raises(DbtCloudJobsInvalidArguments):
+            parse_shard(value)
+
+
+def test_get_job_shard_index() -> None:
+    names = [f"Job {i:05d}" for i in range(1_000)]
+    shard_indexes = Counter(get_job_shard_index(x, total=4) for x in names)
+
+    # Shards depend only on the name, so they are the same in every process and Python version
+    assert [get_job_shard_index(f"Job {i:05d}", total=4) for i in range(5)] == [1, 4, 1, 4, 4]
+    assert all(200 <= shard_indexes[i] <= 300 for i in range(1, 5))
+
+    jobs = [{"name": x} for x in names]
+    assert [len(Shard(index=i, total=4).select(jobs)) for i in range(1, 5)] == [  # type: ignore[arg-type]
+        shard_indexes[i] for i in range(1, 5)
+    ]
+
+
+def test_merge_shard_reports_requires_every_shard(tmp_path) -> None:
+    reports = [
+        ShardReport(index=1, jobs={"Job A": {"id": 1}}, synced=1, total=3),
+        ShardReport(index=3, jobs={"Job B": {"id": 2}}, synced=0, total=3),
+    ]
+
+    with pytest.raises(DbtCloudJobsInvalidArguments) as e:
+        merge_shard_reports(reports, lockfile_path=tmp_path / "dbt_cloud_jobs.yml.lock")
+
+    assert "found reports of shard(s): 1, 3." in str(e.value)
+
+    with pytest.raises(DbtCloudJobsInvalidArguments):
+        merge_shard_reports(
+            [*reports, ShardReport(index=2, jobs={}, synced=0, total=2)],
+            lockfile_path=tmp_path / "dbt_cloud_jobs.yml.lock",
+        )
+
+
+def test_main_sync_shards(fake_dbt_cloud_api, file_job_minimal_definition, tmp_path) -> None:
+    definitions = [
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0]) for _ in range(12)
+    ]
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    removed_job = fake_dbt_cloud_api.add_job(
+        hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    )
+
+    for index in range(1, 4):
+        main(Namespace(allow_deletes=True, file=str(file), shard=f"{index}/3", sync=True))
+
+    assert sorted(x["name"] for x in fake_dbt_cloud_api.jobs.values()) == sorted(
+        x["name"] for x in definitions
+    )
+    assert fake_dbt_cloud_api.requests["create_job"] == 12
+    assert fake_dbt_cloud_api.requests["delete_job"] == 1
+    assert removed_job["id"] not in fake_dbt_cloud_api.jobs
+    assert not Path(f"{file}.lock").exists()
+
+    reports = [
+        json.loads(Path(f"{file}.lock.shard-{index}-of-3.json").read_text())
+        for index in range(1, 4)
+    ]
+    assert sum(x["synced"] for x in reports) == 12
+    assert sorted(name for x in reports for name in x["jobs"]) == sorted(
+        x["name"] for x in definitions
+    )
+
+    main(
+        Namespace(
+            file=str(file),
+            merge_shard_reports=[f"{file}.lock.shard-{index}-of-3.json" for index in range(1, 4)],
+        )
+    )
+    fake_dbt_cloud_api.requests.clear()
+
+    # The merged lockfile is used by the next sync, every job is unchanged
+    main(Namespace(file=str(file), sync=True))
+
+    assert sorted(json.loads(Path(f"{file}.lock").read_text())["jobs"]) == sorted(
+        x["name"] for x in definitions
+    )
+    assert fake_dbt_cloud_api.request_count == 0
+
+
+def test_main_shard_requires_plan_or_sync() -> None:
+    with pytest.raises(DbtCloudJobsInvalidArguments) as e:
+        main(Namespace(file="dbt_cloud_jobs.yml", shard="1/2", validate=True))
+
+    assert str(e.value) == "`--shard` can only be passed with `--plan` or `--sync`."
@@ -0,0 +1,134 @@
+import threading
+
+import pytest
+from pytest import MonkeyPatch
+
+from dbt_cloud_jobs import sync_job
+from dbt_cloud_jobs.exceptions import DbtCloudJobsSyncError
+from dbt_cloud_jobs.sync_job import DbtCloudJobIndex, run_job_actions
+
+
+def test_dbt_cloud_job_index_add_and_get() -> None:
+    job_index = DbtCloudJobIndex(
+        account_id=1,
+        project_id=2,
+        jobs=[{"id": 10, "name": "Job A"}, {"id": 11, "name": "Job B"}],  # type: ignore[list-item]
+    )
+
+    assert len(job_index) == 2
+    assert "Job A" in job_index
+    assert job_index.get("Job B")["id"] == 11  # type: ignore[index]
+    assert job_index.get("Job C") is None
+
+    job_index.add({"id": 12, "name": "Job C"})  # type: ignore[arg-type]
+    assert len(job_index) == 3
+    assert job_index.get("Job C")["id"] == 12  # type: ignore[index]
+
+
+def test_dbt_cloud_job_index_add_renamed_job() -> None:
+    job_index = DbtCloudJobIndex(
+        account_id=1, project_id=2, jobs=[{"id": 10, "name": "Job A"}]  # type: ignore[list-item]
+    )
+
+    job_index.add({"id": 10, "name": "Job A (renamed)"})  # type: ignore[arg-type]
+
+    assert len(job_index) == 1
+    assert "Job A" not in job_index
+    assert "Job A (renamed)" in job_index
+
+
+def test_dbt_cloud_job_index_add_duplicate_name(caplog) -> None:
+    job_index = DbtCloudJobIndex(
+        account_id=1,
+        project_id=2,
+        jobs=[{"id": 10, "name": "Job A"}, {"id": 11, "name": "Job A"}],  # type: ignore[list-item]
+    )
+
+    assert len(job_index) == 2
+    assert job_index.get("Job A")["id"] == 10  # type: ignore[index]
+    assert "Jobs 10 and 11 of project 2 are both named `Job A`" in caplog.text
+
+    job_index.add({"id": 10, "name": "Job A", "state": 1})  # type: ignore[arg-type]
+    assert job_index.get("Job A")["state"] == 1  # type: ignore[index]
+
+    job_index.remove({"id": 11, "name": "Job A"})  # type: ignore[arg-type]
+    assert job_index.get("Job A")["id"] == 10  # type: ignore[index]
+
+
+def test_dbt_cloud_job_index_remove() -> None:
+    job_index = DbtCloudJobIndex(
+        account_id=1,
+        project_id=2,
+        jobs=[{"id": 10, "name": "Job A"}, {"id": 11, "name": "Job B"}],  # type: ignore[list-item]
+    )
+
+    job_index.remove({"id": 10, "name": "Job A"})  # type: ignore[arg-type]
+
+    assert "Job A" not in job_index
+    assert [x["id"] for x in job_index.jobs()] == [11]
+
+
+def test_run_job_actions_runs_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=5)
+    completed = []
+
+    def action(name):
+        # Only passes if all 3 actions are running at the same time
+        barrier.wait()
+        completed.append(name)
+
+    run_job_actions(
+        actions=[(name, lambda name=name: action(name)) for name in ("a", "b", "c")],
+        max_workers=3,
+        operation="sync",
+    )
+
+    assert sorted(completed) == ["a", "b", "c"]
+
+
+def test_run_job_actions_collects_all_failures() -> None:
+    completed = []
+
+    def failing_action(name):
+        raise RuntimeError(f"{name} failed")
+
+    with pytest.raises(DbtCloudJobsSyncError) as e:
+        run_job_actions(
+            actions=[
+                ("Job B", lambda: failing_action("Job B")),
+                ("Job A", lambda: failing_action("Job A")),
+                ("Job C", lambda: completed.append("Job C")),
+            ],
+            max_workers=2,
+            operation="sync",
+        )
+
+    assert completed == ["Job C"]
+    assert str(e.value) == (
+        "Failed to sync 2 of 3 job(s):\n  - `Job A`: Job A failed\n  - `Job B`: Job B failed"
+    )
+
+
+def test_run_job_actions_bounds_pending_actions() -> None:
+    pending = []
+    max_pending = 0
+
+    class CountingThreadPoolExecutor(sync_job.ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            nonlocal max_pending
+            future = super().submit(fn, *args, **kwargs)
+            pending.append(future)
+            max_pending = max(max_pending, len([x for x in pending if not x.done()]))
+            return future
+
+    completed = []
+    with MonkeyPatch.context() as mp:
+        mp.setattr(sync_job, "ThreadPoolExecutor", CountingThreadPoolExecutor)
+        run_job_actions(
+            actions=[(str(i), lambda i=i: completed.append(i)) for i in range(100)],
+            max_workers=2,
+            operation="delete",
+        )
+
+    assert sorted(completed) == list(range(100))
+    assert max_pending <= 4
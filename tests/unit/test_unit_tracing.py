@@ -0,0 +1,78 @@
+import json
+import pstats
+import time
+from argparse import Namespace
+
+import yaml
+
+from dbt_cloud_jobs.main import main
+from dbt_cloud_jobs.tracing import Tracer, record_span
+from tests.pytest_helpers import hydrate_job_definition
+
+
+def test_record_span() -> None:
+    spans: list = []
+    with record_span("sleep", spans=spans):
+        time.sleep(0.05)
+    with record_span("busy", spans=spans):
+        sum(x * x for x in range(500_000))
+
+    assert [x.name for x in spans] == ["sleep", "busy"]
+    assert spans[0].wall_seconds >= 0.05
+    assert spans[0].cpu_seconds < spans[0].wall_seconds
+    assert spans[1].cpu_seconds > 0
+
+
+def test_record_span_exception() -> None:
+    spans: list = []
+    try:
+        with record_span("failing", spans=spans):
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert [x.name for x in spans] == ["failing"]
+
+
+def test_tracer_to_chrome_trace() -> None:
+    tracer = Tracer()
+    with tracer.span("outer"):
+        with tracer.span("inner"):
+            pass
+
+    trace = tracer.to_chrome_trace()
+
+    assert [x["name"] for x in trace["traceEvents"]] == ["outer", "inner"]
+    assert trace["traceEvents"][0]["ts"] == 0
+    assert trace["traceEvents"][0]["dur"] >= trace["traceEvents"][1]["dur"]
+    assert all(x["ph"] == "X" and "cpu_ms" in x["args"] for x in trace["traceEvents"])
+
+
+def test_main_trace_file_and_profile(
+    fake_dbt_cloud_api, file_job_minimal_definition, tmp_path
+) -> None:
+    definition = hydrate_job_definition(file_job_minimal_definition["jobs"][0])
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": [definition]}))
+
+    main(
+        Namespace(
+            file=str(file),
+            profile=str(tmp_path / "dbt_cloud_jobs.pstats"),
+            sync=True,
+            trace_file=str(tmp_path / "trace.json"),
+        )
+    )
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert [x["name"] for x in trace["traceEvents"]] == [
+        "parse_arguments",
+        "load_yaml",
+        "validate",
+        "diff",
+        "list_remote_jobs",
+        "apply",
+        "delete",
+        "write_lockfile",
+    ]
+    assert pstats.Stats(str(tmp_path / "dbt_cloud_jobs.pstats")).total_calls > 0
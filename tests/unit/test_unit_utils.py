@@ -34,3 +34,29 @@ from dbt_cloud_jobs.utils import merge_job_definitions
 )
 def test_merge_dicts(dict_1, dict_2, merged_dict) -> None:
     assert merge_job_definitions(job_def_1=dict_1, job_def_2=dict_2) == merged_dict
+
+
+def test_merge_dicts_does_not_modify_inputs() -> None:
+    dict_1 = {"a": 1, "b": {"c": 3, "d": {"e": 5}}, "f": {"g": 7}}
+    dict_2 = {"b": {"c": 4, "d": {"e": 5}}}
+
+    merged_dict = merge_job_definitions(job_def_1=dict_1, job_def_2=dict_2)
+
+    assert merged_dict == {"a": 1, "b": {"c": 4, "d": {"e": 5}}, "f": {"g": 7}}
+    assert dict_1 == {"a": 1, "b": {"c": 3, "d": {"e": 5}}, "f": {"g": 7}}
+    assert dict_2 == {"b": {"c": 4, "d": {"e": 5}}}
+    # Unchanged sub-trees are shared with the first dict
+    assert merged_dict["b"]["d"] is dict_1["b"]["d"]
+    assert merged_dict["f"] is dict_1["f"]
+
+
+def test_merge_dicts_unchanged() -> None:
+    dict_1 = {"a": 1, "b": {"c": 3}}
+
+    assert merge_job_definitions(job_def_1=dict_1, job_def_2={"a": 1, "b": {"c": 3}}) is dict_1
+
+
+def test_merge_dicts_compares_types() -> None:
+    merged_dict = merge_job_definitions(job_def_1={"a": 1}, job_def_2={"a": True})
+
+    assert merged_dict["a"] is True
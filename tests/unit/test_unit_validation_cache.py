@@ -0,0 +1,126 @@
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+from pytest import MonkeyPatch
+
+from dbt_cloud_jobs import validation_cache, validator
+from dbt_cloud_jobs.validation_cache import ValidationCache
+from dbt_cloud_jobs.validator import load_job_definition_files
+
+
+def count_validations(mp: MonkeyPatch) -> list:
+    validated = []
+    job_definition_class = validator.DbtCloudJobDefinition
+
+    def validate(**kwargs):
+        validated.append(kwargs.get("name"))
+        return job_definition_class(**kwargs)
+
+    mp.setattr(validator, "DbtCloudJobDefinition", validate)
+    return validated
+
+
+@pytest.mark.parametrize("file_name", Path("./tests/fixtures/invalid/").glob(pattern="*"), ids=str)
+def test_validate_only_invalid_ymls(file_name, tmp_path) -> None:
+    with pytest.raises(Exception):
+        load_job_definition_files(
+            files=[file_name], cache=ValidationCache.load(tmp_path), validate_only=True
+        )
+
+    assert ValidationCache.load(tmp_path).files == {}
+
+
+def test_validation_cache_warm(file_job_minimal_definition, tmp_path) -> None:
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump(file_job_minimal_definition))
+    cache_dir = tmp_path / "cache"
+
+    assert (
+        load_job_definition_files(
+            files=[file], cache=ValidationCache.load(cache_dir), validate_only=True
+        )
+        is None
+    )
+    assert (cache_dir / "validation.json").exists()
+
+    with MonkeyPatch.context() as mp:
+        validated = count_validations(mp)
+        mp.setattr(
+            validator,
+            "parse_job_definitions",
+            lambda content, file: pytest.fail("An unchanged file is parsed again"),
+        )
+        load_job_definition_files(
+            files=[file], cache=ValidationCache.load(cache_dir), validate_only=True
+        )
+
+    assert validated == []
+
+
+def test_validation_cache_partially_edited_file(file_job_minimal_definition, tmp_path) -> None:
+    definition = file_job_minimal_definition["jobs"][0]
+    definitions = [{**copy.deepcopy(definition), "name": f"Job {i}"} for i in range(3)]
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    load_job_definition_files(
+        files=[file], cache=ValidationCache.load(tmp_path), validate_only=True
+    )
+
+    definitions[1]["settings"] = {**definitions[1]["settings"], "threads": 8}
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    with MonkeyPatch.context() as mp:
+        validated = count_validations(mp)
+        load_job_definition_files(
+            files=[file], cache=ValidationCache.load(tmp_path), validate_only=True
+        )
+
+    assert validated == ["Job 1"]
+
+
+def test_validation_cache_invalid_job_is_not_cached(file_job_minimal_definition, tmp_path) -> None:
+    definitions = [copy.deepcopy(file_job_minimal_definition["jobs"][0])]
+    definitions[0]["settings"]["threads"] = "many"
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+
+    for _ in range(2):
+        with pytest.raises(validator.DbtCloudJobsValidationError):
+            load_job_definition_files(
+                files=[file], cache=ValidationCache.load(tmp_path), validate_only=True
+            )
+
+
+def test_validation_cache_stale(file_job_minimal_definition, tmp_path) -> None:
+    file = tmp_path / "dbt_cloud_jobs.yml"
+    file.write_text(yaml.safe_dump(file_job_minimal_definition))
+    load_job_definition_files(
+        files=[file], cache=ValidationCache.load(tmp_path), validate_only=True
+    )
+    assert ValidationCache.load(tmp_path).files != {}
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(validation_cache, "version", lambda: "999.0.0")
+        assert ValidationCache.load(tmp_path).files == {}
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(validation_cache, "get_schema_hash", lambda: "another schema")
+        assert ValidationCache.load(tmp_path).job_hashes == {}
+
+    with MonkeyPatch.context() as mp:
+        mp.setattr(validation_cache, "get_validator_hash", lambda: "another validator")
+        assert ValidationCache.load(tmp_path).job_hashes == {}
+
+
+def test_validation_cache_eviction(tmp_path) -> None:
+    cache = ValidationCache(path=tmp_path / "validation.json", files={}, job_hashes={}, max_jobs=2)
+    cache.update(
+        [
+            validator.JobDefinitionFileResult(
+                content_hash="a", file=tmp_path / "a.yml", job_hashes=["1", "2", "3"]
+            )
+        ]
+    )
+
+    assert list(cache.job_hashes) == ["2", "3"]
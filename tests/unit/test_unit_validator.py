@@ -1,9 +1,21 @@
 from pathlib import Path
 
 import pytest
+import yaml
 
+from dbt_cloud_jobs.exceptions import (
+    DbtCloudJobsDuplicateJobNameError,
+    DbtCloudJobsValidationError,
+)
+from dbt_cloud_jobs.lockfile import hash_job_definition
 from dbt_cloud_jobs.logger import logger
-from dbt_cloud_jobs.validator import validate_job_definition_file
+from dbt_cloud_jobs.validator import (
+    load_job_definition_file,
+    load_job_definition_files,
+    resolve_job_definition_files,
+    validate_job_definition_file,
+    validate_job_definitions,
+)
 
 
 @pytest.mark.parametrize("file_name", Path("./tests/fixtures/invalid/").glob(pattern="*"), ids=str)
@@ -20,3 +32,89 @@ def test_validator_valid_ymls(file_name) -> None:
     except:
         logger.warning(f"{file_name=}")
         pytest.fail()
+
+
+def test_validate_job_definitions_to_payload() -> None:
+    definitions = load_job_definition_file(
+        file="./tests/fixtures/valid/job_with_minimal_definition.yml"
+    )
+    definitions["jobs"][0]["settings"]["threads"] = "4"
+
+    definitions_file = validate_job_definitions(definitions=definitions, file="dbt_cloud_jobs.yml")
+    payload = definitions_file.jobs[0].to_payload()
+
+    # Payloads hold the validated values and only the fields present in the YML file
+    assert payload["settings"]["threads"] == 4
+    assert sorted(payload["schedule"]["date"]["days"]) == [0, 1, 2, 3, 4, 5, 6]
+    assert "generate_docs" not in payload
+    assert hash_job_definition(definitions_file.jobs[0]) == hash_job_definition(payload)
+
+
+def write_definitions(file: Path, definitions) -> Path:
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(yaml.safe_dump({"jobs": definitions}))
+    return file
+
+
+def test_resolve_job_definition_files(file_job_minimal_definition, tmp_path) -> None:
+    definition = file_job_minimal_definition["jobs"][0]
+    file_a = write_definitions(tmp_path / "team_a.yml", [definition])
+    file_b = write_definitions(tmp_path / "nested" / "team_b.yml", [definition])
+    (tmp_path / "README.md").write_text("Not a definitions file")
+
+    assert resolve_job_definition_files(str(tmp_path)) == [file_b, file_a]
+    assert resolve_job_definition_files(str(tmp_path / "*.yml")) == [file_a]
+    assert resolve_job_definition_files(str(tmp_path / "**" / "*.yml")) == [file_b, file_a]
+    assert resolve_job_definition_files(str(file_a)) == [file_a]
+    assert resolve_job_definition_files(str(tmp_path / "missing.yml")) == []
+
+
+def test_load_job_definition_files(file_job_minimal_definition, tmp_path) -> None:
+    definition = file_job_minimal_definition["jobs"][0]
+    files = [
+        write_definitions(tmp_path / "team_a.yml", [{**definition, "name": "Job A"}]),
+        write_definitions(tmp_path / "team_b.yml", [{**definition, "name": "Job B"}]),
+    ]
+
+    definitions_file = load_job_definition_files(files=files)
+
+    assert [x.name for x in definitions_file.jobs] == ["Job A", "Job B"]
+
+
+def test_load_job_definition_files_duplicate_names(file_job_minimal_definition, tmp_path) -> None:
+    definition = file_job_minimal_definition["jobs"][0]
+    files = [
+        write_definitions(tmp_path / "team_a.yml", [definition]),
+        write_definitions(tmp_path / "team_b.yml", [definition]),
+    ]
+
+    with pytest.raises(DbtCloudJobsDuplicateJobNameError) as e:
+        load_job_definition_files(files=files)
+
+    assert f"`{definition['name']}`: `{files[0]}`, `{files[1]}`" in str(e.value)
+
+
+def test_load_job_definition_files_reports_every_error(
+    file_job_minimal_definition, tmp_path
+) -> None:
+    definition = file_job_minimal_definition["jobs"][0]
+    files = [
+        write_definitions(
+            tmp_path / "team_a.yml", [{**definition, "execute_steps": ["run"], "name": "Job A"}]
+        ),
+        write_definitions(tmp_path / "team_b.yml", [{**definition, "name": "Job B"}]),
+        write_definitions(
+            tmp_path / "team_c.yml", [{**definition, "name": "Job C", "settings": {"threads": 0}}]
+        ),
+    ]
+    (tmp_path / "team_d.yml").write_text("jobs: [")
+    files.append(tmp_path / "team_d.yml")
+
+    with pytest.raises(DbtCloudJobsValidationError) as e:
+        load_job_definition_files(files=files)
+
+    assert str(e.value).startswith("3 of 4 file(s) are invalid:")
+    assert f"`{files[0]}`, job `Job A` (index 0): `execute_steps`" in str(e.value)
+    assert f"`{files[2]}`, job `Job C` (index 0): `settings.threads`" in str(e.value)
+    assert f"`{files[3]}`: cannot be parsed" in str(e.value)
+    assert "Job B" not in str(e.value)
@@ -0,0 +1,57 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dbt_cloud_jobs.validator import load_job_definition_file
+from dbt_cloud_jobs.writers import write_job_definitions
+
+
+@pytest.fixture
+def job_pages():
+    jobs = []
+    for file_name in sorted(Path("./tests/fixtures/valid/").glob(pattern="*")):
+        with Path.open(file_name, "r") as f:
+            jobs += yaml.safe_load(f)["jobs"]
+
+    return [jobs[:3], [], jobs[3:]]
+
+
+def test_write_job_definitions_yml(job_pages, tmp_path) -> None:
+    file = tmp_path / "dbt_cloud_jobs.yml"
+
+    assert write_job_definitions(pages=iter(job_pages), file=file) == sum(map(len, job_pages))
+    assert file.read_text() == yaml.safe_dump(
+        {"jobs": [job for page in job_pages for job in page]}, sort_keys=True
+    )
+
+
+def test_write_job_definitions_yml_no_jobs(tmp_path) -> None:
+    file = tmp_path / "dbt_cloud_jobs.yml"
+
+    assert write_job_definitions(pages=iter([[]]), file=file) == 0
+    assert file.read_text() == yaml.safe_dump({"jobs": []}, sort_keys=True)
+
+
+def test_write_job_definitions_jsonl(job_pages, tmp_path) -> None:
+    file = tmp_path / "dbt_cloud_jobs.jsonl"
+
+    write_job_definitions(pages=iter(job_pages), file=file)
+
+    jobs = [job for page in job_pages for job in page]
+    assert [json.loads(x) for x in file.read_text().splitlines()] == jobs
+    assert load_job_definition_file(file) == {"jobs": jobs}
+
+
+def test_write_job_definitions_removes_partial_file(job_pages, tmp_path) -> None:
+    file = tmp_path / "dbt_cloud_jobs.yml"
+
+    def failing_pages():
+        yield job_pages[0]
+        raise RuntimeError("Listing failed")
+
+    with pytest.raises(RuntimeError):
+        write_job_definitions(pages=failing_pages(), file=file)
+
+    assert not file.exists()
@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from dbt_cloud_jobs.yaml_helpers import yaml_safe_dump, yaml_safe_load
+
+
+@pytest.mark.parametrize("file_name", Path("./tests/fixtures/valid/").glob(pattern="*"), ids=str)
+def test_yaml_helpers_match_pure_python(file_name) -> None:
+    content = Path(file_name).read_text()
+    definitions = yaml_safe_load(content)
+    assert definitions == yaml.safe_load(content)
+
+    # Long and non-ASCII strings are the most likely to be emitted differently
+    definitions["jobs"][0]["description"] = "Ü " * 100
+    assert yaml_safe_dump(definitions, sort_keys=True) == yaml.safe_dump(
+        definitions, sort_keys=True
+    )
+    assert yaml_safe_dump(definitions, encoding="utf-8", sort_keys=True) == yaml.safe_dump(
+        definitions, encoding="utf-8", sort_keys=True
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["word " * 50, "Ü " * 50, "a\tb " * 40, "line\n" * 40, "😀 " * 50, "a\r\nb " * 30],
+)
+def test_yaml_safe_dump_long_strings(value) -> None:
+    data = {"jobs": [{"description": value, "name": "Job"}]}
+
+    assert yaml_safe_dump(data, sort_keys=True) == yaml.safe_dump(data, sort_keys=True)